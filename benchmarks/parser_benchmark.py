@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Site24x7 Documentation Parser Benchmark
+Measures parse time and peak memory of the scraper's page parser over recorded
+HTML fixtures and a synthetic page with thousands of endpoints
+"""
+
+import argparse
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from string import ascii_lowercase
+from typing import Any, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from services.api_scraper import Site24x7APIScraper
+from services.documentation_page import HTML_PARSER, DocumentationPage
+
+DEFAULT_FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+HTTP_METHODS = ["GET", "POST", "PUT", "DELETE", "PATCH"]
+
+
+def _resource_name(index: int) -> str:
+    """Build a letters-only resource name, since endpoint paths contain no digits"""
+    name = ""
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        name = ascii_lowercase[remainder] + name
+    return name
+
+
+def build_synthetic_page(endpoint_count: int = 10000) -> str:
+    """Build a documentation-like page listing the given number of endpoints"""
+    toc_items = "".join(
+        f'<li><a href="/help/api/{_resource_name(i)}.html">Resource {i}</a></li>'
+        for i in range(0, endpoint_count, 100)
+    )
+    rows = "".join(
+        f"<tr><td><code>{HTTP_METHODS[i % len(HTTP_METHODS)]} /api/{_resource_name(i)}_monitor/</code></td>"
+        f"<td>Manage resource {i} via https://www.site24x7.com/api/{_resource_name(i)}_monitor</td></tr>"
+        for i in range(endpoint_count)
+    )
+    return (
+        "<html><head><title>Site24x7 API</title><script>var x = '/api/ignored';</script></head>"
+        f'<body><ul class="toc">{toc_items}</ul><table>{rows}</table></body></html>'
+    )
+
+
+def measure(name: str, html: str, scraper: Site24x7APIScraper, repeat: int) -> Dict[str, Any]:
+    """Time the parser over one page and record its peak traced memory"""
+    timings = []
+    parsed = {}
+    for _ in range(repeat):
+        # Pages memoize their parse, so every run needs a fresh one
+        page = DocumentationPage.from_text(name, html)
+        start = time.perf_counter()
+        parsed = scraper._parse_html(page)
+        timings.append(time.perf_counter() - start)
+    
+    # Measure memory in a separate pass so tracing does not skew the timings
+    tracemalloc.start()
+    scraper._parse_html(DocumentationPage.from_text(name, html))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    return {
+        "name": name,
+        "size_kb": len(html.encode("utf-8")) / 1024,
+        "endpoints": len(parsed.get("endpoints", [])),
+        "best_ms": min(timings) * 1000,
+        "median_ms": statistics.median(timings) * 1000,
+        "peak_mb": peak / (1024 * 1024)
+    }
+
+
+def load_fixtures(fixtures_dir: Path) -> List[Path]:
+    """List recorded HTML fixtures"""
+    if not fixtures_dir.is_dir():
+        return []
+    return sorted(fixtures_dir.glob("*.html"))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--fixtures", type=Path, default=DEFAULT_FIXTURES_DIR,
+                        help="Directory of recorded Site24x7 HTML pages")
+    parser.add_argument("--synthetic-endpoints", type=int, default=10000,
+                        help="Number of endpoints on the synthetic page (0 to skip)")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="Timed runs per page")
+    args = parser.parse_args()
+    
+    scraper = Site24x7APIScraper()
+    results = []
+    
+    fixtures = load_fixtures(args.fixtures)
+    if not fixtures:
+        print(f"No HTML fixtures found in {args.fixtures}")
+    for fixture in fixtures:
+        html = fixture.read_text(encoding="utf-8", errors="replace")
+        results.append(measure(fixture.name, html, scraper, args.repeat))
+    
+    if args.synthetic_endpoints > 0:
+        html = build_synthetic_page(args.synthetic_endpoints)
+        results.append(measure(f"synthetic-{args.synthetic_endpoints}", html, scraper, args.repeat))
+    
+    print(f"HTML parser backend: {HTML_PARSER}")
+    print(f"{'page':<40} {'size KB':>10} {'endpoints':>10} {'best ms':>10} {'median ms':>10} {'peak MB':>10}")
+    for result in results:
+        print(
+            f"{result['name'][:40]:<40} {result['size_kb']:>10.1f} {result['endpoints']:>10} "
+            f"{result['best_ms']:>10.1f} {result['median_ms']:>10.1f} {result['peak_mb']:>10.1f}"
+        )
+    
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Site24x7 Documentation Scrape Benchmark
+Records a live documentation scrape to a compressed archive and replays full
+scrapes from it offline, reporting pages/s, parse CPU time and peak RSS
+"""
+
+import argparse
+import asyncio
+import resource
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import database
+
+DEFAULT_ARCHIVE = Path(__file__).resolve().parent / "archives" / "site24x7_docs.jsonl.gz"
+
+
+def use_scratch_database(directory: str) -> None:
+    """Point the agent at an empty database so stored pages and HTTP cache entries are not reused.
+
+    Must run before the config and service modules are imported, since settings
+    initialize their defaults in whichever database is active at import time.
+    """
+    database.DATABASE_PATH = str(Path(directory) / "benchmark.db")
+    database.init_db()
+
+
+def peak_rss_mb(who: int) -> float:
+    """Peak resident set size in MB (ru_maxrss is in KB on Linux and bytes on macOS)"""
+    peak = resource.getrusage(who).ru_maxrss
+    if sys.platform == "darwin":
+        return peak / (1024 * 1024)
+    return peak / 1024
+
+
+async def record(archive_path: Path, docs_url: Optional[str]) -> int:
+    from config import PRIMARY_DATA_CENTER
+    from services.api_scraper import Site24x7APIScraper, shutdown_parse_pool
+    from services.scrape_archive import RecordingTransport, ScrapeArchive
+
+    scraper = Site24x7APIScraper()
+    if docs_url:
+        # A custom root is a single site, not one of the Site24x7 data centres
+        scraper.base_url = docs_url
+        scraper.data_centers = {PRIMARY_DATA_CENTER: docs_url}
+    # Every page must come back with a body, not as a 304 against an old cache entry
+    scraper.use_http_cache = False
+
+    archive = ScrapeArchive(archive_path, base_url=scraper.base_url)
+    scraper.transport = RecordingTransport(archive)
+    try:
+        documentation = await scraper.scrape_full_documentation()
+    finally:
+        shutdown_parse_pool()
+
+    archive.data_centers = {
+        region: region_stats['docs_url']
+        for region, region_stats in scraper.last_crawl_stats['data_centers'].items()
+        if 'error' not in region_stats
+    }
+    archive.save()
+    print(f"Recorded {len(archive)} responses ({documentation['total_endpoints']} endpoints) to {archive_path}")
+    return 0
+
+
+async def replay_once(archive, parse_workers: Optional[int], concurrency: Optional[int]) -> Dict[str, Any]:
+    from services.api_scraper import Site24x7APIScraper, shutdown_parse_pool
+    from services.scrape_archive import ReplayTransport
+
+    scraper = Site24x7APIScraper(transport=ReplayTransport(archive))
+    scraper.base_url = archive.base_url
+    scraper.data_centers = dict(archive.data_centers)
+    if parse_workers is not None:
+        scraper.parse_workers = parse_workers
+    if concurrency is not None:
+        scraper.max_concurrency = max(1, concurrency)
+
+    start = time.perf_counter()
+    try:
+        await scraper.scrape_full_documentation()
+    finally:
+        # Pool workers must exit before their usage shows up in RUSAGE_CHILDREN
+        shutdown_parse_pool()
+    elapsed = time.perf_counter() - start
+    stats = scraper.last_crawl_stats
+
+    return {
+        "pages": stats["pages_fetched"],
+        "seconds": elapsed,
+        "pages_per_second": stats["pages_fetched"] / elapsed if elapsed else 0.0,
+        "parse_cpu_seconds": scraper.parse_cpu_seconds,
+        "misses": scraper.transport.misses
+    }
+
+
+async def replay(archive_path: Path, repeat: int, parse_workers: Optional[int], concurrency: Optional[int]) -> int:
+    from services.scrape_archive import ScrapeArchive
+
+    archive = ScrapeArchive.load(archive_path)
+    print(f"Replaying {len(archive)} responses recorded {archive.recorded_at} from {archive.base_url}")
+
+    runs = []
+    for _ in range(repeat):
+        # A fresh database per run, otherwise unchanged pages skip parsing
+        with tempfile.TemporaryDirectory() as scratch:
+            database.DATABASE_PATH = str(Path(scratch) / "benchmark.db")
+            database.init_db()
+            runs.append(await replay_once(archive, parse_workers, concurrency))
+
+    print(f"{'run':>4} {'pages':>7} {'seconds':>9} {'pages/s':>9} {'parse CPU s':>12} {'misses':>7}")
+    for index, run in enumerate(runs, 1):
+        print(
+            f"{index:>4} {run['pages']:>7} {run['seconds']:>9.2f} {run['pages_per_second']:>9.1f} "
+            f"{run['parse_cpu_seconds']:>12.2f} {run['misses']:>7}"
+        )
+    print(f"Median pages/s: {statistics.median(r['pages_per_second'] for r in runs):.1f}")
+    print(f"Median parse CPU: {statistics.median(r['parse_cpu_seconds'] for r in runs):.2f}s")
+    print(f"Peak RSS: {peak_rss_mb(resource.RUSAGE_SELF):.1f} MB (main process), "
+          f"{peak_rss_mb(resource.RUSAGE_CHILDREN):.1f} MB (largest parse worker)")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    record_parser = subparsers.add_parser("record", help="Scrape the live docs and save every response")
+    record_parser.add_argument("--archive", type=Path, default=DEFAULT_ARCHIVE,
+                               help="Archive file to write")
+    record_parser.add_argument("--docs-url", help="Documentation root to scrape (defaults to the configured URL)")
+
+    replay_parser = subparsers.add_parser("replay", help="Benchmark full scrapes served from an archive")
+    replay_parser.add_argument("--archive", type=Path, default=DEFAULT_ARCHIVE,
+                               help="Archive file to replay")
+    replay_parser.add_argument("--repeat", type=int, default=3,
+                               help="Number of full scrapes to run")
+    replay_parser.add_argument("--parse-workers", type=int,
+                               help="Parse worker processes (0 parses inline; defaults to the configured value)")
+    replay_parser.add_argument("--concurrency", type=int,
+                               help="Maximum concurrent requests (defaults to the configured value)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as scratch:
+        use_scratch_database(scratch)
+        if args.command == "record":
+            return asyncio.run(record(args.archive, args.docs_url))
+        if not args.archive.is_file():
+            print(f"Archive not found: {args.archive} (create one with the record command)")
+            return 1
+        return asyncio.run(replay(args.archive, max(1, args.repeat), args.parse_workers, args.concurrency))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,11 +3,21 @@ Configuration management for Site24x7 CLI AI Agent
 """
 
 import os
-from typing import Optional
+from typing import Dict, List, Optional
 from pydantic_settings import BaseSettings
 from pydantic import Field
 from fastapi import Request
 
+# Site24x7 data centres with their documentation roots and API base URLs
+SITE24X7_DATA_CENTERS = {
+    'us': {'docs_url': 'https://www.site24x7.com/help/api/', 'api_url': 'https://www.site24x7.com/api'},
+    'eu': {'docs_url': 'https://www.site24x7.eu/help/api/', 'api_url': 'https://www.site24x7.eu/api'},
+    'in': {'docs_url': 'https://www.site24x7.in/help/api/', 'api_url': 'https://www.site24x7.in/api'},
+    'au': {'docs_url': 'https://www.site24x7.net.au/help/api/', 'api_url': 'https://www.site24x7.net.au/api'},
+    'jp': {'docs_url': 'https://www.site24x7.jp/help/api/', 'api_url': 'https://www.site24x7.jp/api'}
+}
+PRIMARY_DATA_CENTER = 'us'
+
 class Settings(BaseSettings):
     """Application settings with database and environment variable support"""
     
@@ -54,6 +64,11 @@ class Settings(BaseSettings):
     def site24x7_docs_url(self) -> str:
         return self.get_config('site24x7_docs_url', "https://www.site24x7.com/help/api/")
     
+    # OpenAPI/Swagger spec or Postman collection (path or URL) used instead of scraping
+    @property
+    def site24x7_spec_source(self) -> str:
+        return self.get_config('site24x7_spec_source', "")
+    
     # AI Configuration
     @property
     def openai_api_key(self) -> str:
@@ -79,11 +94,166 @@ class Settings(BaseSettings):
     def local_model(self) -> str:
         return self.get_config('local_model', "llama2")
     
+    # Most new issues triaged together in one LLM request
+    @property
+    def issue_triage_batch_size(self) -> int:
+        return self.get_config('issue_triage_batch_size', 10)
+    
+    # Reply to near-duplicates of earlier issues instead of triaging them
+    @property
+    def issue_duplicate_detection(self) -> bool:
+        return self.get_config('issue_duplicate_detection', True)
+    
+    # Embedding model of the configured endpoint; empty to use hashed TF-IDF vectors only
+    @property
+    def issue_embedding_model(self) -> str:
+        return self.get_config('issue_embedding_model', 'text-embedding-3-small')
+    
+    # Cosine similarity from which an issue counts as a duplicate, per vector kind
+    @property
+    def issue_duplicate_thresholds(self) -> Dict[str, float]:
+        return self.get_config('issue_duplicate_thresholds', {'embedding': 0.92, 'tfidf': 0.8})
+    
+    # Classify new issues locally and call the LLM only when the classifier is unsure
+    @property
+    def issue_classifier_enabled(self) -> bool:
+        return self.get_config('issue_classifier_enabled', True)
+    
+    # Lowest confidence at which the local classification is used instead of the LLM
+    @property
+    def issue_classifier_confidence_threshold(self) -> float:
+        return self.get_config('issue_classifier_confidence_threshold', 0.8)
+    
+    # Past LLM issue analyses needed before the linear model is trained; until then only keywords are used
+    @property
+    def issue_classifier_min_examples(self) -> int:
+        return self.get_config('issue_classifier_min_examples', 50)
+    
+    @property
+    def llm_usage_retention_days(self) -> int:
+        return self.get_config('llm_usage_retention_days', 30)
+    
+    # Daily token budget per calling task type, e.g. {"github_poller": 200000}; unlisted tasks are unlimited
+    @property
+    def llm_task_token_budgets(self) -> Dict[str, int]:
+        return self.get_config('llm_task_token_budgets', {})
+    
+    # Retry failed requests on the other LLM provider (OpenAI or local) when it is configured
+    @property
+    def llm_failover_enabled(self) -> bool:
+        return self.get_config('llm_failover_enabled', True)
+    
+    # Send a second request when the first is slower than its provider's p95 latency
+    @property
+    def llm_hedging_enabled(self) -> bool:
+        return self.get_config('llm_hedging_enabled', True)
+    
+    # Rate limiter lanes whose requests are hedged
+    @property
+    def llm_hedging_lanes(self) -> List[str]:
+        return self.get_config('llm_hedging_lanes', ['interactive', 'maintenance'])
+    
+    # Requests and tokens per minute per provider ("openai", "local"); 0 means no limit
+    @property
+    def llm_rate_limits(self) -> Dict[str, Dict[str, int]]:
+        return self.get_config('llm_rate_limits', {})
+    
+    # Rate limiter lane per calling task type: interactive, maintenance or batch; unlisted tasks use maintenance
+    @property
+    def llm_task_lanes(self) -> Dict[str, str]:
+        return self.get_config('llm_task_lanes', {
+            'github_poller': 'interactive',
+            'github_manager': 'maintenance',
+            'cli_generator': 'batch'
+        })
+    
+    @property
+    def llm_cache_enabled(self) -> bool:
+        return self.get_config('llm_cache_enabled', True)
+    
+    @property
+    def llm_cache_max_mb(self) -> int:
+        return self.get_config('llm_cache_max_mb', 64)
+    
+    # Improve rule-built command names and descriptions with the LLM
+    @property
+    def ai_structure_enrichment(self) -> bool:
+        return self.get_config('ai_structure_enrichment', True)
+    
+    # How long CLI generation waits for a running enrichment before using the rule-built names
+    @property
+    def ai_structure_enrichment_wait_seconds(self) -> int:
+        return self.get_config('ai_structure_enrichment_wait_seconds', 60)
+    
+    # Prompt token budget per API structure analysis shard
+    @property
+    def ai_analysis_shard_tokens(self) -> int:
+        return self.get_config('ai_analysis_shard_tokens', 3000)
+    
+    @property
+    def ai_analysis_concurrency(self) -> int:
+        return self.get_config('ai_analysis_concurrency', 4)
+    
+    # Hours a cached response stays valid, per AIAnalyzer method; unlisted methods are not cached
+    @property
+    def llm_cache_ttl_hours(self) -> Dict[str, float]:
+        return self.get_config('llm_cache_ttl_hours', {
+            'analyze_api_structure': 168,
+            'analyze_github_issue': 168,
+            'triage_issues': 168,
+            'analyze_pull_request': 24,
+            'generate_commit_message': 24
+        })
+    
     # Scheduler Configuration
     @property
     def scraper_interval_hours(self) -> int:
         return self.get_config('scraper_interval_hours', 6)
     
+    @property
+    def scraper_max_concurrency(self) -> int:
+        return self.get_config('scraper_max_concurrency', 8)
+    
+    @property
+    def scraper_max_pages(self) -> int:
+        return self.get_config('scraper_max_pages', 200)
+    
+    @property
+    def scraper_http_cache_enabled(self) -> bool:
+        return self.get_config('scraper_http_cache_enabled', True)
+    
+    @property
+    def scraper_parse_workers(self) -> int:
+        return self.get_config('scraper_parse_workers', min(4, os.cpu_count() or 1))
+    
+    @property
+    def scraper_discovery_mode(self) -> str:
+        return self.get_config('scraper_discovery_mode', "crawl")
+    
+    @property
+    def scraper_sitemap_urls(self) -> List[str]:
+        return self.get_config('scraper_sitemap_urls', [])
+    
+    @property
+    def scraper_data_centers(self) -> Dict[str, str]:
+        """Documentation roots to crawl keyed by data centre.
+        
+        Configured either as a list of data centre codes or as a mapping of code
+        to documentation root. The primary data centre always uses site24x7_docs_url.
+        Defaults to the primary data centre alone, as each one added is a full crawl.
+        """
+        configured = self.get_config('scraper_data_centers', [PRIMARY_DATA_CENTER])
+        if isinstance(configured, str):
+            configured = [code.strip() for code in configured.split(',') if code.strip()]
+        if not isinstance(configured, dict):
+            configured = {
+                code: SITE24X7_DATA_CENTERS[code]['docs_url']
+                for code in configured if code in SITE24X7_DATA_CENTERS
+            }
+        if PRIMARY_DATA_CENTER in configured or not configured:
+            configured = {**configured, PRIMARY_DATA_CENTER: self.site24x7_docs_url}
+        return configured
+    
     @property
     def maintenance_interval_hours(self) -> int:
         return self.get_config('maintenance_interval_hours', 24)
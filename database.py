@@ -36,10 +36,148 @@ def init_db():
                 content_hash TEXT NOT NULL,
                 content TEXT NOT NULL,
                 endpoints_count INTEGER DEFAULT 0,
+                changes TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                generated_at TIMESTAMP,
+                enrichment_pending INTEGER DEFAULT 0
+            )
+        """)
+        _ensure_column(cursor, "api_snapshots", "changes", "TEXT")
+        _ensure_column(cursor, "api_snapshots", "enrichment_pending", "INTEGER DEFAULT 0")
+        if _ensure_column(cursor, "api_snapshots", "generated_at", "TIMESTAMP"):
+            # Older versions generated the CLI from every snapshot they saved
+            cursor.execute("""
+                UPDATE api_snapshots SET generated_at = created_at
+                WHERE id = (SELECT MAX(id) FROM api_snapshots)
+            """)
+        
+        # Per-page documentation records used for incremental parsing
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS api_pages (
+                url TEXT PRIMARY KEY,
+                content_hash TEXT NOT NULL,
+                parsed TEXT NOT NULL,
+                endpoints_count INTEGER DEFAULT 0,
+                lastmod TEXT,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        _ensure_column(cursor, "api_pages", "lastmod", "TEXT")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_api_pages_content_hash ON api_pages (content_hash)")
+        
+        # Endpoint parameter tables parsed from documentation pages, keyed by page content
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS api_page_details (
+                content_hash TEXT PRIMARY KEY,
+                parameters TEXT NOT NULL,
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
         """)
         
+        # Conditional-GET cache for documentation pages
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS http_cache (
+                url TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                content TEXT NOT NULL,
+                raw BLOB,
+                encoding TEXT,
+                fetched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                validated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        _ensure_column(cursor, "http_cache", "raw", "BLOB")
+        _ensure_column(cursor, "http_cache", "encoding", "TEXT")
+        
+        # AI names and descriptions for each category of the rule-built CLI structure
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS api_structure_analyses (
+                category TEXT PRIMARY KEY,
+                endpoints_hash TEXT NOT NULL,
+                analysis TEXT NOT NULL,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        
+        # LLM responses keyed by a hash of the provider, model and request
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS llm_cache (
+                cache_key TEXT PRIMARY KEY,
+                method TEXT NOT NULL,
+                provider TEXT NOT NULL,
+                model TEXT NOT NULL,
+                response TEXT NOT NULL,
+                prompt_tokens INTEGER DEFAULT 0,
+                completion_tokens INTEGER DEFAULT 0,
+                size_bytes INTEGER DEFAULT 0,
+                hits INTEGER DEFAULT 0,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                expires_at TIMESTAMP NOT NULL,
+                last_accessed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_last_accessed ON llm_cache (last_accessed_at)")
+        
+        # Lookup counters per AI method, kept across evictions
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS llm_cache_stats (
+                method TEXT PRIMARY KEY,
+                hits INTEGER DEFAULT 0,
+                misses INTEGER DEFAULT 0,
+                tokens_saved INTEGER DEFAULT 0
+            )
+        """)
+        
+        # Token and latency accounting for every LLM completion
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS llm_usage (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                method TEXT NOT NULL,
+                task_type TEXT NOT NULL,
+                provider TEXT NOT NULL,
+                model TEXT NOT NULL,
+                prompt_tokens INTEGER DEFAULT 0,
+                completion_tokens INTEGER DEFAULT 0,
+                latency_ms INTEGER DEFAULT 0,
+                cache_hit INTEGER DEFAULT 0,
+                success INTEGER DEFAULT 1,
+                coalesced INTEGER DEFAULT 0,
+                lane TEXT DEFAULT 'maintenance',
+                queue_ms INTEGER DEFAULT 0,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        _ensure_column(cursor, "llm_usage", "coalesced", "INTEGER DEFAULT 0")
+        _ensure_column(cursor, "llm_usage", "lane", "TEXT DEFAULT 'maintenance'")
+        _ensure_column(cursor, "llm_usage", "queue_ms", "INTEGER DEFAULT 0")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_llm_usage_created_at ON llm_usage (created_at)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_llm_usage_task_type ON llm_usage (task_type, created_at)")
+        
+        # Decisions of the local issue classifier, escalated or answered locally
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS issue_classifications (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                label TEXT NOT NULL,
+                confidence REAL NOT NULL,
+                escalated INTEGER DEFAULT 0,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_issue_classifications_created_at ON issue_classifications (created_at)")
+        
+        # Issue vectors for duplicate detection, one per issue and vector kind
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS issue_vectors (
+                number INTEGER NOT NULL,
+                kind TEXT NOT NULL,
+                content_hash TEXT NOT NULL,
+                vector BLOB NOT NULL,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (number, kind)
+            )
+        """)
+        
         # Generated CLI versions
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS cli_versions (
@@ -80,6 +218,14 @@ def init_db():
         conn.commit()
         logger.info("Database initialized successfully")
 
+def _ensure_column(cursor, table: str, column: str, definition: str) -> bool:
+    """Add a column to an existing table created by an older schema; returns whether it was added"""
+    cursor.execute(f"PRAGMA table_info({table})")
+    if column in {row[1] for row in cursor.fetchall()}:
+        return False
+    cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+    return True
+
 @contextmanager
 def get_db_connection():
     """Context manager for database connections"""
@@ -168,8 +314,49 @@ class ConfigurationManager:
             'use_local_llm': False,
             'local_api_key': os.getenv('LOCAL_API_KEY', ''),
             'local_model': os.getenv('LOCAL_MODEL', 'llama2'),
+            'ai_structure_enrichment': True,
+            'ai_structure_enrichment_wait_seconds': 60,
+            'ai_analysis_shard_tokens': 3000,
+            'ai_analysis_concurrency': 4,
+            'issue_triage_batch_size': 10,
+            'issue_duplicate_detection': True,
+            'issue_embedding_model': 'text-embedding-3-small',
+            'issue_duplicate_thresholds': {'embedding': 0.92, 'tfidf': 0.8},
+            'issue_classifier_enabled': True,
+            'issue_classifier_confidence_threshold': 0.8,
+            'issue_classifier_min_examples': 50,
+            'llm_usage_retention_days': 30,
+            'llm_task_token_budgets': {},
+            'llm_failover_enabled': True,
+            'llm_hedging_enabled': True,
+            'llm_hedging_lanes': ['interactive', 'maintenance'],
+            'llm_rate_limits': {
+                'openai': {'requests_per_minute': 0, 'tokens_per_minute': 0},
+                'local': {'requests_per_minute': 0, 'tokens_per_minute': 0}
+            },
+            'llm_task_lanes': {
+                'github_poller': 'interactive',
+                'github_manager': 'maintenance',
+                'cli_generator': 'batch'
+            },
+            'llm_cache_enabled': True,
+            'llm_cache_max_mb': 64,
+            'llm_cache_ttl_hours': {
+                'analyze_api_structure': 168,
+                'analyze_github_issue': 168,
+                'triage_issues': 168,
+                'analyze_pull_request': 24,
+                'generate_commit_message': 24
+            },
             'site24x7_docs_url': 'https://www.site24x7.com/help/api/',
+            'site24x7_spec_source': '',
             'scraper_interval_hours': 6,
+            'scraper_max_concurrency': 8,
+            'scraper_max_pages': 200,
+            'scraper_http_cache_enabled': True,
+            'scraper_parse_workers': min(4, os.cpu_count() or 1),
+            'scraper_discovery_mode': 'crawl',
+            'scraper_data_centers': ['us'],
             'maintenance_interval_hours': 24,
             'github_polling_interval': 15,
             'notification_email': '',
@@ -192,14 +379,15 @@ class APISnapshotManager:
     """Manage API documentation snapshots"""
     
     @staticmethod
-    def save_snapshot(content: str, content_hash: str, endpoints_count: int = 0) -> int:
+    def save_snapshot(content: str, content_hash: str, endpoints_count: int = 0, changes: Optional[Dict[str, Any]] = None) -> int:
         """Save API documentation snapshot"""
         with get_db_connection() as conn:
             cursor = conn.cursor()
+            changes_json = json.dumps(changes) if changes is not None else None
             cursor.execute("""
-                INSERT INTO api_snapshots (content_hash, content, endpoints_count)
-                VALUES (?, ?, ?)
-            """, (content_hash, content, endpoints_count))
+                INSERT INTO api_snapshots (content_hash, content, endpoints_count, changes)
+                VALUES (?, ?, ?, ?)
+            """, (content_hash, content, endpoints_count, changes_json))
             conn.commit()
             return cursor.lastrowid or 0
     
@@ -221,6 +409,398 @@ class APISnapshotManager:
         """Check if content has changed from last snapshot"""
         latest = APISnapshotManager.get_latest_snapshot()
         return latest is None or latest['content_hash'] != content_hash
+    
+    @staticmethod
+    def mark_generated(content_hash: str, enrichment_pending: bool = False) -> None:
+        """Record that the CLI was generated and deployed from the latest snapshot with this hash.
+        
+        enrichment_pending records that AI structure enrichment was still running,
+        so the CLI is generated again to pick it up.
+        """
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                UPDATE api_snapshots SET generated_at = CURRENT_TIMESTAMP, enrichment_pending = ?
+                WHERE id = (SELECT MAX(id) FROM api_snapshots WHERE content_hash = ?)
+            """, (int(enrichment_pending), content_hash))
+            conn.commit()
+    
+    @staticmethod
+    def get_generated_snapshot() -> Optional[Dict[str, Any]]:
+        """Get the latest snapshot the CLI was successfully generated from"""
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT * FROM api_snapshots
+                WHERE generated_at IS NOT NULL
+                ORDER BY generated_at DESC, id DESC
+                LIMIT 1
+            """)
+            row = cursor.fetchone()
+            return dict(row) if row else None
+
+class APIPageManager:
+    """Manage per-page documentation records"""
+    
+    @staticmethod
+    def get(url: str) -> Optional[Dict[str, Any]]:
+        """Get the stored record for a documentation page"""
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT * FROM api_pages WHERE url = ?", (url,))
+            row = cursor.fetchone()
+            if not row:
+                return None
+            page = dict(row)
+            page['parsed'] = json.loads(page['parsed'])
+            return page
+    
+    @staticmethod
+    def find_by_hash(content_hash: str) -> Optional[Dict[str, Any]]:
+        """Get the record of any page with the given content hash"""
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT * FROM api_pages WHERE content_hash = ? LIMIT 1", (content_hash,))
+            row = cursor.fetchone()
+            if not row:
+                return None
+            page = dict(row)
+            page['parsed'] = json.loads(page['parsed'])
+            return page
+    
+    @staticmethod
+    def save(url: str, content_hash: str, parsed: Dict[str, Any], lastmod: Optional[str] = None) -> None:
+        """Save the content hash, parse result and sitemap lastmod for a documentation page"""
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                INSERT OR REPLACE INTO api_pages (url, content_hash, parsed, endpoints_count, lastmod, updated_at)
+                VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+            """, (url, content_hash, json.dumps(parsed), len(parsed.get('endpoints', [])), lastmod))
+            conn.commit()
+
+class APIPageDetailManager:
+    """Manage endpoint parameters parsed from documentation pages"""
+    
+    @staticmethod
+    def get(content_hash: str) -> Optional[Dict[str, List[Dict[str, Any]]]]:
+        """Get the parameters parsed from a page with the given content hash"""
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT parameters FROM api_page_details WHERE content_hash = ?", (content_hash,))
+            row = cursor.fetchone()
+            return json.loads(row['parameters']) if row else None
+    
+    @staticmethod
+    def save(content_hash: str, parameters: Dict[str, List[Dict[str, Any]]]) -> None:
+        """Save the parameters parsed from a page, keyed by endpoint path"""
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                INSERT OR REPLACE INTO api_page_details (content_hash, parameters, created_at)
+                VALUES (?, ?, CURRENT_TIMESTAMP)
+            """, (content_hash, json.dumps(parameters)))
+            conn.commit()
+
+class HTTPCacheManager:
+    """Manage cached documentation pages and their validators"""
+    
+    @staticmethod
+    def get(url: str) -> Optional[Dict[str, Any]]:
+        """Get cached page for URL"""
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT * FROM http_cache WHERE url = ?", (url,))
+            row = cursor.fetchone()
+            return dict(row) if row else None
+    
+    @staticmethod
+    def save_response(url: str, content: str, etag: Optional[str] = None, last_modified: Optional[str] = None,
+                      raw: Optional[bytes] = None, encoding: Optional[str] = None) -> None:
+        """Store a freshly downloaded page, its original bytes and its validators"""
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                INSERT OR REPLACE INTO http_cache
+                    (url, etag, last_modified, content, raw, encoding, fetched_at, validated_at)
+                VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+            """, (url, etag, last_modified, content, raw, encoding))
+            conn.commit()
+    
+    @staticmethod
+    def mark_validated(url: str) -> None:
+        """Record that the server confirmed the cached page is still current"""
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "UPDATE http_cache SET validated_at = CURRENT_TIMESTAMP WHERE url = ?",
+                (url,)
+            )
+            conn.commit()
+
+class APIStructureAnalysisManager:
+    """Manage per-category AI enrichments of the API structure"""
+    
+    @staticmethod
+    def get_all() -> Dict[str, Dict[str, Any]]:
+        """Get stored enrichments keyed by category, with the analysis decoded"""
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT category, endpoints_hash, analysis FROM api_structure_analyses")
+            return {
+                row['category']: {'endpoints_hash': row['endpoints_hash'], 'analysis': json.loads(row['analysis'])}
+                for row in cursor.fetchall()
+            }
+    
+    @staticmethod
+    def save(category: str, endpoints_hash: str, analysis: List[Dict[str, Any]]) -> None:
+        """Store the enrichment of a category"""
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                INSERT OR REPLACE INTO api_structure_analyses (category, endpoints_hash, analysis, updated_at)
+                VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+            """, (category, endpoints_hash, json.dumps(analysis)))
+            conn.commit()
+    
+    @staticmethod
+    def delete_except(categories: List[str]) -> None:
+        """Drop enrichments of categories no longer in the documentation"""
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            placeholders = ', '.join('?' for _ in categories)
+            cursor.execute(
+                f"DELETE FROM api_structure_analyses WHERE category NOT IN ({placeholders})",
+                categories
+            )
+            conn.commit()
+
+class LLMCacheManager:
+    """Manage cached LLM responses and their lookup statistics"""
+    
+    @staticmethod
+    def get(cache_key: str) -> Optional[Dict[str, Any]]:
+        """Get an unexpired cached response and mark it as recently used"""
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT * FROM llm_cache WHERE cache_key = ? AND expires_at > CURRENT_TIMESTAMP",
+                (cache_key,)
+            )
+            row = cursor.fetchone()
+            if not row:
+                return None
+            cursor.execute("""
+                UPDATE llm_cache SET hits = hits + 1, last_accessed_at = CURRENT_TIMESTAMP
+                WHERE cache_key = ?
+            """, (cache_key,))
+            conn.commit()
+            return dict(row)
+    
+    @staticmethod
+    def save(cache_key: str, method: str, provider: str, model: str, response: str,
+             prompt_tokens: int, completion_tokens: int, ttl_seconds: int) -> None:
+        """Store a response that expires after ttl_seconds"""
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                INSERT OR REPLACE INTO llm_cache
+                    (cache_key, method, provider, model, response, prompt_tokens, completion_tokens,
+                     size_bytes, expires_at, last_accessed_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, datetime('now', ?), CURRENT_TIMESTAMP)
+            """, (cache_key, method, provider, model, response, prompt_tokens, completion_tokens,
+                  len(response.encode('utf-8')), f"+{int(ttl_seconds)} seconds"))
+            conn.commit()
+    
+    @staticmethod
+    def evict(max_bytes: int) -> int:
+        """Drop expired responses, then least recently used ones until the cache fits in max_bytes"""
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("DELETE FROM llm_cache WHERE expires_at <= CURRENT_TIMESTAMP")
+            removed = cursor.rowcount
+            cursor.execute("SELECT COALESCE(SUM(size_bytes), 0) FROM llm_cache")
+            excess = cursor.fetchone()[0] - max_bytes
+            if excess > 0:
+                cursor.execute("SELECT cache_key, size_bytes FROM llm_cache ORDER BY last_accessed_at, created_at")
+                victims = []
+                for row in cursor.fetchall():
+                    if excess <= 0:
+                        break
+                    victims.append((row['cache_key'],))
+                    excess -= row['size_bytes']
+                cursor.executemany("DELETE FROM llm_cache WHERE cache_key = ?", victims)
+                removed += len(victims)
+            conn.commit()
+            return removed
+    
+    @staticmethod
+    def record_lookup(method: str, hit: bool, tokens_saved: int = 0) -> None:
+        """Count a cache lookup for an AI method"""
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                INSERT INTO llm_cache_stats (method, hits, misses, tokens_saved) VALUES (?, ?, ?, ?)
+                ON CONFLICT(method) DO UPDATE SET
+                    hits = hits + excluded.hits,
+                    misses = misses + excluded.misses,
+                    tokens_saved = tokens_saved + excluded.tokens_saved
+            """, (method, int(hit), int(not hit), tokens_saved))
+            conn.commit()
+    
+    @staticmethod
+    def get_stats() -> Dict[str, Any]:
+        """Get lookup counters per method and the current cache size"""
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT * FROM llm_cache_stats ORDER BY method")
+            methods = [dict(row) for row in cursor.fetchall()]
+            cursor.execute("SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM llm_cache")
+            entries, size_bytes = cursor.fetchone()
+            return {'methods': methods, 'entries': entries, 'size_bytes': size_bytes}
+
+class LLMUsageManager:
+    """Manage the rolling log of LLM calls"""
+    
+    @staticmethod
+    def record(method: str, task_type: str, lane: str, provider: str, model: str, prompt_tokens: int,
+               completion_tokens: int, latency_ms: int, queue_ms: int, cache_hit: bool, success: bool,
+               coalesced: bool, retention_days: int) -> None:
+        """Record one LLM call and drop calls older than retention_days"""
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                INSERT INTO llm_usage
+                    (method, task_type, lane, provider, model, prompt_tokens, completion_tokens,
+                     latency_ms, queue_ms, cache_hit, success, coalesced)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (method, task_type, lane, provider, model, prompt_tokens, completion_tokens,
+                  latency_ms, queue_ms, int(cache_hit), int(success), int(coalesced)))
+            cursor.execute(
+                "DELETE FROM llm_usage WHERE created_at < datetime('now', ?)",
+                (f"-{int(retention_days)} days",)
+            )
+            conn.commit()
+    
+    @staticmethod
+    def tokens_used_today(task_type: str) -> int:
+        """Tokens spent on uncached calls for a task type since midnight UTC"""
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT COALESCE(SUM(prompt_tokens + completion_tokens), 0) FROM llm_usage
+                WHERE task_type = ? AND created_at >= date('now')
+            """, (task_type,))
+            return cursor.fetchone()[0]
+    
+    @staticmethod
+    def get_summary(days: int = 7) -> Dict[str, List[Dict[str, Any]]]:
+        """Calls, tokens, latency and rate limiter queue time per method, per day and per lane over the last days"""
+        aggregates = """
+            COUNT(*) AS calls,
+            SUM(cache_hit) AS cache_hits,
+            SUM(coalesced) AS coalesced,
+            SUM(1 - success) AS errors,
+            SUM(prompt_tokens) AS prompt_tokens,
+            SUM(completion_tokens) AS completion_tokens,
+            CAST(AVG(CASE WHEN cache_hit = 0 AND coalesced = 0 THEN latency_ms END) AS INTEGER) AS avg_latency_ms,
+            MAX(latency_ms) AS max_latency_ms,
+            CAST(AVG(queue_ms) AS INTEGER) AS avg_queue_ms,
+            MAX(queue_ms) AS max_queue_ms
+        """
+        since = (f"-{int(days)} days",)
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"""
+                SELECT method, {aggregates} FROM llm_usage
+                WHERE created_at >= datetime('now', ?)
+                GROUP BY method ORDER BY SUM(prompt_tokens + completion_tokens) DESC
+            """, since)
+            methods = [dict(row) for row in cursor.fetchall()]
+            cursor.execute(f"""
+                SELECT date(created_at) AS day, method, {aggregates} FROM llm_usage
+                WHERE created_at >= datetime('now', ?)
+                GROUP BY day, method ORDER BY day DESC, method
+            """, since)
+            daily = [dict(row) for row in cursor.fetchall()]
+            cursor.execute("""
+                SELECT task_type, COUNT(*) AS calls, SUM(prompt_tokens + completion_tokens) AS tokens
+                FROM llm_usage WHERE created_at >= date('now')
+                GROUP BY task_type ORDER BY tokens DESC
+            """)
+            today = [dict(row) for row in cursor.fetchall()]
+            cursor.execute(f"""
+                SELECT lane, {aggregates} FROM llm_usage
+                WHERE created_at >= datetime('now', ?)
+                GROUP BY lane ORDER BY lane
+            """, since)
+            lanes = [dict(row) for row in cursor.fetchall()]
+            return {'methods': methods, 'daily': daily, 'today_by_task': today, 'lanes': lanes}
+
+class IssueVectorManager:
+    """Manage the persisted vectors of the duplicate issue index"""
+    
+    @staticmethod
+    def get_all(kind: str) -> List[Dict[str, Any]]:
+        """Get every stored vector of one kind"""
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT number, content_hash, vector FROM issue_vectors
+                WHERE kind = ? ORDER BY number
+            """, (kind,))
+            return [dict(row) for row in cursor.fetchall()]
+    
+    @staticmethod
+    def save(number: int, kind: str, content_hash: str, vector: bytes) -> None:
+        """Insert or replace the vector of an issue"""
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                INSERT OR REPLACE INTO issue_vectors (number, kind, content_hash, vector, updated_at)
+                VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+            """, (number, kind, content_hash, vector))
+            conn.commit()
+
+class IssueClassificationManager:
+    """Manage the log of local issue classifier decisions"""
+    
+    @staticmethod
+    def record(label: str, confidence: float, escalated: bool, retention_days: int) -> None:
+        """Record one decision and drop decisions older than retention_days"""
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                INSERT INTO issue_classifications (label, confidence, escalated)
+                VALUES (?, ?, ?)
+            """, (label, confidence, int(escalated)))
+            cursor.execute(
+                "DELETE FROM issue_classifications WHERE created_at < datetime('now', ?)",
+                (f"-{int(retention_days)} days",)
+            )
+            conn.commit()
+    
+    @staticmethod
+    def get_stats(days: int = 7) -> Dict[str, Any]:
+        """Decisions, escalations and mean confidence per label over the last days"""
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT label, COUNT(*) AS classified, SUM(escalated) AS escalated,
+                       ROUND(AVG(confidence), 3) AS avg_confidence
+                FROM issue_classifications
+                WHERE created_at >= datetime('now', ?)
+                GROUP BY label ORDER BY classified DESC
+            """, (f"-{int(days)} days",))
+            labels = [dict(row) for row in cursor.fetchall()]
+            classified = sum(row['classified'] for row in labels)
+            escalated = sum(row['escalated'] for row in labels)
+            return {
+                'classified': classified,
+                'escalated': escalated,
+                'escalation_rate': round(escalated / classified, 3) if classified else None,
+                'labels': labels
+            }
 
 class CLIVersionManager:
     """Manage CLI versions"""
@@ -305,3 +885,59 @@ class GitHubOperationLogger:
                 LIMIT ?
             """, (limit,))
             return [dict(row) for row in cursor.fetchall()]
+    
+    @staticmethod
+    def get_operations_by_type(operation_types: List[str], limit: int = 1000) -> List[Dict[str, Any]]:
+        """Get the most recent operations of the given types, newest first"""
+        placeholders = ', '.join('?' for _ in operation_types)
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"""
+                SELECT * FROM github_operations
+                WHERE operation_type IN ({placeholders})
+                ORDER BY id DESC
+                LIMIT ?
+            """, (*operation_types, limit))
+            return [dict(row) for row in cursor.fetchall()]
+    
+    @staticmethod
+    def get_operations_since(operation_types: List[str], after_id: int, through_id: int) -> List[Dict[str, Any]]:
+        """Get the operations of the given types with ids in (after_id, through_id], oldest first"""
+        placeholders = ', '.join('?' for _ in operation_types)
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"""
+                SELECT * FROM github_operations
+                WHERE operation_type IN ({placeholders}) AND id > ? AND id <= ?
+                ORDER BY id
+            """, (*operation_types, after_id, through_id))
+            return [dict(row) for row in cursor.fetchall()]
+    
+    @staticmethod
+    def get_analyzed_issues() -> Dict[int, Dict[str, Any]]:
+        """Issue as it was when last analyzed, keyed by issue number"""
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT details FROM github_operations
+                WHERE operation_type = 'issue_analysis' AND details IS NOT NULL
+                ORDER BY id
+            """)
+            issues = {}
+            for row in cursor.fetchall():
+                issue = json.loads(row['details']).get('issue')
+                if issue and issue.get('number') is not None:
+                    issues[issue['number']] = issue
+            return issues
+    
+    @staticmethod
+    def get_latest_id(operation_types: List[str]) -> int:
+        """Id of the newest operation of the given types, 0 if there is none"""
+        placeholders = ', '.join('?' for _ in operation_types)
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"""
+                SELECT COALESCE(MAX(id), 0) FROM github_operations
+                WHERE operation_type IN ({placeholders})
+            """, operation_types)
+            return cursor.fetchone()[0]
@@ -48,6 +48,11 @@ async def lifespan(app: FastAPI):
     from database import ConfigurationManager
     ConfigurationManager.initialize_defaults()
     
+    from config import settings
+    from services.issue_index import NUMPY_AVAILABLE
+    if not NUMPY_AVAILABLE and settings.issue_duplicate_detection:
+        logger.warning("NumPy not installed - duplicate issue detection is disabled")
+    
     # Initialize and start scheduler
     scheduler_service = SchedulerService()
     await scheduler_service.start()
@@ -62,6 +62,12 @@ class APIEndpoint(BaseModel):
     name: str = Field(..., description="Human-readable endpoint name")
     description: str = Field(..., description="Endpoint description")
     parameters: Dict[str, List[str]] = Field(default_factory=dict, description="Endpoint parameters")
+    parameter_details: List[Dict[str, Any]] = Field(
+        default_factory=list,
+        description="Documented parameters with name, type, required flag, enum values and location"
+    )
+    doc_urls: List[str] = Field(default_factory=list, description="Documentation pages mentioning the endpoint")
+    regions: List[str] = Field(default_factory=list, description="Data centres documenting the endpoint")
     auth_required: bool = Field(default=True, description="Whether authentication is required")
     rate_limited: bool = Field(default=True, description="Whether endpoint is rate limited")
 
@@ -83,6 +89,10 @@ class APIDocumentation(BaseModel):
     http_methods: List[str] = Field(..., description="Supported HTTP methods")
     scraped_at: str = Field(..., description="Scraping timestamp")
     total_endpoints: int = Field(..., description="Total number of endpoints")
+    data_centers: Dict[str, Dict[str, Any]] = Field(
+        default_factory=dict,
+        description="Crawled data centres with their docs root, API base URL and endpoint count"
+    )
 
 
 class CLICommand(BaseModel):
@@ -398,8 +398,9 @@ async def test_config(request: Request):
         elif openai_key:
             try:
                 import openai
-                client = openai.OpenAI(api_key=openai_key)
-                models = client.models.list()
+                # Form values may not be saved yet, so use a one-off client rather than the shared one
+                async with openai.AsyncOpenAI(api_key=openai_key) as client:
+                    models = await client.models.list()
                 test_results['OpenAI API'] = {
                     'success': True,
                     'message': f"Connected - {len(models.data)} models available"
@@ -535,8 +536,8 @@ async def trigger_github_deployment():
         raise HTTPException(status_code=500, detail=f"GitHub deployment failed: {str(e)}")
 
 @router.post("/actions/full-update")
-async def trigger_full_update():
-    """Trigger complete update cycle: scrape → generate → deploy"""
+async def trigger_full_update(force: bool = False):
+    """Trigger complete update cycle: scrape → generate → deploy; force regenerates unchanged documentation"""
     try:
         # Import scheduler service
         from main import scheduler_service
@@ -544,7 +545,7 @@ async def trigger_full_update():
         if not scheduler_service:
             raise HTTPException(status_code=503, detail="Scheduler service not available")
         
-        result = await scheduler_service.trigger_manual_update()
+        result = await scheduler_service.trigger_manual_update(force)
         return result
         
     except Exception as e:
@@ -643,6 +644,50 @@ async def get_scheduler_status():
         logger.error(f"Scheduler status error: {e}")
         raise HTTPException(status_code=500, detail="Scheduler status unavailable")
 
+@router.get("/llm/cache")
+async def get_llm_cache_stats():
+    """Get LLM response cache hit rate and tokens saved"""
+    try:
+        from services.llm_cache import LLMResponseCache
+        return LLMResponseCache.stats()
+        
+    except Exception as e:
+        logger.error(f"LLM cache stats error: {e}")
+        raise HTTPException(status_code=500, detail="LLM cache statistics unavailable")
+
+@router.get("/llm/usage")
+async def get_llm_usage(days: int = Query(default=7, ge=1, le=90)):
+    """Get LLM token and latency usage per method and per day, with task budgets"""
+    try:
+        from services.llm_usage import LLMUsageTracker
+        return LLMUsageTracker.summary(days)
+        
+    except Exception as e:
+        logger.error(f"LLM usage error: {e}")
+        raise HTTPException(status_code=500, detail="LLM usage unavailable")
+
+@router.get("/llm/providers")
+async def get_llm_provider_stats():
+    """Get latency percentiles and error rates per LLM provider, with hedging and failover counts"""
+    try:
+        from services.provider_pool import llm_providers
+        return llm_providers.snapshot()
+        
+    except Exception as e:
+        logger.error(f"LLM provider stats error: {e}")
+        raise HTTPException(status_code=500, detail="LLM provider statistics unavailable")
+
+@router.get("/llm/classifier")
+async def get_issue_classifier_stats(days: int = Query(default=7, ge=1, le=90)):
+    """Get how often the local issue classifier escalated to the LLM"""
+    try:
+        from services.issue_classifier import issue_classifier
+        return issue_classifier.stats(days)
+        
+    except Exception as e:
+        logger.error(f"Issue classifier stats error: {e}")
+        raise HTTPException(status_code=500, detail="Issue classifier statistics unavailable")
+
 @router.get("/health")
 async def health_check():
     """Health check endpoint for monitoring"""
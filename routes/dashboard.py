@@ -15,6 +15,9 @@ from database import (
     ConfigurationManager, TaskLogger, GitHubOperationLogger,
     APISnapshotManager, CLIVersionManager
 )
+from services.issue_classifier import issue_classifier
+from services.llm_usage import LLMUsageTracker
+from services.provider_pool import llm_providers
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -97,6 +100,7 @@ async def update_config(request: Request):
             'local_api_key': 'local_api_key',
             'local_model': 'local_model',
             'site24x7_docs_url': 'site24x7_docs_url',
+            'site24x7_spec_source': 'site24x7_spec_source',
             'scraper_interval_hours': 'scraper_interval_hours',
             'maintenance_interval_hours': 'maintenance_interval_hours',
             'notification_email': 'notification_email',
@@ -112,6 +116,10 @@ async def update_config(request: Request):
                 else:
                     config_updates[config_key] = value
         
+        # Clearing the structured spec source switches back to HTML scraping
+        if 'site24x7_spec_source' in form_data and not form_data.get('site24x7_spec_source', '').strip():
+            config_updates['site24x7_spec_source'] = ''
+        
         # Handle boolean checkboxes
         boolean_fields = [
             'enable_auto_deployment',
@@ -164,6 +172,9 @@ async def logs_page(request: Request):
             "request": request,
             "task_logs": task_logs,
             "github_ops": github_ops,
+            "llm_usage": LLMUsageTracker.summary(7),
+            "issue_classifier": issue_classifier.stats(7),
+            "llm_providers": llm_providers.snapshot(),
             "system_status": system_status
         }
         
@@ -258,6 +269,9 @@ async def logs_page(request: Request, limit: int = 100):
             "request": request,
             "task_logs": task_logs,
             "github_ops": github_ops,
+            "llm_usage": LLMUsageTracker.summary(7),
+            "issue_classifier": issue_classifier.stats(7),
+            "llm_providers": llm_providers.snapshot(),
             "limit": limit
         }
         
@@ -277,14 +291,14 @@ async def get_status():
         raise HTTPException(status_code=500, detail="Status unavailable")
 
 @router.post("/actions/manual-update")
-async def trigger_manual_update():
-    """Manually trigger CLI update"""
+async def trigger_manual_update(force: bool = False):
+    """Manually trigger CLI update; force regenerates unchanged documentation"""
     try:
         # Import here to avoid circular imports
         from main import scheduler_service
         
         if scheduler_service:
-            result = await scheduler_service.trigger_manual_update()
+            result = await scheduler_service.trigger_manual_update(force)
             return result
         else:
             raise HTTPException(status_code=503, detail="Scheduler service not available")
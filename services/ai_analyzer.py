@@ -3,84 +3,295 @@ AI Analysis Service using OpenAI
 Provides intelligent analysis for API documentation, issues, and pull requests
 """
 
+import asyncio
 import json
 import logging
-from typing import Dict, List, Any, Optional
+import re
+import time
+from typing import Dict, List, Any, Optional, Tuple
 import os
 
-from openai import OpenAI
+import openai
+from openai import AsyncOpenAI
 
 from config import settings
+from database import APIStructureAnalysisManager
+from services.issue_classifier import IssueClassification, issue_classifier
+from services.issue_index import DuplicateMatch, issue_index
+from services.llm_cache import LLMResponseCache
+from services.llm_client import LLMProviderConfig, current_provider_config, llm_clients
+from services.llm_usage import LLM_LANES, LLMUsageTracker, current_lane, current_task_type
+from services.provider_pool import llm_providers
+from services.rate_limiter import DEFAULT_COMPLETION_TOKENS, llm_rate_limiters
+from services.singleflight import SingleFlight
+from services.structure_builder import APIStructureBuilder
+from utils.helpers import generate_canonical_hash
 
 logger = logging.getLogger(__name__)
 
+# Longest issue body sent for triage
+ISSUE_BODY_PROMPT_CHARS = 4000
+
 class AIAnalyzer:
     """AI-powered analysis service using OpenAI"""
     
+    # Structure enrichment runs keyed by the categories they enrich, shared across analyzers
+    _enrichment_tasks: Dict[str, asyncio.Task] = {}
+    # In-flight completions keyed by request, shared across analyzers
+    _inflight_completions = SingleFlight()
+    # Rate limiter lane of each in-flight completion: the highest of the callers sharing it
+    _inflight_lanes: Dict[str, str] = {}
+    
     def __init__(self):
-        self.use_local_llm = settings.use_local_llm
-        self.base_url = settings.openai_base_url
-        self.client = None
-        
-        if self.use_local_llm:
-            # Configure for local LLM
-            self.api_key = settings.local_api_key or "dummy-key"  # Some local LLMs don't need real keys
-            self.model = settings.local_model
-            
-            if self.base_url:
-                try:
-                    logger.info(f"Initializing local LLM client with base URL: {self.base_url}")
-                    self.client = OpenAI(
-                        api_key=self.api_key,
-                        base_url=self.base_url
-                    )
-                    logger.info(f"Local LLM client initialized successfully with model: {self.model}")
-                except Exception as e:
-                    logger.error(f"Failed to initialize local LLM client: {e}")
-                    self.client = None
-            else:
-                logger.warning("Local LLM selected but no base URL provided - AI features will be disabled")
-        else:
-            # Configure for OpenAI
-            self.api_key = settings.openai_api_key
-            self.model = settings.openai_model
-            
-            if self.api_key:
-                try:
-                    logger.info("Initializing OpenAI client")
-                    self.client = OpenAI(api_key=self.api_key)
-                    logger.info("OpenAI client initialized successfully")
-                except Exception as e:
-                    logger.error(f"Failed to initialize OpenAI client: {e}")
-                    self.client = None
-            else:
-                logger.warning("AI API key not provided - AI features will be disabled")
+        self._resolve_client()
+    
+    @property
+    def use_local_llm(self) -> bool:
+        return self.provider.use_local_llm
+    
+    @property
+    def model(self) -> str:
+        return self.provider.model
     
     def is_available(self) -> bool:
         """Check if AI services are available"""
-        return self.client is not None
+        # Re-resolve so long-lived analyzers follow provider settings changes
+        self._resolve_client()
+        return bool(llm_providers.available())
     
-    async def analyze_api_structure(self, documentation: Dict[str, Any]) -> Dict[str, Any]:
-        """Analyze API documentation structure using AI"""
+    def _use_llm(self) -> bool:
+        """Whether to call the LLM: it must be available and the calling task within its daily token budget"""
         if not self.is_available():
-            logger.warning("AI analysis not available - using fallback structure")
-            return self._get_fallback_structure(documentation)
+            return False
+        if LLMUsageTracker.budget_exceeded():
+            logger.warning(f"Daily LLM token budget of task '{current_task_type.get()}' exceeded")
+            return False
+        return True
+    
+    def _resolve_client(self) -> None:
+        """Get the shared client for the active provider; the registry hands back the
+        same pooled client until the provider settings change"""
+        self.provider = current_provider_config()
+        self.client = llm_clients.get_client(self.provider)
+    
+    async def _complete(self, method: str, messages: List[Dict[str, str]],
+                        response_format: Optional[Dict[str, Any]] = None,
+                        max_tokens: Optional[int] = None) -> Optional[str]:
+        """Run a chat completion, serving repeated identical requests from the response cache.
+        
+        Concurrent identical requests share one in-flight call, which waits for the
+        rate limiter in the highest-priority lane of its callers. Every call is
+        recorded with its tokens, latency and cache outcome.
+        """
+        request_key = LLMResponseCache.make_key(self.provider.name, self.model, messages, response_format, max_tokens)
+        start = time.perf_counter()
+        lane = current_lane()
+        coalesced = AIAnalyzer._inflight_completions.is_running(request_key)
+        if coalesced:
+            self._promote_completion(request_key, lane)
+        else:
+            AIAnalyzer._inflight_lanes[request_key] = lane
+        
+        async def complete() -> Optional[str]:
+            try:
+                return await self._complete_once(method, request_key, messages, response_format, max_tokens)
+            finally:
+                AIAnalyzer._inflight_lanes.pop(request_key, None)
+        
+        content = await AIAnalyzer._inflight_completions.do(request_key, complete)
+        if coalesced:
+            LLMUsageTracker.record(method, self.provider.name, self.model,
+                                   time.perf_counter() - start, coalesced=True)
+        return content
+    
+    @staticmethod
+    def _promote_completion(request_key: str, lane: str) -> None:
+        """Raise an in-flight completion to a joining caller's lane if it is higher"""
+        current = AIAnalyzer._inflight_lanes.get(request_key)
+        if current is None or lane not in LLM_LANES or LLM_LANES.index(lane) >= LLM_LANES.index(current):
+            return
+        AIAnalyzer._inflight_lanes[request_key] = lane
+        llm_rate_limiters.promote(request_key, lane)
+    
+    async def _complete_once(self, method: str, request_key: str, messages: List[Dict[str, str]],
+                             response_format: Optional[Dict[str, Any]], max_tokens: Optional[int]) -> Optional[str]:
+        """Serve a completion from the cache or, once the rate limiter admits it, the provider pool"""
+        start = time.perf_counter()
+        ttl_seconds = LLMResponseCache.ttl_seconds(method)
+        if ttl_seconds > 0:
+            cached = LLMResponseCache.get(method, request_key)
+            if cached is not None:
+                LLMUsageTracker.record(method, self.provider.name, self.model,
+                                       time.perf_counter() - start, cache_hit=True)
+                return cached
+        
+        params: Dict[str, Any] = {}
+        if response_format is not None:
+            params['response_format'] = response_format
+        if max_tokens is not None:
+            params['max_tokens'] = max_tokens
+        
+        prompt_tokens = self._estimate_tokens(messages)
+        estimated_tokens = prompt_tokens + (max_tokens or DEFAULT_COMPLETION_TOKENS)
+        lane = current_lane()
+        
+        async def attempt(provider: LLMProviderConfig, client: AsyncOpenAI) -> Tuple[LLMProviderConfig, Any]:
+            limiter = llm_rate_limiters.get(provider)
+            queue_seconds = await limiter.acquire(estimated_tokens, AIAnalyzer._inflight_lanes.get(request_key, lane),
+                                                  flight=request_key)
+            start = time.perf_counter()
+            try:
+                response = await client.chat.completions.create(model=provider.model, messages=messages, **params)
+            except asyncio.CancelledError:
+                # A hedge that lost the race sent its prompt but gets no completion
+                limiter.settle(estimated_tokens, prompt_tokens)
+                raise
+            except Exception as e:
+                if isinstance(e, openai.RateLimitError):
+                    limiter.back_off(llm_rate_limiters.retry_after(e))
+                llm_providers.observe(provider, None)
+                LLMUsageTracker.record(method, provider.name, provider.model,
+                                       time.perf_counter() - start, success=False, queue_seconds=queue_seconds)
+                raise
+            latency = time.perf_counter() - start
+            llm_providers.observe(provider, latency)
+            limiter.settle(estimated_tokens, getattr(response.usage, 'total_tokens', None) or estimated_tokens)
+            LLMUsageTracker.record(method, provider.name, provider.model,
+                                   latency, usage=response.usage, queue_seconds=queue_seconds)
+            return provider, response
+        
+        provider, response = await llm_providers.run(attempt, hedge=lane in (settings.llm_hedging_lanes or []))
+        content = response.choices[0].message.content
+        
+        if ttl_seconds > 0 and content and self._is_cacheable(content, response_format, response):
+            LLMResponseCache.put(method, request_key, provider.name, provider.model, content,
+                                 response.usage, ttl_seconds)
+        return content
+    
+    @staticmethod
+    def _is_cacheable(content: str, response_format: Optional[Dict[str, Any]], response: Any) -> bool:
+        """Only keep complete responses that callers can actually use"""
+        if response.choices[0].finish_reason == "length":
+            return False
+        if response_format and response_format.get("type") == "json_object":
+            try:
+                json.loads(content)
+            except ValueError:
+                return False
+        return True
+    
+    async def analyze_api_structure(self, documentation: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the CLI structure of the API documentation.
+        
+        The structure comes from APIStructureBuilder's rules. When AI is available,
+        an optional enrichment pass improves resource names and descriptions. Each
+        category's enrichment is stored with a hash of the rule-built category, and
+        only categories without a current one are sent to the model, in the
+        background. Its result is applied if it finishes within
+        ai_structure_enrichment_wait_seconds. Otherwise the structure is marked
+        enrichment_pending, and the scheduler generates the CLI again on its next
+        run, when the stored enrichment is applied.
+        """
+        structure = APIStructureBuilder().build(
+            documentation.get('endpoints', []),
+            self._category_descriptions(documentation)
+        )
+        if not settings.ai_structure_enrichment or not self._use_llm():
+            return structure
             
         try:
-            prompt = f"""
-            Analyze the following Site24x7 API documentation and provide a structured analysis 
-            for generating a comprehensive CLI tool. Focus on:
+            categories = {category['name']: category for category in structure['categories']}
+            hashes = {name: generate_canonical_hash(category) for name, category in categories.items()}
+            stored = APIStructureAnalysisManager.get_all()
+            pending = {
+                name: category for name, category in categories.items()
+                if stored.get(name, {}).get('endpoints_hash') != hashes[name]
+            }
             
-            1. Categorize all endpoints into logical groups
-            2. Identify CRUD operations for each resource type
-            3. Suggest hierarchical command structure
-            4. Identify common parameters and patterns
-            5. Suggest CLI command names and descriptions
+            if pending:
+                task = self._start_enrichment(pending, hashes)
+                done, _ = await asyncio.wait({task}, timeout=settings.ai_structure_enrichment_wait_seconds)
+                if done:
+                    stored = APIStructureAnalysisManager.get_all()
+                else:
+                    structure['enrichment_pending'] = True
+                    logger.info(f"Enrichment of {len(pending)} API categories continues in the background")
+            else:
+                logger.info(f"API structure unchanged - reused enrichment of all {len(categories)} categories")
             
-            Documentation:
-            {json.dumps(documentation, indent=2)}
+            self._apply_enrichments(structure, {
+                name: stored[name]['analysis'] for name in categories
+                if name in stored and stored[name]['endpoints_hash'] == hashes[name]
+            })
+            APIStructureAnalysisManager.delete_except(list(categories))
             
-            Please provide the analysis in JSON format with the following structure:
+        except Exception as e:
+            logger.error(f"AI structure enrichment failed: {e}")
+        
+        return structure
+    
+    def _start_enrichment(self, pending: Dict[str, Dict[str, Any]], hashes: Dict[str, str]) -> asyncio.Task:
+        """Start enriching categories in the background, or join a run already enriching the same ones"""
+        key = generate_canonical_hash(sorted(hashes[name] for name in pending))
+        task = AIAnalyzer._enrichment_tasks.get(key)
+        if task is None:
+            task = asyncio.create_task(self._enrich_categories(pending, hashes))
+            AIAnalyzer._enrichment_tasks[key] = task
+            task.add_done_callback(lambda _: AIAnalyzer._enrichment_tasks.pop(key, None))
+        return task
+    
+    async def _enrich_categories(self, pending: Dict[str, Dict[str, Any]], hashes: Dict[str, str]) -> None:
+        """Enrich categories in shards that fit the token budget and store each category's result"""
+        try:
+            shards = self._shard_categories(
+                {name: [self._summarize_resource(sub) for sub in category['subcategories']]
+                 for name, category in pending.items()},
+                settings.ai_analysis_shard_tokens
+            )
+            semaphore = asyncio.Semaphore(max(1, settings.ai_analysis_concurrency))
+            
+            async def enrich(shard: Dict[str, List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+                async with semaphore:
+                    return await self._enrich_structure_shard(shard)
+            
+            partials = await asyncio.gather(*(enrich(shard) for shard in shards), return_exceptions=True)
+            
+            enriched: Dict[str, List[Dict[str, Any]]] = {name: [] for name in pending}
+            failed = set()
+            for shard, partial in zip(shards, partials):
+                if isinstance(partial, Exception):
+                    logger.error(f"API structure enrichment shard failed: {partial}")
+                    failed.update(shard)
+                    continue
+                for name, analyzed in self._attribute_shard_categories(shard, partial).items():
+                    enriched[name].extend(analyzed)
+            
+            # Keep what succeeded so the next run only retries the failed categories
+            for name in pending:
+                if name not in failed:
+                    APIStructureAnalysisManager.save(name, hashes[name], enriched[name])
+            logger.info(f"Enriched {len(pending) - len(failed)} of {len(pending)} API categories in {len(shards)} shards")
+        except Exception as e:
+            logger.error(f"AI structure enrichment failed: {e}")
+    
+    async def _enrich_structure_shard(self, shard: Dict[str, List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Get names and descriptions for one shard of resources grouped by category.
+        
+        A response that is cut off or not valid JSON is retried as two smaller
+        shards, so output is never silently truncated.
+        """
+        prompt = f"""
+            Improve the names and descriptions of the following Site24x7 CLI command structure.
+            Each category lists its resources with their collection endpoint and supported operations.
+            
+            For every resource suggest a short, user-friendly name (it becomes the CLI command)
+            and a one-sentence description, and describe each category.
+            Keep each category name and each endpoint exactly as given.
+            
+            Resources by category:
+            {json.dumps(shard, separators=(',', ':'))}
+            
+            Please provide the result in JSON format with the following structure:
             {{
                 "categories": [
                     {{
@@ -88,56 +299,170 @@ class AIAnalyzer:
                         "description": "Category description",
                         "subcategories": [
                             {{
-                                "name": "Subcategory Name",
                                 "endpoint": "/api/endpoint",
-                                "operations": ["create", "read", "update", "delete"],
-                                "cli_commands": ["command-name"]
+                                "name": "Resource Name",
+                                "description": "Resource description"
                             }}
                         ]
                     }}
-                ],
-                "common_parameters": {{
-                    "authentication": ["oauth_token"],
-                    "pagination": ["page", "limit"],
-                    "filtering": ["status", "type"]
-                }},
-                "command_patterns": {{
-                    "list": "site24x7 <category> <resource> list",
-                    "get": "site24x7 <category> <resource> get <id>",
-                    "create": "site24x7 <category> <resource> create [options]",
-                    "update": "site24x7 <category> <resource> update <id> [options]",
-                    "delete": "site24x7 <category> <resource> delete <id>"
-                }}
+                ]
             }}
             """
-            
-            response = self.client.chat.completions.create(
-                model=self.model,
+        
+        try:
+            content = await self._complete(
+                "analyze_api_structure",
                 messages=[
                     {
                         "role": "system",
-                        "content": "You are an expert CLI architect analyzing API documentation to design comprehensive command-line interfaces. Provide detailed, actionable analysis for CLI generation."
+                        "content": "You are an expert CLI architect naming and documenting the commands of a command-line interface generated from API documentation."
                     },
                     {"role": "user", "content": prompt}
                 ],
                 response_format={"type": "json_object"},
                 max_tokens=4000
             )
-            
-            content = response.choices[0].message.content
-            analysis = json.loads(content) if content else {}
-            logger.info("Completed AI analysis of API structure")
-            
-            return analysis
-            
-        except Exception as e:
-            logger.error(f"AI analysis failed: {e}")
-            # Return fallback structure
-            return self._get_fallback_structure(documentation)
+            return (json.loads(content) if content else {}).get('categories', [])
+        except json.JSONDecodeError:
+            halves = self._split_shard(shard)
+            if not halves:
+                raise
+            logger.warning("API structure shard response was incomplete - retrying as two smaller shards")
+            first, second = await asyncio.gather(*(self._enrich_structure_shard(half) for half in halves))
+            return first + second
     
-    async def analyze_github_issue(self, title: str, body: str) -> Dict[str, Any]:
-        """Analyze GitHub issue using AI"""
-        if not self.is_available():
+    def _shard_categories(self, categories: Dict[str, List[Dict[str, Any]]], token_budget: int) -> List[Dict[str, List[Dict[str, Any]]]]:
+        """Pack categories into shards of at most token_budget prompt tokens.
+        
+        Small categories share a shard; a category larger than the budget is split
+        across several shards under the same name.
+        """
+        shards: List[Dict[str, List[Dict[str, Any]]]] = []
+        shard: Dict[str, List[Dict[str, Any]]] = {}
+        shard_tokens = 0
+        for category, items in categories.items():
+            for item in items:
+                tokens = self._estimate_tokens(item)
+                if shard and shard_tokens + tokens > token_budget:
+                    shards.append(shard)
+                    shard, shard_tokens = {}, 0
+                shard.setdefault(category, []).append(item)
+                shard_tokens += tokens
+        if shard:
+            shards.append(shard)
+        return shards
+    
+    @staticmethod
+    def _attribute_shard_categories(shard: Dict[str, List[Dict[str, Any]]],
+                                    analyzed: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+        """Assign each analyzed category to the category it came from.
+        
+        Matches by name first, then by the endpoints of its subcategories, and
+        otherwise falls back to the shard's first category.
+        """
+        by_name = {category.strip().lower(): category for category in shard}
+        by_endpoint = {item['endpoint']: category for category, items in shard.items() for item in items}
+        attributed: Dict[str, List[Dict[str, Any]]] = {category: [] for category in shard}
+        for item in analyzed:
+            if not isinstance(item, dict):
+                continue
+            target = by_name.get(str(item.get('name', '')).strip().lower())
+            if target is None:
+                target = next(
+                    (by_endpoint[sub['endpoint']] for sub in item.get('subcategories', [])
+                     if isinstance(sub, dict) and sub.get('endpoint') in by_endpoint),
+                    next(iter(shard))
+                )
+            attributed[target].append(item)
+        return attributed
+    
+    @staticmethod
+    def _split_shard(shard: Dict[str, List[Dict[str, Any]]]) -> List[Dict[str, List[Dict[str, Any]]]]:
+        """Split a shard into two halves by item count, or return [] for a single item"""
+        entries = [(category, item) for category, items in shard.items() for item in items]
+        if len(entries) < 2:
+            return []
+        middle = len(entries) // 2
+        halves = []
+        for part in (entries[:middle], entries[middle:]):
+            half: Dict[str, List[Dict[str, Any]]] = {}
+            for category, item in part:
+                half.setdefault(category, []).append(item)
+            halves.append(half)
+        return halves
+    
+    @staticmethod
+    def _summarize_resource(subcategory: Dict[str, Any]) -> Dict[str, Any]:
+        """The fields of a resource the enrichment needs"""
+        return {
+            'endpoint': subcategory['endpoint'],
+            'name': subcategory['name'],
+            'operations': subcategory.get('operations', [])
+        }
+    
+    @staticmethod
+    def _estimate_tokens(value: Any) -> int:
+        """Rough token count of a JSON value (about four characters per token)"""
+        return len(json.dumps(value, separators=(',', ':'))) // 4 + 1
+    
+    @staticmethod
+    def _category_descriptions(documentation: Dict[str, Any]) -> Dict[str, str]:
+        """Category descriptions from the documentation's table of contents"""
+        return {
+            category['name']: category['description']
+            for category in documentation.get('categories', [])
+            if isinstance(category, dict) and category.get('name') and category.get('description')
+        }
+    
+    @staticmethod
+    def _apply_enrichments(structure: Dict[str, Any], enrichments: Dict[str, List[Dict[str, Any]]]) -> None:
+        """Apply stored names and descriptions to a rule-built structure.
+        
+        Only names and descriptions change; endpoints and operations always come
+        from the rules. A suggested name that would clash with another resource in
+        the same category is ignored.
+        """
+        for category in structure['categories']:
+            analyzed = enrichments.get(category['name'])
+            if not analyzed:
+                continue
+            suggestions: Dict[str, Dict[str, Any]] = {}
+            for item in analyzed:
+                if isinstance(item.get('description'), str) and item['description'].strip():
+                    category['description'] = item['description'].strip()
+                for sub in item.get('subcategories', []):
+                    if isinstance(sub, dict) and sub.get('endpoint'):
+                        suggestions.setdefault(sub['endpoint'], sub)
+            
+            taken = {sub['name'].lower() for sub in category['subcategories']}
+            for subcategory in category['subcategories']:
+                suggestion = suggestions.get(subcategory['endpoint'])
+                if not suggestion:
+                    continue
+                name = suggestion.get('name')
+                if isinstance(name, str) and name.strip() and name.strip().lower() not in taken:
+                    taken.discard(subcategory['name'].lower())
+                    subcategory['name'] = name.strip()
+                    subcategory['cli_commands'] = [re.sub(r'[^a-z0-9]+', '-', name.lower()).strip('-')]
+                    taken.add(subcategory['name'].lower())
+                if isinstance(suggestion.get('description'), str) and suggestion['description'].strip():
+                    subcategory['description'] = suggestion['description'].strip()
+    
+    async def analyze_github_issue(self, title: str, body: str, number: Optional[int] = None) -> Dict[str, Any]:
+        """Analyze GitHub issue, using the local classifier when it is confident and AI otherwise.
+        
+        With the issue number, near-duplicates of earlier issues are reported without analysis.
+        """
+        if number is not None:
+            duplicate = await issue_index.check_and_add(number, title, body)
+            if duplicate:
+                return self._get_duplicate_issue_analysis(duplicate)
+        
+        classification = self._classify_issue_locally(title, body)
+        if classification:
+            return classification.to_analysis()
+        
+        if not self._use_llm():
             logger.warning("AI analysis not available - using fallback issue analysis")
             return self._get_fallback_issue_analysis(title, body)
             
@@ -162,8 +487,8 @@ class AIAnalyzer:
             }}
             """
             
-            response = self.client.chat.completions.create(
-                model=self.model,
+            content = await self._complete(
+                "analyze_github_issue",
                 messages=[
                     {
                         "role": "system",
@@ -174,13 +499,16 @@ class AIAnalyzer:
                 response_format={"type": "json_object"}
             )
             
-            content = response.choices[0].message.content
-            return json.loads(content) if content else {
-                "type": "question",
-                "priority": "medium",
-                "category": "general",
-                "summary": "Issue analysis failed"
-            }
+            if not content:
+                return {
+                    "type": "question",
+                    "priority": "medium",
+                    "category": "general",
+                    "summary": "Issue analysis failed"
+                }
+            analysis = json.loads(content)
+            analysis['classified_by'] = 'llm'
+            return analysis
             
         except Exception as e:
             logger.error(f"Failed to analyze GitHub issue: {e}")
@@ -191,9 +519,22 @@ class AIAnalyzer:
                 "summary": "Issue analysis failed"
             }
     
+    def _classify_issue_locally(self, title: str, body: str) -> Optional[IssueClassification]:
+        """Local classification of an issue if the classifier is enabled and confident, else None"""
+        if not settings.issue_classifier_enabled:
+            return None
+        issue_classifier.refresh_in_background()
+        classification = issue_classifier.classify(title, body)
+        escalated = classification.confidence < settings.issue_classifier_confidence_threshold
+        issue_classifier.record(classification, escalated)
+        if escalated:
+            return None
+        logger.info(f"Issue classified locally as {classification.label} ({classification.confidence:.2f})")
+        return classification
+    
     async def generate_issue_response(self, analysis: Dict[str, Any]) -> Dict[str, Any]:
         """Generate appropriate response to GitHub issue"""
-        if not self.is_available():
+        if not self._use_llm():
             logger.warning("AI analysis not available - using fallback issue response")
             return self._get_fallback_issue_response(analysis)
             
@@ -218,8 +559,8 @@ class AIAnalyzer:
             }}
             """
             
-            response = self.client.chat.completions.create(
-                model=self.model,
+            content = await self._complete(
+                "generate_issue_response",
                 messages=[
                     {
                         "role": "system",
@@ -230,7 +571,6 @@ class AIAnalyzer:
                 response_format={"type": "json_object"}
             )
             
-            content = response.choices[0].message.content
             return json.loads(content) if content else {
                 "comment": "Thank you for reporting this issue. I'll analyze it and provide an update soon.",
                 "labels": ["needs-review"],
@@ -245,9 +585,153 @@ class AIAnalyzer:
                 "should_close": False
             }
     
+    async def triage_issue(self, title: str, body: str) -> Dict[str, Any]:
+        """Classify a GitHub issue and draft the reply to it in a single request.
+        
+        Returns {"analysis": ..., "response": ...} shaped like analyze_github_issue
+        and generate_issue_response.
+        """
+        triaged = await self.triage_issues([{'number': 0, 'title': title, 'body': body}])
+        return triaged[0]
+    
+    async def triage_issues(self, issues: List[Dict[str, Any]]) -> Dict[int, Dict[str, Any]]:
+        """Triage several GitHub issues, packing up to issue_triage_batch_size of them into each request.
+        
+        Issues the local classifier is confident about get its labels and a templated
+        reply without a request. Returns the triage of each issue keyed by issue number.
+        Issues missing from a batch reply are retried on their own; any that still fail
+        get the fallback triage.
+        """
+        triaged: Dict[int, Dict[str, Any]] = {}
+        escalated = []
+        for issue in issues:
+            classification = self._classify_issue_locally(issue.get('title', ''), issue.get('body') or '')
+            if classification:
+                triaged[issue['number']] = {'analysis': classification.to_analysis(),
+                                            'response': classification.to_response()}
+            else:
+                escalated.append(issue)
+        issues = escalated
+        if not issues:
+            return triaged
+        
+        if not self._use_llm():
+            logger.warning("AI analysis not available - using fallback issue triage")
+            triaged.update({issue['number']: self._get_fallback_triage(issue) for issue in issues})
+            return triaged
+        
+        batches = self._batch_issues(issues, settings.issue_triage_batch_size, settings.ai_analysis_shard_tokens)
+        semaphore = asyncio.Semaphore(max(1, settings.ai_analysis_concurrency))
+        
+        async def triage(batch: List[Dict[str, Any]]) -> Dict[int, Dict[str, Any]]:
+            async with semaphore:
+                return await self._triage_batch(batch)
+        
+        for result in await asyncio.gather(*(triage(batch) for batch in batches)):
+            triaged.update(result)
+        logger.info(f"Triaged {len(issues)} issues in {len(batches)} requests")
+        return triaged
+    
+    async def _triage_batch(self, batch: List[Dict[str, Any]]) -> Dict[int, Dict[str, Any]]:
+        """Triage one batch of issues in a single request"""
+        triaged: Dict[int, Dict[str, Any]] = {}
+        try:
+            prompt = f"""
+            Triage the following GitHub issues for the Site24x7 CLI project. For each issue,
+            classify it and write a helpful, professional reply that acknowledges the issue,
+            provides relevant information or a solution if possible, asks for clarification
+            if needed, and sets appropriate expectations.
+            
+            Issues:
+            {json.dumps([self._summarize_issue(issue) for issue in batch], indent=2)}
+            
+            Respond in JSON format with one entry per issue:
+            {{
+                "issues": [
+                    {{
+                        "number": 123,
+                        "analysis": {{
+                            "type": "bug|feature|question|documentation",
+                            "priority": "low|medium|high|critical",
+                            "category": "cli|api|documentation|installation",
+                            "is_duplicate": false,
+                            "requires_code_changes": true,
+                            "estimated_complexity": "simple|moderate|complex",
+                            "suggested_labels": ["bug", "priority-medium"],
+                            "can_be_automated": true,
+                            "summary": "Brief summary of the issue"
+                        }},
+                        "response": {{
+                            "comment": "The response comment text",
+                            "labels": ["suggested", "labels"],
+                            "should_close": false,
+                            "follow_up_needed": true
+                        }}
+                    }}
+                ]
+            }}
+            """
+            
+            content = await self._complete(
+                "triage_issues",
+                messages=[
+                    {
+                        "role": "system",
+                        "content": "You are an expert software maintainer triaging and responding to GitHub issues for a CLI project. Provide accurate classification and helpful, professional replies."
+                    },
+                    {"role": "user", "content": prompt}
+                ],
+                response_format={"type": "json_object"},
+                max_tokens=min(4000, 800 * len(batch))
+            )
+            
+            numbers = {issue['number'] for issue in batch}
+            for item in (json.loads(content) if content else {}).get('issues', []):
+                if not isinstance(item, dict) or item.get('number') not in numbers:
+                    continue
+                if isinstance(item.get('analysis'), dict) and isinstance(item.get('response'), dict):
+                    item['analysis']['classified_by'] = 'llm'
+                    triaged[item['number']] = {'analysis': item['analysis'], 'response': item['response']}
+            
+        except Exception as e:
+            logger.error(f"Failed to triage GitHub issues: {e}")
+        
+        for issue in batch:
+            if issue['number'] in triaged:
+                continue
+            if len(batch) > 1:
+                triaged.update(await self._triage_batch([issue]))
+            else:
+                triaged[issue['number']] = self._get_fallback_triage(issue)
+        return triaged
+    
+    def _batch_issues(self, issues: List[Dict[str, Any]], batch_size: int, token_budget: int) -> List[List[Dict[str, Any]]]:
+        """Split issues into batches of at most batch_size issues and token_budget prompt tokens"""
+        batches: List[List[Dict[str, Any]]] = []
+        batch: List[Dict[str, Any]] = []
+        batch_tokens = 0
+        for issue in issues:
+            tokens = self._estimate_tokens(self._summarize_issue(issue))
+            if batch and (len(batch) >= max(1, batch_size) or batch_tokens + tokens > token_budget):
+                batches.append(batch)
+                batch, batch_tokens = [], 0
+            batch.append(issue)
+            batch_tokens += tokens
+        if batch:
+            batches.append(batch)
+        return batches
+    
+    @staticmethod
+    def _summarize_issue(issue: Dict[str, Any]) -> Dict[str, Any]:
+        """The fields of an issue triage needs, with very long bodies shortened"""
+        body = issue.get('body') or 'No description provided'
+        if len(body) > ISSUE_BODY_PROMPT_CHARS:
+            body = body[:ISSUE_BODY_PROMPT_CHARS] + '\n[truncated]'
+        return {'number': issue['number'], 'title': issue.get('title', ''), 'body': body}
+    
     async def analyze_pull_request(self, title: str, body: str, files: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Analyze pull request using AI"""
-        if not self.is_available():
+        if not self._use_llm():
             logger.warning("AI analysis not available - using fallback PR analysis")
             return self._get_fallback_pr_analysis(title, body, files)
             
@@ -275,8 +759,8 @@ class AIAnalyzer:
             }}
             """
             
-            response = self.client.chat.completions.create(
-                model=self.model,
+            content = await self._complete(
+                "analyze_pull_request",
                 messages=[
                     {
                         "role": "system",
@@ -287,7 +771,6 @@ class AIAnalyzer:
                 response_format={"type": "json_object"}
             )
             
-            content = response.choices[0].message.content
             return json.loads(content) if content else {
                 "type": "improvement",
                 "impact": "medium",
@@ -304,7 +787,7 @@ class AIAnalyzer:
     
     async def generate_pr_response(self, analysis: Dict[str, Any]) -> Dict[str, Any]:
         """Generate appropriate response to pull request"""
-        if not self.is_available():
+        if not self._use_llm():
             logger.warning("AI analysis not available - using fallback PR response")
             return self._get_fallback_pr_response(analysis)
             
@@ -324,8 +807,8 @@ class AIAnalyzer:
             }}
             """
             
-            response = self.client.chat.completions.create(
-                model=self.model,
+            content = await self._complete(
+                "generate_pr_response",
                 messages=[
                     {
                         "role": "system",
@@ -336,7 +819,6 @@ class AIAnalyzer:
                 response_format={"type": "json_object"}
             )
             
-            content = response.choices[0].message.content
             return json.loads(content) if content else {
                 "comment": "Thank you for the contribution! I'll review this thoroughly and provide feedback.",
                 "approve": False,
@@ -353,7 +835,7 @@ class AIAnalyzer:
     
     async def generate_commit_message(self, changes: Dict[str, Any]) -> str:
         """Generate intelligent commit message based on changes"""
-        if not self.is_available():
+        if not self._use_llm():
             logger.warning("AI analysis not available - using fallback commit message")
             return self._get_fallback_commit_message(changes)
             
@@ -375,8 +857,8 @@ class AIAnalyzer:
             Provide just the commit message, no explanation.
             """
             
-            response = self.client.chat.completions.create(
-                model=self.model,
+            content = await self._complete(
+                "generate_commit_message",
                 messages=[
                     {
                         "role": "system",
@@ -387,62 +869,12 @@ class AIAnalyzer:
                 max_tokens=100
             )
             
-            content = response.choices[0].message.content
             return content.strip() if content else "AI Update: CLI improvements and fixes"
             
         except Exception as e:
             logger.error(f"Failed to generate commit message: {e}")
             return "AI Update: CLI improvements and fixes"
     
-    def _get_fallback_structure(self, documentation: Dict[str, Any]) -> Dict[str, Any]:
-        """Provide fallback structure if AI analysis fails"""
-        return {
-            "categories": [
-                {
-                    "name": "Monitor Management",
-                    "description": "Manage various types of monitors",
-                    "subcategories": [
-                        {
-                            "name": "Website Monitors",
-                            "endpoint": "/api/website_monitor",
-                            "operations": ["create", "read", "update", "delete"],
-                            "cli_commands": ["website"]
-                        },
-                        {
-                            "name": "API Monitors", 
-                            "endpoint": "/api/rest_api_monitor",
-                            "operations": ["create", "read", "update", "delete"],
-                            "cli_commands": ["api"]
-                        }
-                    ]
-                },
-                {
-                    "name": "Reports",
-                    "description": "Generate and retrieve reports",
-                    "subcategories": [
-                        {
-                            "name": "Performance Reports",
-                            "endpoint": "/api/reports/performance",
-                            "operations": ["read"],
-                            "cli_commands": ["performance"]
-                        }
-                    ]
-                }
-            ],
-            "common_parameters": {
-                "authentication": ["oauth_token"],
-                "pagination": ["page", "limit"],
-                "filtering": ["status", "type"]
-            },
-            "command_patterns": {
-                "list": "site24x7 <category> <resource> list",
-                "get": "site24x7 <category> <resource> get <id>",
-                "create": "site24x7 <category> <resource> create [options]",
-                "update": "site24x7 <category> <resource> update <id> [options]",
-                "delete": "site24x7 <category> <resource> delete <id>"
-            }
-        }
-    
     def _get_fallback_issue_analysis(self, title: str, body: str) -> Dict[str, Any]:
         """Provide fallback issue analysis when AI is not available"""
         # Simple keyword-based analysis
@@ -468,7 +900,25 @@ class AIAnalyzer:
             "estimated_complexity": "moderate",
             "suggested_labels": [issue_type, f"priority-{priority}"],
             "can_be_automated": False,
-            "summary": f"Automated analysis: {issue_type} issue requiring review"
+            "summary": f"Automated analysis: {issue_type} issue requiring review",
+            "classified_by": "fallback"
+        }
+    
+    def _get_duplicate_issue_analysis(self, duplicate: DuplicateMatch) -> Dict[str, Any]:
+        """Issue analysis of a likely duplicate of an earlier issue"""
+        return {
+            "type": "question",
+            "priority": "low",
+            "category": "general",
+            "is_duplicate": True,
+            "duplicate_of": duplicate.number,
+            "similarity": duplicate.similarity,
+            "requires_code_changes": False,
+            "estimated_complexity": "simple",
+            "suggested_labels": ["duplicate"],
+            "can_be_automated": True,
+            "summary": f"Possible duplicate of #{duplicate.number}",
+            "classified_by": "duplicate_index"
         }
     
     def _get_fallback_issue_response(self, analysis: Dict[str, Any]) -> Dict[str, Any]:
@@ -481,6 +931,11 @@ class AIAnalyzer:
             "follow_up_needed": True
         }
     
+    def _get_fallback_triage(self, issue: Dict[str, Any]) -> Dict[str, Any]:
+        """Provide fallback issue triage when AI is not available"""
+        analysis = self._get_fallback_issue_analysis(issue.get('title', ''), issue.get('body') or '')
+        return {'analysis': analysis, 'response': self._get_fallback_issue_response(analysis)}
+    
     def _get_fallback_pr_analysis(self, title: str, body: str, files: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Provide fallback PR analysis when AI is not available"""
         pr_type = "improvement"
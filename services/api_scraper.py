@@ -3,87 +3,287 @@ Site24x7 API Documentation Scraper
 Extracts comprehensive API endpoint information from Site24x7 documentation
 """
 
-import hashlib
+import asyncio
+import copy
+import json
 import logging
 import re
-from typing import Dict, List, Any, Optional
-import trafilatura
-import requests
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin, urlparse
+import time
+from contextlib import asynccontextmanager
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, List, Any, Optional, Tuple
+from xml.etree import ElementTree
+import httpx
+from urllib.parse import urljoin, urlparse, urldefrag
 
-from config import settings
-from database import APISnapshotManager, TaskLogger
+from config import PRIMARY_DATA_CENTER, SITE24X7_DATA_CENTERS, settings
+from database import APIPageDetailManager, APIPageManager, APISnapshotManager, ConfigurationManager, HTTPCacheManager, TaskLogger
+from services.documentation_page import DocumentationPage
+from services.spec_loader import StructuredSpecLoader
+from utils.helpers import generate_canonical_hash
 
 logger = logging.getLogger(__name__)
 
+# Fields that change between runs without the documentation itself changing; which data
+# centres documented an endpoint varies whenever one of them fails to crawl
+VOLATILE_DOCUMENTATION_FIELDS = frozenset({'scraped_at', 'data_centers', 'regions', 'doc_urls'})
+
+# Endpoint reference, optionally preceded by an HTTP method and/or an absolute API host
+ENDPOINT_PATTERN = re.compile(
+    r'(?:\b(?P<method>GET|POST|PUT|DELETE|PATCH)\s+)?'
+    r'(?:https?://[a-z0-9.-]+)?'
+    r'(?P<path>/api/[a-z_/]+)',
+    re.IGNORECASE
+)
+
+# Responses that mean the server wants us to slow down
+THROTTLE_STATUS_CODES = frozenset({429, 503})
+MAX_THROTTLE_RETRIES = 3
+MAX_RETRY_AFTER_SECONDS = 120.0
+
+# Latency increases smaller than this are treated as jitter, not congestion
+MIN_LATENCY_RISE_SECONDS = 0.05
+
+# Upper bound on sitemap files read per run, including sitemap index children
+MAX_SITEMAPS = 50
+
+# Header keywords identifying the columns of parameter and attribute tables,
+# checked in this order so "Parameter Type" is a type column, not a name column
+PARAMETER_COLUMN_KEYWORDS = (
+    ('required', ('mandatory', 'required')),
+    ('enum', ('allowed value', 'possible value', 'valid value', 'enum', 'values')),
+    ('type', ('type',)),
+    ('description', ('description', 'details', 'notes')),
+    ('name', ('parameter', 'attribute', 'field', 'name', 'param'))
+)
+PARAMETER_LOCATIONS = ('query', 'path', 'body')
+ENUM_IN_DESCRIPTION_PATTERN = re.compile(
+    r'(?:allowed|possible|valid|supported)\s+values?\s*(?:are|is|:)?\s*:?\s*(?P<values>[^.;]+)',
+    re.IGNORECASE
+)
+
+# Shared pool that keeps CPU-bound HTML parsing off the event loop thread
+_parse_pool: Optional[ProcessPoolExecutor] = None
+_parse_pool_workers = 0
+
+def _get_parse_pool(max_workers: int) -> Optional[ProcessPoolExecutor]:
+    """Get the shared parsing process pool, creating or resizing it as needed"""
+    global _parse_pool, _parse_pool_workers
+    
+    if max_workers <= 0:
+        return None
+    
+    if _parse_pool is None or _parse_pool_workers != max_workers:
+        shutdown_parse_pool()
+        _parse_pool = ProcessPoolExecutor(max_workers=max_workers)
+        _parse_pool_workers = max_workers
+        logger.info(f"Started HTML parsing pool with {max_workers} worker processes")
+    
+    return _parse_pool
+
+def shutdown_parse_pool() -> None:
+    """Shut down the shared parsing process pool"""
+    global _parse_pool, _parse_pool_workers
+    
+    if _parse_pool is not None:
+        _parse_pool.shutdown(wait=False, cancel_futures=True)
+        _parse_pool = None
+        _parse_pool_workers = 0
+
+def _parse_html_in_worker(page: DocumentationPage, method: str = '_parse_html') -> Tuple[Any, float]:
+    """Run one of the scraper's page parsing methods inside a pool worker process.
+    
+    The parsing helpers do not use instance state, so the scraper is created
+    without __init__ to avoid settings lookups and HTTP client setup.
+    Returns the parse result and the CPU time the worker spent on it.
+    """
+    parser = Site24x7APIScraper.__new__(Site24x7APIScraper)
+    start = time.process_time()
+    parsed = getattr(parser, method)(page)
+    return parsed, time.process_time() - start
+
+class CrawlRateController:
+    """AIMD controller for the number of concurrent documentation requests.
+    
+    The window grows by roughly one request per window of successful responses
+    and is halved on 429/503 responses, timeouts or when smoothed latency rises
+    well above the best latency seen. Retry-After pauses all new requests.
+    """
+    
+    def __init__(self, max_window: int, initial_window: int = 2, latency_tolerance: float = 2.0,
+                 decrease_factor: float = 0.5):
+        self.max_window = max(1, max_window)
+        self.window = float(min(initial_window, self.max_window))
+        self.latency_tolerance = latency_tolerance
+        self.decrease_factor = decrease_factor
+        self.in_flight = 0
+        self.min_latency: Optional[float] = None
+        self.smoothed_latency: Optional[float] = None
+        self.paused_until = 0.0
+        self.last_decrease = 0.0
+        self.started_at = time.monotonic()
+        self.completed = 0
+        self.throttled = 0
+        self.peak_window = self.window
+        self._condition = asyncio.Condition()
+    
+    async def acquire(self) -> None:
+        """Wait for a free slot in the window and for any Retry-After pause to pass"""
+        async with self._condition:
+            while self.in_flight >= int(self.window):
+                await self._condition.wait()
+            self.in_flight += 1
+        
+        delay = self.paused_until - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+    
+    async def release(self, latency: float, throttled: bool = False, retry_after: Optional[float] = None) -> None:
+        """Record a finished request and adjust the window"""
+        async with self._condition:
+            self.in_flight -= 1
+            now = time.monotonic()
+            
+            if throttled:
+                self.throttled += 1
+                if retry_after:
+                    self.paused_until = max(self.paused_until, now + retry_after)
+                self._decrease(now)
+            else:
+                self.completed += 1
+                self.min_latency = latency if self.min_latency is None else min(self.min_latency, latency)
+                self.smoothed_latency = latency if self.smoothed_latency is None else (
+                    0.8 * self.smoothed_latency + 0.2 * latency
+                )
+                latency_rise = self.smoothed_latency - self.min_latency
+                if (self.smoothed_latency > self.min_latency * self.latency_tolerance
+                        and latency_rise > MIN_LATENCY_RISE_SECONDS):
+                    self._decrease(now)
+                else:
+                    self.window = min(self.max_window, self.window + 1 / self.window)
+                    self.peak_window = max(self.peak_window, self.window)
+            
+            self._condition.notify_all()
+    
+    def _decrease(self, now: float) -> None:
+        """Cut the window, at most once per smoothed round trip so bursts count once"""
+        if now - self.last_decrease < (self.smoothed_latency or 0):
+            return
+        self.window = max(1.0, self.window * self.decrease_factor)
+        self.last_decrease = now
+        # Let latency re-settle at the new window before judging it again
+        self.smoothed_latency = self.min_latency
+        logger.info(f"Crawl window reduced to {int(self.window)}")
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get current window and throughput figures"""
+        elapsed = time.monotonic() - self.started_at
+        return {
+            'window': int(self.window),
+            'peak_window': int(self.peak_window),
+            'max_window': self.max_window,
+            'throttled_responses': self.throttled,
+            'min_latency_ms': round(self.min_latency * 1000, 1) if self.min_latency is not None else None,
+            'smoothed_latency_ms': round(self.smoothed_latency * 1000, 1) if self.smoothed_latency is not None else None,
+            'requests_per_second': round(self.completed / elapsed, 2) if elapsed > 0 else 0.0
+        }
+
 class Site24x7APIScraper:
     """Scraper for Site24x7 API documentation"""
     
-    def __init__(self):
+    def __init__(self, transport: Optional[httpx.AsyncBaseTransport] = None):
         self.base_url = settings.site24x7_docs_url
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.max_concurrency = max(1, int(settings.scraper_max_concurrency))
+        self.max_pages = max(1, int(settings.scraper_max_pages))
+        self.use_http_cache = bool(settings.scraper_http_cache_enabled)
+        self.parse_workers = max(0, int(settings.scraper_parse_workers))
+        self.discovery_mode = settings.scraper_discovery_mode
+        self.data_centers = dict(settings.scraper_data_centers)
+        # OpenAPI/Postman file or URL that replaces HTML scraping when set
+        self.spec_source = settings.site24x7_spec_source
+        # Data centre this instance crawls; set on the per-region copies
+        self.region = PRIMARY_DATA_CENTER
+        # Parses shared across data centre crawls, keyed by page content hash
+        self.shared_parses: Dict[str, asyncio.Future] = {}
+        self.shared_details: Dict[str, asyncio.Future] = {}
+        self.headers = {
             'User-Agent': 'Site24x7-CLI-Agent/1.0.0 (Autonomous Documentation Scraper)'
-        })
+        }
+        # Custom transport, e.g. to record or replay a scrape archive
+        self.transport = transport
+        self.client: Optional[httpx.AsyncClient] = None
+        self.rate_controller: Optional[CrawlRateController] = None
+        self.content_changed = True
+        self.needs_generation = True
+        self.last_content_hash: Optional[str] = None
+        self.last_change_set: Dict[str, List[str]] = {'added': [], 'removed': [], 'modified': []}
+        self.parse_cpu_seconds = 0.0
+        self.last_crawl_stats: Dict[str, Any] = {}
+        self.detail_stats: Dict[str, Any] = {}
     
     async def scrape_full_documentation(self) -> Dict[str, Any]:
         """Scrape complete API documentation"""
         try:
             TaskLogger.log("api_scraper", "started", "Starting comprehensive API documentation scrape")
             
-            # Get main documentation page
-            main_content = await self._fetch_page_content(self.base_url)
-            if not main_content:
-                raise Exception("Failed to fetch main documentation page")
-            
-            # Parse main page structure
-            soup = BeautifulSoup(main_content, 'html.parser')
-            
-            # Extract table of contents
-            toc_data = self._extract_table_of_contents(soup)
-            
-            # Extract all API endpoints and categories
-            endpoints = await self._extract_all_endpoints(soup)
-            
-            # Get detailed endpoint information
-            detailed_endpoints = await self._get_detailed_endpoint_info(endpoints)
-            
-            # Compile comprehensive documentation
-            documentation = {
-                'base_url': 'https://www.site24x7.com/api/',
-                'version': '2.0',
-                'authentication': {
-                    'type': 'OAuth 2.0',
-                    'header': 'Authorization: Zoho-oauthtoken [TOKEN]',
-                    'content_type': 'application/json;charset=UTF-8',
-                    'accept': 'application/json; version=2.0'
-                },
-                'categories': toc_data,
-                'endpoints': detailed_endpoints,
-                'http_methods': ['GET', 'POST', 'PUT', 'DELETE', 'PATCH', 'HEAD', 'PROPFIND'],
-                'scraped_at': self._get_current_timestamp(),
-                'total_endpoints': len(detailed_endpoints)
-            }
+            if self.spec_source:
+                documentation, crawl_stats = await self._load_structured_spec()
+            else:
+                documentation, crawl_stats = await self._scrape_html_documentation()
+            self.last_crawl_stats = crawl_stats
+            detailed_endpoints = documentation['endpoints']
             
             # Save snapshot
-            content_str = str(documentation)
-            content_hash = hashlib.md5(content_str.encode()).hexdigest()
+            content_hash = generate_canonical_hash(documentation, VOLATILE_DOCUMENTATION_FIELDS)
+            self.last_content_hash = content_hash
+            self.content_changed = APISnapshotManager.has_content_changed(content_hash)
+            
+            # The CLI is regenerated until a run generates and deploys it from this content,
+            # so a failed generation or deployment is retried even if the docs are unchanged.
+            # It is also regenerated once enrichment that missed the last generation is stored.
+            generated = APISnapshotManager.get_generated_snapshot()
+            self.needs_generation = (generated is None or generated['content_hash'] != content_hash
+                                     or bool(generated.get('enrichment_pending')))
+            if self.needs_generation:
+                self.last_change_set = self._compute_change_set(detailed_endpoints, generated)
+            else:
+                self.last_change_set = {'added': [], 'removed': [], 'modified': []}
             
-            if APISnapshotManager.has_content_changed(content_hash):
+            if self.content_changed:
+                if self.spec_source:
+                    summary = f"Successfully loaded {len(detailed_endpoints)} endpoints from structured spec {self.spec_source}"
+                else:
+                    summary = f"Successfully scraped {len(detailed_endpoints)} endpoints from {crawl_stats['pages_fetched']} pages"
+                
                 APISnapshotManager.save_snapshot(
-                    content_str, 
+                    json.dumps(documentation), 
                     content_hash, 
-                    len(detailed_endpoints)
+                    len(detailed_endpoints),
+                    self.last_change_set
                 )
                 TaskLogger.log(
                     "api_scraper", 
                     "completed", 
-                    f"Successfully scraped {len(detailed_endpoints)} endpoints",
-                    {"endpoints_count": len(detailed_endpoints), "content_hash": content_hash}
+                    summary,
+                    {
+                        "endpoints_count": len(detailed_endpoints),
+                        "content_hash": content_hash,
+                        "endpoints_added": len(self.last_change_set['added']),
+                        "endpoints_removed": len(self.last_change_set['removed']),
+                        "endpoints_modified": len(self.last_change_set['modified']),
+                        **crawl_stats
+                    }
                 )
             else:
-                TaskLogger.log("api_scraper", "no_changes", "No changes detected in API documentation")
+                TaskLogger.log(
+                    "api_scraper",
+                    "no_changes",
+                    "No changes detected in API documentation",
+                    {"content_hash": content_hash, **crawl_stats}
+                )
             
             return documentation
             
@@ -92,26 +292,627 @@ class Site24x7APIScraper:
             TaskLogger.log("api_scraper", "failed", str(e))
             raise
     
+    async def _scrape_html_documentation(self) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Build the documentation by crawling the HTML docs of every data centre"""
+        # Crawl every data centre's documentation tree starting from its main page
+        toc_data, endpoints, crawl_stats = await self._crawl_data_centers()
+        
+        # Get detailed endpoint information
+        detailed_endpoints = await self._get_detailed_endpoint_info(endpoints)
+        crawl_stats['detail_pages'] = self.detail_stats
+        
+        # Compile comprehensive documentation
+        documentation = {
+            'base_url': 'https://www.site24x7.com/api/',
+            'version': '2.0',
+            'authentication': {
+                'type': 'OAuth 2.0',
+                'header': 'Authorization: Zoho-oauthtoken [TOKEN]',
+                'content_type': 'application/json;charset=UTF-8',
+                'accept': 'application/json; version=2.0'
+            },
+            'categories': toc_data,
+            'endpoints': detailed_endpoints,
+            'data_centers': {
+                region: {
+                    'docs_url': region_stats['docs_url'],
+                    'api_url': SITE24X7_DATA_CENTERS.get(region, {}).get('api_url'),
+                    'endpoints_count': region_stats['endpoints_count']
+                }
+                for region, region_stats in crawl_stats['data_centers'].items()
+                if 'error' not in region_stats
+            },
+            'http_methods': ['GET', 'POST', 'PUT', 'DELETE', 'PATCH', 'HEAD', 'PROPFIND'],
+            'scraped_at': self._get_current_timestamp(),
+            'total_endpoints': len(detailed_endpoints)
+        }
+        
+        return documentation, crawl_stats
+    
+    async def _load_structured_spec(self) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Build the documentation from the configured OpenAPI spec or Postman collection"""
+        started = time.monotonic()
+        documentation = await StructuredSpecLoader(self.transport).load(self.spec_source)
+        documentation['scraped_at'] = self._get_current_timestamp()
+        stats = {
+            'source': documentation['source']['type'],
+            'spec_source': self.spec_source,
+            'load_seconds': round(time.monotonic() - started, 3)
+        }
+        return documentation, stats
+    
+    async def _crawl_data_centers(self) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], Dict[str, Any]]:
+        """Crawl the documentation of every configured data centre in parallel.
+        
+        Endpoints are merged into one catalog where each endpoint lists the data
+        centres documenting it. Pages with identical content across data centres
+        are parsed once. The table of contents comes from the primary data centre
+        when it is available. Fails only if no data centre could be crawled.
+        """
+        self.shared_parses = {}
+        self.shared_details = {}
+        roots = {
+            region: self.base_url if region == PRIMARY_DATA_CENTER else docs_url
+            for region, docs_url in (self.data_centers or {PRIMARY_DATA_CENTER: self.base_url}).items()
+        }
+        
+        async def crawl(region: str, docs_url: str):
+            regional = copy.copy(self)
+            regional.region = region
+            regional.base_url = docs_url
+            regional.parse_cpu_seconds = 0.0
+            try:
+                return await regional._crawl_documentation()
+            finally:
+                self.parse_cpu_seconds += regional.parse_cpu_seconds
+        
+        results = await asyncio.gather(
+            *(crawl(region, docs_url) for region, docs_url in roots.items()),
+            return_exceptions=True
+        )
+        
+        toc_data: List[Dict[str, Any]] = []
+        merged: Dict[str, Dict[str, Any]] = {}
+        stats: Dict[str, Any] = {
+            'pages_fetched': 0,
+            'pages_not_modified': 0,
+            'pages_parsed': 0,
+            'pages_skipped': 0,
+            'pages_deduplicated': 0,
+            'details_parsed': 0,
+            'data_centers': {}
+        }
+        errors = []
+        
+        for (region, docs_url), result in zip(roots.items(), results):
+            if isinstance(result, Exception):
+                logger.warning(f"Failed to crawl {region} documentation at {docs_url}: {result}")
+                stats['data_centers'][region] = {'docs_url': docs_url, 'error': str(result)}
+                errors.append(result)
+                continue
+            
+            region_toc, region_endpoints, region_stats = result
+            if not toc_data or region == PRIMARY_DATA_CENTER:
+                toc_data = region_toc
+            for key in ('pages_fetched', 'pages_not_modified', 'pages_parsed', 'pages_skipped', 'pages_deduplicated', 'details_parsed'):
+                stats[key] += region_stats[key]
+            stats['data_centers'][region] = {
+                'docs_url': docs_url,
+                'endpoints_count': len(region_endpoints),
+                **region_stats
+            }
+            
+            for endpoint in region_endpoints:
+                existing = merged.get(endpoint['path'])
+                if existing is None:
+                    merged[endpoint['path']] = dict(endpoint, regions=[region])
+                    continue
+                existing['methods'] = sorted(set(existing['methods']) | set(endpoint['methods']))
+                existing['doc_urls'] = sorted(set(existing['doc_urls']) | set(endpoint['doc_urls']))
+                existing['regions'] = sorted(set(existing['regions']) | {region})
+        
+        if len(errors) == len(roots):
+            raise errors[0]
+        
+        stats['parse_cpu_seconds'] = round(self.parse_cpu_seconds, 3)
+        endpoints = sorted(merged.values(), key=lambda e: e['path'])
+        return toc_data, endpoints, stats
+    
+    async def _crawl_documentation(self) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], Dict[str, Any]]:
+        """Crawl the documentation tree concurrently.
+        
+        In crawl mode pages are discovered by following table of contents links
+        from the main page. In sitemap mode the page set comes from the docs
+        sitemap and only pages whose lastmod moved are fetched.
+        
+        Returns the root page's table of contents, the endpoints found across all
+        pages and crawl statistics.
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        seen = set()
+        lastmods: Dict[str, Optional[str]] = {}
+        
+        toc_data: List[Dict[str, Any]] = []
+        endpoints: List[Dict[str, Any]] = []
+        stats = {
+            'discovery': 'crawl',
+            'pages_fetched': 0,
+            'pages_not_modified': 0,
+            'pages_parsed': 0,
+            'pages_skipped': 0,
+            'pages_deduplicated': 0,
+            'details_parsed': 0
+        }
+        self.parse_cpu_seconds = 0.0
+        root_key = self._normalize_url(self.base_url)
+        root_found = False
+        follow_links = True
+        
+        def schedule(url: str) -> None:
+            normalized = self._normalize_url(url)
+            if normalized in seen or len(seen) >= self.max_pages:
+                return
+            seen.add(normalized)
+            queue.put_nowait(url)
+        
+        def use_page(url: str, parsed: Dict[str, Any]) -> None:
+            nonlocal root_found, toc_data
+            # Remember where each endpoint is documented for the detail stage
+            endpoints.extend(dict(endpoint, doc_urls=[url]) for endpoint in parsed['endpoints'])
+            if self._normalize_url(url) == root_key:
+                root_found = True
+                toc_data = parsed['toc']
+        
+        async def worker():
+            while True:
+                url = await queue.get()
+                try:
+                    page = await self._fetch_page(url)
+                    if not page:
+                        continue
+                    stats['pages_fetched'] += 1
+                    if page.not_modified:
+                        stats['pages_not_modified'] += 1
+                    
+                    # Parse each page as soon as it arrives
+                    parsed, outcome = await self._parse_page(page, lastmods.get(url))
+                    if outcome == 'parsed':
+                        stats['pages_parsed'] += 1
+                    elif outcome == 'deduplicated':
+                        stats['pages_deduplicated'] += 1
+                    use_page(url, parsed)
+                    
+                    # Pages parsed before their details were cached still need them extracted
+                    if parsed['endpoints']:
+                        _, detail_outcome = await self._extract_page_details(page)
+                        if detail_outcome == 'parsed':
+                            stats['details_parsed'] += 1
+                    
+                    if follow_links:
+                        for link in self._collect_toc_links(parsed['toc'], url):
+                            schedule(link)
+                except Exception as e:
+                    logger.warning(f"Failed to process documentation page {url}: {e}")
+                finally:
+                    queue.task_done()
+        
+        async with self._http_session() as rate_controller:
+            workers = []
+            try:
+                sitemap_entries = None
+                if self.discovery_mode == 'sitemap':
+                    sitemap_entries = await self._load_sitemap_entries()
+                    if sitemap_entries is None:
+                        logger.warning("No usable docs sitemap found - falling back to link crawling")
+                
+                if sitemap_entries is None:
+                    schedule(self.base_url)
+                else:
+                    stats['discovery'] = 'sitemap'
+                    follow_links = False
+                    for url, lastmod in sitemap_entries.items():
+                        if len(seen) >= self.max_pages:
+                            break
+                        page_record = APIPageManager.get(url)
+                        if lastmod and page_record and page_record.get('lastmod') == lastmod:
+                            # Unchanged since the previous run - no request needed
+                            seen.add(self._normalize_url(url))
+                            stats['pages_skipped'] += 1
+                            use_page(url, page_record['parsed'])
+                        else:
+                            lastmods[url] = lastmod
+                            schedule(url)
+                    
+                    if not root_found and root_key not in seen:
+                        root_record = APIPageManager.get(self.base_url)
+                        if root_record:
+                            use_page(self.base_url, root_record['parsed'])
+                        else:
+                            schedule(self.base_url)
+                
+                workers = [asyncio.create_task(worker()) for _ in range(self.max_concurrency)]
+                await queue.join()
+            finally:
+                for task in workers:
+                    task.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+                stats['rate_control'] = rate_controller.get_stats()
+                stats['parse_cpu_seconds'] = round(self.parse_cpu_seconds, 3)
+        
+        if not root_found:
+            raise Exception("Failed to fetch main documentation page")
+        
+        logger.info(
+            f"Crawled {stats['pages_fetched']} {self.region} documentation pages via {stats['discovery']} "
+            f"({stats['pages_not_modified']} not modified, {stats['pages_parsed']} re-parsed, "
+            f"{stats['pages_skipped']} skipped by lastmod) "
+            f"at {stats['rate_control']['requests_per_second']} req/s, "
+            f"window {stats['rate_control']['window']}/{stats['rate_control']['max_window']}"
+        )
+        # Pages complete in arbitrary order, so sort for a stable result
+        unique_endpoints = sorted(
+            self._deduplicate_endpoints(endpoints),
+            key=lambda e: (e['path'], e['methods'])
+        )
+        return toc_data, unique_endpoints, stats
+    
+    @asynccontextmanager
+    async def _http_session(self):
+        """Open the shared HTTP client and crawl rate controller used by _request"""
+        limits = httpx.Limits(
+            max_connections=self.max_concurrency,
+            max_keepalive_connections=self.max_concurrency
+        )
+        async with httpx.AsyncClient(
+            headers=self.headers,
+            limits=limits,
+            timeout=30,
+            follow_redirects=True,
+            transport=self.transport
+        ) as client:
+            self.client = client
+            # Workers cover the ceiling; the controller decides how many fetch at once
+            self.rate_controller = CrawlRateController(self.max_concurrency)
+            try:
+                yield self.rate_controller
+            finally:
+                self.client = None
+                self.rate_controller = None
+    
+    async def _load_sitemap_entries(self) -> Optional[Dict[str, Optional[str]]]:
+        """Load documentation page URLs and their lastmod values from the docs sitemaps.
+        
+        Returns None when no sitemap with documentation pages could be found.
+        """
+        sitemap_urls = await self._discover_sitemap_urls()
+        entries: Dict[str, Optional[str]] = {}
+        pending = list(sitemap_urls)
+        visited = set()
+        
+        while pending and len(visited) < MAX_SITEMAPS:
+            sitemap_url = pending.pop(0)
+            if sitemap_url in visited:
+                continue
+            visited.add(sitemap_url)
+            
+            page = await self._fetch_page(sitemap_url)
+            if not page:
+                continue
+            
+            try:
+                page_entries, child_sitemaps = self._parse_sitemap(page.raw)
+            except ElementTree.ParseError as e:
+                logger.warning(f"Invalid sitemap {sitemap_url}: {e}")
+                continue
+            
+            pending.extend(child_sitemaps)
+            for url, lastmod in page_entries:
+                if self._is_documentation_url(url):
+                    entries[url] = lastmod
+        
+        if not entries:
+            return None
+        
+        # Remember where the sitemap lives so later runs skip robots.txt
+        if self.region == PRIMARY_DATA_CENTER and not settings.scraper_sitemap_urls:
+            ConfigurationManager.set('scraper_sitemap_urls', sitemap_urls)
+        
+        return dict(sorted(entries.items()))
+    
+    async def _discover_sitemap_urls(self) -> List[str]:
+        """Get configured sitemap URLs, or discover them from robots.txt"""
+        # Configured sitemaps describe the primary data centre only
+        configured = settings.scraper_sitemap_urls if self.region == PRIMARY_DATA_CENTER else None
+        if configured:
+            return [configured] if isinstance(configured, str) else list(configured)
+        
+        base = urlparse(self.base_url)
+        origin = f"{base.scheme}://{base.netloc}"
+        
+        robots_txt = await self._fetch_page_content(f"{origin}/robots.txt")
+        sitemap_urls = [
+            line.split(':', 1)[1].strip()
+            for line in robots_txt.splitlines()
+            if line.lower().startswith('sitemap:')
+        ]
+        
+        return sitemap_urls or [f"{origin}/sitemap.xml"]
+    
+    def _parse_sitemap(self, content: bytes) -> Tuple[List[Tuple[str, Optional[str]]], List[str]]:
+        """Parse a sitemap or sitemap index into (url, lastmod) pairs and child sitemap URLs"""
+        root = ElementTree.fromstring(content)
+        pages = []
+        child_sitemaps = []
+        
+        for element in root:
+            tag = element.tag.rsplit('}', 1)[-1]
+            fields = {child.tag.rsplit('}', 1)[-1]: (child.text or '').strip() for child in element}
+            if not fields.get('loc'):
+                continue
+            if tag == 'url':
+                pages.append((fields['loc'], fields.get('lastmod') or None))
+            elif tag == 'sitemap':
+                child_sitemaps.append(fields['loc'])
+        
+        return pages, child_sitemaps
+    
+    async def _parse_page(self, page: DocumentationPage, lastmod: Optional[str] = None) -> Tuple[Dict[str, Any], str]:
+        """Parse a documentation page, reusing an earlier parse of the same content.
+        
+        Returns the parse result and how it was obtained: 'stored' when the page
+        is unchanged, 'deduplicated' when another page (possibly in another data
+        centre) had identical content, or 'parsed'.
+        """
+        page_record = APIPageManager.get(page.url)
+        if page_record and page_record['content_hash'] == page.content_hash:
+            if lastmod and page_record.get('lastmod') != lastmod:
+                APIPageManager.save(page.url, page.content_hash, page_record['parsed'], lastmod)
+            return page_record['parsed'], 'stored'
+        
+        shared = self.shared_parses.get(page.content_hash)
+        if shared is not None:
+            parsed = await shared
+            APIPageManager.save(page.url, page.content_hash, parsed, lastmod)
+            return parsed, 'deduplicated'
+        
+        same_content = APIPageManager.find_by_hash(page.content_hash)
+        if same_content:
+            APIPageManager.save(page.url, page.content_hash, same_content['parsed'], lastmod)
+            return same_content['parsed'], 'deduplicated'
+        
+        future = asyncio.get_running_loop().create_future()
+        self.shared_parses[page.content_hash] = future
+        try:
+            parsed = await self._parse_html_offloaded(page)
+        except Exception as e:
+            del self.shared_parses[page.content_hash]
+            future.set_exception(e)
+            # Nobody may be waiting on the future, so mark its exception as seen
+            future.exception()
+            raise
+        # Parameter tables come from the same parse and are cached for the detail stage
+        parameters = parsed.pop('parameters', None)
+        if parameters is not None:
+            APIPageDetailManager.save(page.content_hash, parameters)
+        future.set_result(parsed)
+        
+        APIPageManager.save(page.url, page.content_hash, parsed, lastmod)
+        return parsed, 'parsed'
+    
+    async def _extract_page_details(self, page: DocumentationPage) -> Tuple[Dict[str, List[Dict[str, Any]]], str]:
+        """Extract a page's parameter tables, parsing each page content once.
+        
+        Returns the parameters keyed by endpoint path and whether they were
+        'cached' or 'parsed'.
+        """
+        cached = APIPageDetailManager.get(page.content_hash)
+        if cached is not None:
+            return cached, 'cached'
+        
+        shared = self.shared_details.get(page.content_hash)
+        if shared is not None:
+            return await shared, 'cached'
+        
+        future = asyncio.get_running_loop().create_future()
+        self.shared_details[page.content_hash] = future
+        try:
+            parameters = await self._parse_html_offloaded(page, '_extract_parameter_tables')
+        except Exception as e:
+            del self.shared_details[page.content_hash]
+            future.set_exception(e)
+            future.exception()
+            raise
+        future.set_result(parameters)
+        APIPageDetailManager.save(page.content_hash, parameters)
+        return parameters, 'parsed'
+    
+    async def _parse_html_offloaded(self, page: DocumentationPage, method: str = '_parse_html') -> Any:
+        """Run a page parsing method in the process pool, falling back to inline parsing"""
+        pool = _get_parse_pool(self.parse_workers)
+        if pool is not None:
+            try:
+                loop = asyncio.get_running_loop()
+                parsed, cpu_seconds = await loop.run_in_executor(pool, _parse_html_in_worker, page, method)
+                self.parse_cpu_seconds += cpu_seconds
+                return parsed
+            except BrokenProcessPool:
+                logger.warning("HTML parsing pool broke - restarting it and parsing inline")
+                shutdown_parse_pool()
+        
+        start = time.process_time()
+        parsed = getattr(self, method)(page)
+        self.parse_cpu_seconds += time.process_time() - start
+        return parsed
+    
+    def _parse_html(self, page: DocumentationPage) -> Dict[str, Any]:
+        """Parse page HTML into its table of contents and endpoints, plus the parameter
+        tables of pages that document endpoints, so a page is parsed only once"""
+        parsed = {
+            'toc': self._extract_table_of_contents(page),
+            'endpoints': self._extract_all_endpoints(page)
+        }
+        if parsed['endpoints']:
+            parsed['parameters'] = self._extract_parameter_tables(page)
+        return parsed
+    
+    def _compute_change_set(self, endpoints: List[Dict[str, Any]], previous_snapshot: Optional[Dict[str, Any]]) -> Dict[str, List[str]]:
+        """Compare endpoints with a previous snapshot and list added, removed and modified paths"""
+        previous_endpoints = []
+        if previous_snapshot:
+            try:
+                previous_endpoints = json.loads(previous_snapshot['content']).get('endpoints', [])
+            except (json.JSONDecodeError, AttributeError):
+                # Snapshots from older versions were not stored as JSON
+                logger.info("Previous snapshot is not JSON - treating all endpoints as added")
+        
+        previous = {e['path']: generate_canonical_hash(e, VOLATILE_DOCUMENTATION_FIELDS) for e in previous_endpoints}
+        current = {e['path']: generate_canonical_hash(e, VOLATILE_DOCUMENTATION_FIELDS) for e in endpoints}
+        
+        return {
+            'added': sorted(current.keys() - previous.keys()),
+            'removed': sorted(previous.keys() - current.keys()),
+            'modified': sorted(
+                path for path in current.keys() & previous.keys()
+                if current[path] != previous[path]
+            )
+        }
+    
+    def _collect_toc_links(self, toc_items: List[Dict[str, Any]], page_url: str) -> List[str]:
+        """Flatten table of contents items into absolute links inside the documentation tree"""
+        links = []
+        stack = list(toc_items)
+        
+        while stack:
+            item = stack.pop()
+            stack.extend(item.get('subcategories', []))
+            
+            href = item.get('url')
+            if not href or href.startswith(('mailto:', 'javascript:')):
+                continue
+            
+            absolute = urldefrag(urljoin(page_url, href))[0]
+            if self._is_documentation_url(absolute):
+                links.append(absolute)
+        
+        return links
+    
+    def _is_documentation_url(self, url: str) -> bool:
+        """Check whether a URL belongs to the documentation tree being scraped"""
+        base = urlparse(self.base_url)
+        parsed = urlparse(url)
+        return (
+            parsed.scheme in ('http', 'https')
+            and parsed.netloc == base.netloc
+            and parsed.path.startswith(base.path)
+        )
+    
+    def _normalize_url(self, url: str) -> str:
+        """Normalize URL for crawl deduplication"""
+        parsed = urlparse(urldefrag(url)[0])
+        path = parsed.path.rstrip('/') or '/'
+        return f"{parsed.netloc.lower()}{path}"
+    
     async def _fetch_page_content(self, url: str) -> str:
-        """Fetch page content using trafilatura for better text extraction"""
+        """Fetch page HTML, or an empty string if the page could not be fetched"""
+        page = await self._fetch_page(url)
+        return page.html if page else ""
+    
+    async def _fetch_page(self, url: str) -> Optional[DocumentationPage]:
+        """Fetch a page, revalidating against the HTTP cache.
+        
+        Returns None if the page could not be fetched. Nothing is parsed here;
+        consumers build the views they need from the returned page.
+        """
         try:
+            cached = HTTPCacheManager.get(url) if self.use_http_cache else None
+            request_headers = {}
+            if cached:
+                if cached['etag']:
+                    request_headers['If-None-Match'] = cached['etag']
+                if cached['last_modified']:
+                    request_headers['If-Modified-Since'] = cached['last_modified']
+            
             # First get raw HTML
-            response = self.session.get(url, timeout=30)
+            response = await self._request(url, request_headers)
+            
+            if response.status_code == 304 and cached:
+                HTTPCacheManager.mark_validated(url)
+                # Rebuild from the stored bytes so content_hash matches the original 200;
+                # rows cached before raw bytes were kept fall back to the decoded text
+                if cached.get('raw') is not None:
+                    return DocumentationPage(url, bytes(cached['raw']), cached.get('encoding'), not_modified=True)
+                return DocumentationPage.from_text(url, cached['content'], not_modified=True)
+            
             response.raise_for_status()
+            page = DocumentationPage(url, response.content, response.charset_encoding)
             
-            # Use trafilatura for clean text extraction
-            text_content = trafilatura.extract(response.text)
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+            if self.use_http_cache and (etag or last_modified):
+                HTTPCacheManager.save_response(url, page.html, etag, last_modified, page.raw, page.encoding)
             
-            # Also return raw HTML for structure parsing
-            return response.text
+            return page
             
         except Exception as e:
             logger.error(f"Failed to fetch content from {url}: {e}")
-            return ""
+            return None
     
-    def _extract_table_of_contents(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
+    async def _request(self, url: str, headers: Optional[Dict[str, str]] = None) -> httpx.Response:
+        """Issue a GET request through the crawl client, or a one-off client outside a crawl"""
+        if self.client is None:
+            async with httpx.AsyncClient(
+                headers=self.headers,
+                timeout=30,
+                follow_redirects=True,
+                transport=self.transport
+            ) as client:
+                return await client.get(url, headers=headers)
+        
+        if self.rate_controller is None:
+            return await self.client.get(url, headers=headers)
+        
+        for attempt in range(MAX_THROTTLE_RETRIES + 1):
+            await self.rate_controller.acquire()
+            started = time.monotonic()
+            try:
+                response = await self.client.get(url, headers=headers)
+            except httpx.TimeoutException:
+                await self.rate_controller.release(time.monotonic() - started, throttled=True)
+                raise
+            except Exception:
+                await self.rate_controller.release(time.monotonic() - started)
+                raise
+            
+            throttled = response.status_code in THROTTLE_STATUS_CODES
+            retry_after = self._parse_retry_after(response.headers.get('Retry-After')) if throttled else None
+            await self.rate_controller.release(time.monotonic() - started, throttled, retry_after)
+            
+            if not throttled or attempt == MAX_THROTTLE_RETRIES:
+                return response
+            logger.info(f"Throttled with HTTP {response.status_code} on {url} - retrying")
+        
+        return response
+    
+    def _parse_retry_after(self, value: Optional[str]) -> Optional[float]:
+        """Parse a Retry-After header given either as seconds or as an HTTP date"""
+        if not value:
+            return None
+        try:
+            seconds = float(value)
+        except ValueError:
+            try:
+                retry_at = parsedate_to_datetime(value)
+            except (TypeError, ValueError):
+                return None
+            if retry_at.tzinfo is None:
+                retry_at = retry_at.replace(tzinfo=timezone.utc)
+            seconds = (retry_at - datetime.now(timezone.utc)).total_seconds()
+        return min(max(seconds, 0.0), MAX_RETRY_AFTER_SECONDS)
+    
+    def _extract_table_of_contents(self, page: DocumentationPage) -> List[Dict[str, Any]]:
         """Extract hierarchical table of contents structure"""
         categories = []
+        soup = page.soup
         
         # Find the main navigation or TOC structure
         toc_elements = soup.find_all(['ul', 'ol'], class_=re.compile(r'toc|nav|menu', re.I))
@@ -208,41 +1009,50 @@ class Site24x7APIScraper:
             }
         ]
     
-    async def _extract_all_endpoints(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
+    def _extract_all_endpoints(self, page: DocumentationPage) -> List[Dict[str, Any]]:
         """Extract all API endpoints from documentation"""
-        endpoints = []
+        endpoints: Dict[str, Dict[str, Any]] = {}
         
-        # Look for API endpoint patterns in the content
-        text_content = soup.get_text()
-        
-        # Common API endpoint patterns
-        api_patterns = [
-            r'/api/[a-z_/]+',
-            r'https://www\.site24x7\.com/api/[a-z_/]+',
-            r'GET|POST|PUT|DELETE|PATCH\s+/api/[a-z_/]+'
-        ]
-        
-        for pattern in api_patterns:
-            matches = re.findall(pattern, text_content, re.IGNORECASE)
-            for match in matches:
-                endpoint_path = match.replace('https://www.site24x7.com', '').strip()
-                if endpoint_path.startswith('/api/'):
-                    endpoints.append({
+        # Scan text nodes one at a time instead of joining the whole page text
+        for text in page.strings:
+            for match in ENDPOINT_PATTERN.finditer(text):
+                endpoint_path = self._normalize_endpoint_path(match.group('path'))
+                if not endpoint_path.startswith('/api/'):
+                    continue
+                
+                endpoint = endpoints.get(endpoint_path)
+                if endpoint is None:
+                    endpoint = endpoints[endpoint_path] = {
                         'path': endpoint_path,
                         'methods': self._determine_http_methods(endpoint_path),
                         'category': self._categorize_endpoint(endpoint_path)
-                    })
+                    }
+                
+                # Keep HTTP methods documented explicitly next to the path
+                method = match.group('method')
+                if method and method.upper() not in endpoint['methods']:
+                    endpoint['methods'] = sorted(set(endpoint['methods']) | {method.upper()})
         
-        # Remove duplicates
-        seen = set()
-        unique_endpoints = []
+        return list(endpoints.values())
+    
+    def _normalize_endpoint_path(self, path: str) -> str:
+        """Normalize endpoint path so case and trailing slashes do not create duplicates"""
+        return re.sub(r'/{2,}', '/', path.lower()).rstrip('/')
+    
+    def _deduplicate_endpoints(self, endpoints: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Merge endpoints sharing a path, keeping first occurrence order"""
+        unique_endpoints: Dict[str, Dict[str, Any]] = {}
         for endpoint in endpoints:
-            key = (endpoint['path'], tuple(endpoint['methods']))
-            if key not in seen:
-                seen.add(key)
-                unique_endpoints.append(endpoint)
+            existing = unique_endpoints.get(endpoint['path'])
+            if existing is None:
+                unique_endpoints[endpoint['path']] = dict(endpoint)
+                continue
+            if set(endpoint['methods']) - set(existing['methods']):
+                existing['methods'] = sorted(set(existing['methods']) | set(endpoint['methods']))
+            if endpoint.get('doc_urls'):
+                existing['doc_urls'] = sorted(set(existing.get('doc_urls', [])) | set(endpoint['doc_urls']))
         
-        return unique_endpoints
+        return list(unique_endpoints.values())
     
     def _determine_http_methods(self, endpoint_path: str) -> List[str]:
         """Determine HTTP methods for an endpoint based on its path"""
@@ -257,7 +1067,7 @@ class Site24x7APIScraper:
         if any(keyword in endpoint_path.lower() for keyword in ['delete', 'remove']):
             methods.append('DELETE')
         
-        return list(set(methods))
+        return sorted(set(methods))
     
     def _categorize_endpoint(self, endpoint_path: str) -> str:
         """Categorize endpoint based on its path"""
@@ -283,10 +1093,14 @@ class Site24x7APIScraper:
     
     async def _get_detailed_endpoint_info(self, endpoints: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Get detailed information for each endpoint"""
+        page_urls = sorted({url for endpoint in endpoints for url in endpoint.get('doc_urls', [])})
+        page_parameters = await self._extract_detail_pages(page_urls)
         detailed_endpoints = []
         
         for endpoint in endpoints:
             try:
+                parameter_details = self._collect_endpoint_parameters(endpoint, page_parameters)
+                
                 # Add detailed information based on endpoint analysis
                 detailed_info = {
                     'path': endpoint['path'],
@@ -294,7 +1108,10 @@ class Site24x7APIScraper:
                     'category': endpoint['category'],
                     'name': self._generate_endpoint_name(endpoint['path']),
                     'description': self._generate_endpoint_description(endpoint['path']),
-                    'parameters': self._extract_endpoint_parameters(endpoint['path']),
+                    'parameters': self._extract_endpoint_parameters(endpoint['path'], parameter_details),
+                    'parameter_details': parameter_details,
+                    'doc_urls': endpoint.get('doc_urls', []),
+                    'regions': endpoint.get('regions', [PRIMARY_DATA_CENTER]),
                     'auth_required': True,  # All Site24x7 API endpoints require auth
                     'rate_limited': True
                 }
@@ -307,6 +1124,161 @@ class Site24x7APIScraper:
         
         return detailed_endpoints
     
+    async def _extract_detail_pages(self, page_urls: List[str]) -> Dict[str, Dict[str, List[Dict[str, Any]]]]:
+        """Extract parameter tables from endpoint documentation pages concurrently.
+        
+        Parse results are cached by page content hash. The crawl extracts them for
+        every page it fetches, so only pages whose details are missing, such as
+        pages skipped by lastmod before details were cached, are requested here.
+        
+        Returns each page's parameters keyed by endpoint path.
+        """
+        stats = {'pages': len(page_urls), 'cache_hits': 0, 'fetched': 0, 'parsed': 0}
+        started = time.monotonic()
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def extract(url: str) -> Tuple[str, Dict[str, List[Dict[str, Any]]]]:
+            page_record = APIPageManager.get(url)
+            if page_record:
+                cached = APIPageDetailManager.get(page_record['content_hash'])
+                if cached is not None:
+                    stats['cache_hits'] += 1
+                    return url, cached
+            
+            async with semaphore:
+                page = await self._fetch_page(url)
+            if not page:
+                return url, {}
+            stats['fetched'] += 1
+            
+            parameters, outcome = await self._extract_page_details(page)
+            stats['parsed' if outcome == 'parsed' else 'cache_hits'] += 1
+            return url, parameters
+        
+        results: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+        if page_urls:
+            async with self._http_session():
+                for outcome in await asyncio.gather(*(extract(url) for url in page_urls), return_exceptions=True):
+                    if isinstance(outcome, Exception):
+                        logger.warning(f"Failed to extract endpoint details: {outcome}")
+                        continue
+                    url, parameters = outcome
+                    results[url] = parameters
+        
+        stats['seconds'] = round(time.monotonic() - started, 3)
+        self.detail_stats = stats
+        logger.info(
+            f"Extracted endpoint details from {stats['pages']} pages in {stats['seconds']}s "
+            f"({stats['cache_hits']} cached, {stats['fetched']} fetched, {stats['parsed']} parsed)"
+        )
+        return results
+    
+    def _extract_parameter_tables(self, page: DocumentationPage) -> Dict[str, List[Dict[str, Any]]]:
+        """Parse the parameter and attribute tables on a page, keyed by endpoint path.
+        
+        Each table belongs to the closest endpoint mentioned before it. Tables
+        without a preceding endpoint are kept under an empty key.
+        """
+        parameters: Dict[str, List[Dict[str, Any]]] = {}
+        
+        for table in page.soup.find_all('table'):
+            rows = self._parse_parameter_table(table)
+            if not rows:
+                continue
+            
+            endpoint_path = ''
+            mention = table.find_previous(string=ENDPOINT_PATTERN)
+            if mention:
+                match = ENDPOINT_PATTERN.search(mention)
+                endpoint_path = self._normalize_endpoint_path(match.group('path'))
+            
+            heading = table.find('caption') or table.find_previous(re.compile(r'^h[1-6]$'))
+            heading_text = heading.get_text(' ', strip=True).lower() if heading else ''
+            location = next((loc for loc in PARAMETER_LOCATIONS if loc in heading_text), None)
+            if location is None:
+                location = 'attribute' if 'attribute' in heading_text or 'response' in heading_text else 'body'
+            
+            for row in rows:
+                row['location'] = location
+            parameters.setdefault(endpoint_path, []).extend(rows)
+        
+        return parameters
+    
+    def _parse_parameter_table(self, table) -> List[Dict[str, Any]]:
+        """Parse one table into parameter records, or nothing if it is not a parameter table"""
+        rows = table.find_all('tr')
+        if len(rows) < 2:
+            return []
+        
+        columns: Dict[str, int] = {}
+        for index, cell in enumerate(rows[0].find_all(['th', 'td'])):
+            header = cell.get_text(' ', strip=True).lower()
+            for field, keywords in PARAMETER_COLUMN_KEYWORDS:
+                if field not in columns and any(keyword in header for keyword in keywords):
+                    columns[field] = index
+                    break
+        
+        if 'name' not in columns or not columns.keys() & {'type', 'required', 'description'}:
+            return []
+        
+        parameters = []
+        for row in rows[1:]:
+            cells = [cell.get_text(' ', strip=True) for cell in row.find_all(['th', 'td'])]
+            
+            def column(field: str) -> str:
+                index = columns.get(field)
+                return cells[index] if index is not None and index < len(cells) else ''
+            
+            name = column('name')
+            # Some pages flag mandatory parameters with an asterisk
+            starred = name.endswith('*')
+            name = name.rstrip('*').strip()
+            if not name or ' ' in name:
+                continue
+            
+            description = column('description')
+            if 'required' in columns:
+                required = column('required').lower() in ('yes', 'true', 'mandatory', 'required', 'y')
+            else:
+                lowered = description.lower()
+                required = starred or (('mandatory' in lowered or 'required' in lowered) and 'optional' not in lowered)
+            
+            enum_text = column('enum')
+            if not enum_text:
+                enum_match = ENUM_IN_DESCRIPTION_PATTERN.search(description)
+                enum_text = enum_match.group('values') if enum_match else ''
+            enum = [
+                value.strip().strip('"\'`')
+                for value in re.split(r'[,|\n]|\bor\b', enum_text)
+                if value.strip().strip('"\'`')
+            ]
+            
+            parameters.append({
+                'name': name,
+                'type': column('type').lower() or None,
+                'required': required or starred,
+                'enum': enum,
+                'description': description
+            })
+        
+        return parameters
+    
+    def _collect_endpoint_parameters(self, endpoint: Dict[str, Any],
+                                     page_parameters: Dict[str, Dict[str, List[Dict[str, Any]]]]) -> List[Dict[str, Any]]:
+        """Gather the documented parameters of an endpoint from the pages it appears on"""
+        collected: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        
+        for url in endpoint.get('doc_urls', []):
+            parameters = page_parameters.get(url, {})
+            rows = list(parameters.get(endpoint['path'], []))
+            # Tables before any endpoint mention belong to the page's only endpoint
+            if parameters.get('') and set(parameters) <= {'', endpoint['path']}:
+                rows.extend(parameters[''])
+            for row in rows:
+                collected.setdefault((row['location'], row['name']), row)
+        
+        return list(collected.values())
+    
     def _generate_endpoint_name(self, path: str) -> str:
         """Generate human-readable name for endpoint"""
         parts = path.strip('/').split('/')
@@ -327,14 +1299,23 @@ class Site24x7APIScraper:
         else:
             return f"Perform {name} operations"
     
-    def _extract_endpoint_parameters(self, path: str) -> Dict[str, Any]:
-        """Extract common parameters for endpoint"""
+    def _extract_endpoint_parameters(self, path: str, parameter_details: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+        """Extract parameter names for endpoint, preferring those documented on its pages"""
         params = {
             'query': [],
             'path': [],
             'body': []
         }
         
+        documented = [p for p in parameter_details or [] if p['location'] in params]
+        if documented:
+            for parameter in documented:
+                params[parameter['location']].append(parameter['name'])
+            for name in re.findall(r'\{([^}]+)\}', path):
+                if name not in params['path']:
+                    params['path'].append(name)
+            return params
+        
         # Common query parameters
         if 'monitor' in path.lower():
             params['query'].extend(['monitor_id', 'group_id', 'location_profile_id'])
@@ -11,9 +11,10 @@ from typing import Dict, List, Any, Optional
 from datetime import datetime
 from jinja2 import Environment, FileSystemLoader
 
-from config import settings
+from config import PRIMARY_DATA_CENTER, SITE24X7_DATA_CENTERS, settings
 from database import CLIVersionManager, TaskLogger
 from services.ai_analyzer import AIAnalyzer
+from services.llm_usage import llm_task
 
 logger = logging.getLogger(__name__)
 
@@ -24,13 +25,23 @@ class CLIGenerator:
         self.ai_analyzer = AIAnalyzer()
         self.template_env = Environment(loader=FileSystemLoader('cli_templates'))
         
-    async def generate_cli_from_documentation(self, documentation: Dict[str, Any]) -> Dict[str, Any]:
-        """Generate complete CLI project from API documentation"""
+    async def generate_cli_from_documentation(self, documentation: Dict[str, Any], change_set: Optional[Dict[str, List[str]]] = None) -> Dict[str, Any]:
+        """Generate complete CLI project from API documentation
+        
+        ``change_set`` lists the endpoint paths added, removed or modified since the
+        last generated snapshot; it is recorded with the generated version.
+        """
         try:
             TaskLogger.log("cli_generator", "started", "Starting CLI generation from documentation")
             
-            # Analyze documentation with AI
-            analyzed_structure = await self.ai_analyzer.analyze_api_structure(documentation)
+            if documentation.get('cli_structure'):
+                # Structured specs already describe the command structure
+                analyzed_structure = documentation['cli_structure']
+                logger.info("Using command structure from structured spec - skipping AI analysis")
+            else:
+                # Analyze documentation with AI
+                with llm_task("cli_generator"):
+                    analyzed_structure = await self.ai_analyzer.analyze_api_structure(documentation)
             
             # Generate CLI command structure
             command_structure = self._generate_command_structure(analyzed_structure)
@@ -52,6 +63,8 @@ class CLIGenerator:
                 'files': all_files,
                 'command_structure': command_structure,
                 'endpoints_covered': len(documentation.get('endpoints', [])),
+                'changes': change_set,
+                'enrichment_pending': analyzed_structure.get('enrichment_pending', False),
                 'generated_at': datetime.utcnow().isoformat()
             }
             
@@ -66,7 +79,11 @@ class CLIGenerator:
                 "cli_generator", 
                 "completed", 
                 f"Generated CLI with {len(all_files)} files covering {len(documentation.get('endpoints', []))} endpoints",
-                {"version": version, "files_count": len(all_files)}
+                {
+                    "version": version,
+                    "files_count": len(all_files),
+                    "changes": {k: len(v) for k, v in change_set.items()} if change_set else None
+                }
             )
             
             return cli_project
@@ -90,7 +107,7 @@ class CLIGenerator:
             
             structure['subcommands'][category_name] = {
                 'name': category_name,
-                'description': f"Manage {category['name']}",
+                'description': category.get('description') or f"Manage {category['name']}",
                 'subcommands': {}
             }
             
@@ -100,7 +117,8 @@ class CLIGenerator:
                 
                 structure['subcommands'][category_name]['subcommands'][sub_name] = {
                     'name': sub_name,
-                    'description': f"Manage {subcategory['name']}",
+                    'description': subcategory.get('description') or f"Manage {subcategory['name']}",
+                    'endpoint': subcategory.get('endpoint', f"/api/{sub_name}"),
                     'operations': self._generate_crud_operations(subcategory)
                 }
         
@@ -115,8 +133,8 @@ class CLIGenerator:
     
     def _generate_crud_operations(self, subcategory: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Generate CRUD operations for a subcategory"""
-        operations = []
         base_endpoint = subcategory.get('endpoint', '')
+        item_endpoint = subcategory.get('item_endpoint') or f"{base_endpoint}/{{id}}"
         
         # Standard CRUD operations
         crud_ops = [
@@ -129,7 +147,7 @@ class CLIGenerator:
             {
                 'name': 'get',
                 'method': 'GET', 
-                'endpoint': f"{base_endpoint}/{{id}}",
+                'endpoint': item_endpoint,
                 'description': f"Get specific {subcategory['name']} by ID"
             },
             {
@@ -141,18 +159,24 @@ class CLIGenerator:
             {
                 'name': 'update',
                 'method': 'PUT',
-                'endpoint': f"{base_endpoint}/{{id}}",
+                'endpoint': item_endpoint,
                 'description': f"Update {subcategory['name']}"
             },
             {
                 'name': 'delete',
                 'method': 'DELETE',
-                'endpoint': f"{base_endpoint}/{{id}}",
+                'endpoint': item_endpoint,
                 'description': f"Delete {subcategory['name']}"
             }
         ]
         
-        return crud_ops
+        # Keep only the operations the structure declares ("read" is the get command)
+        declared = {'get' if op == 'read' else op for op in subcategory.get('operations', [])}
+        if 'item_endpoint' not in subcategory:
+            # Scraped paths end before their {id} segments, so item operations can't be ruled out
+            declared |= {'get', 'update', 'delete'}
+        supported = [op for op in crud_ops if op['name'] in declared]
+        return supported or crud_ops
     
     async def _generate_cli_files(self, command_structure: Dict[str, Any], documentation: Dict[str, Any]) -> Dict[str, str]:
         """Generate all CLI Python files"""
@@ -196,14 +220,16 @@ import requests
 from rich.console import Console
 from rich.table import Table
 
+from .config import Config
+
 console = Console()
 
 class Site24x7Client:
     """Base client for Site24x7 API interactions"""
     
-    def __init__(self, oauth_token: str = None):
+    def __init__(self, oauth_token: str = None, data_center: str = None):
         self.oauth_token = oauth_token or os.getenv('SITE24X7_OAUTH_TOKEN')
-        self.base_url = 'https://www.site24x7.com/api'
+        self.base_url = Config.get_base_url(data_center)
         self.session = requests.Session()
         
         if self.oauth_token:
@@ -480,6 +506,10 @@ if __name__ == '__main__':
     
     def _generate_config_module(self) -> str:
         """Generate configuration module"""
+        data_center_urls = "".join(
+            f"        '{code}': '{data_center['api_url']}',\n"
+            for code, data_center in SITE24X7_DATA_CENTERS.items()
+        )
         return '''"""
 Configuration management for Site24x7 CLI
 """
@@ -490,8 +520,10 @@ from typing import Optional
 class Config:
     """CLI configuration"""
     
-    DEFAULT_BASE_URL = 'https://www.site24x7.com/api'
-    DEFAULT_OUTPUT_FORMAT = 'table'
+    DATA_CENTER_API_URLS = {
+''' + data_center_urls + f"""    }}
+    DEFAULT_DATA_CENTER = '{PRIMARY_DATA_CENTER}'
+""" + '''    DEFAULT_OUTPUT_FORMAT = 'table'
     
     @classmethod
     def get_oauth_token(cls) -> Optional[str]:
@@ -499,9 +531,23 @@ class Config:
         return os.getenv('SITE24X7_OAUTH_TOKEN')
     
     @classmethod
-    def get_base_url(cls) -> str:
-        """Get API base URL"""
-        return os.getenv('SITE24X7_BASE_URL', cls.DEFAULT_BASE_URL)
+    def get_data_center(cls) -> str:
+        """Get the data centre hosting the account (us, eu, in, au or jp)"""
+        return os.getenv('SITE24X7_DATA_CENTER', cls.DEFAULT_DATA_CENTER).lower()
+    
+    @classmethod
+    def get_base_url(cls, data_center: Optional[str] = None) -> str:
+        """Get API base URL, from SITE24X7_BASE_URL or the account's data centre"""
+        base_url = os.getenv('SITE24X7_BASE_URL')
+        if base_url:
+            return base_url
+        data_center = (data_center or cls.get_data_center()).lower()
+        if data_center not in cls.DATA_CENTER_API_URLS:
+            raise ValueError(
+                f"Unknown data centre '{data_center}', expected one of: "
+                + ", ".join(cls.DATA_CENTER_API_URLS)
+            )
+        return cls.DATA_CENTER_API_URLS[data_center]
     
     @classmethod
     def get_output_format(cls) -> str:
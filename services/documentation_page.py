@@ -0,0 +1,70 @@
+"""
+Documentation Page for Site24x7 Documentation Scraper
+Holds a fetched page's raw bytes and builds its parsed views on demand
+"""
+
+import hashlib
+import importlib.util
+from functools import cached_property
+from typing import List, Optional
+
+import trafilatura
+from bs4 import BeautifulSoup
+
+# BeautifulSoup loads lxml itself when asked for it, so only check that it is installed
+HTML_PARSER = 'lxml' if importlib.util.find_spec('lxml') else 'html.parser'
+
+class DocumentationPage:
+    """A fetched documentation page.
+
+    The BeautifulSoup tree, text views and content hash are each computed at most
+    once and only when a consumer asks for them, so every extractor shares one
+    parse and a page that is only hashed is never parsed.
+    """
+
+    def __init__(self, url: str, raw: bytes, encoding: Optional[str] = None, not_modified: bool = False):
+        self.url = url
+        self.raw = raw
+        # Declared charset, if any; None lets the HTML parser detect it
+        self.encoding = encoding
+        # Whether the server answered 304 and the body came from the HTTP cache
+        self.not_modified = not_modified
+
+    @classmethod
+    def from_text(cls, url: str, text: str, not_modified: bool = False) -> 'DocumentationPage':
+        """Create a page from already decoded HTML"""
+        return cls(url, text.encode('utf-8'), 'utf-8', not_modified)
+
+    def __getstate__(self):
+        # Only ship the raw page to parse workers, never the memoized views
+        return {'url': self.url, 'raw': self.raw, 'encoding': self.encoding, 'not_modified': self.not_modified}
+
+    @cached_property
+    def html(self) -> str:
+        """Decoded page HTML"""
+        return self.raw.decode(self.encoding or 'utf-8', errors='replace')
+
+    @cached_property
+    def content_hash(self) -> str:
+        """BLAKE2b hash of the raw page bytes"""
+        return hashlib.blake2b(self.raw, digest_size=16).hexdigest()
+
+    @cached_property
+    def soup(self) -> BeautifulSoup:
+        """Parsed HTML tree"""
+        return BeautifulSoup(self.raw, HTML_PARSER, from_encoding=self.encoding)
+
+    @cached_property
+    def strings(self) -> List[str]:
+        """Visible text nodes in document order (scripts, styles and comments excluded)"""
+        return list(self.soup.strings)
+
+    @cached_property
+    def text(self) -> str:
+        """Plain text of the whole page"""
+        return ' '.join(s.strip() for s in self.strings if s.strip())
+
+    @cached_property
+    def main_text(self) -> Optional[str]:
+        """Main article text with navigation and boilerplate removed"""
+        return trafilatura.extract(self.html)
@@ -21,6 +21,8 @@ except ImportError:
 from config import settings
 from database import GitHubOperationLogger, TaskLogger
 from services.ai_analyzer import AIAnalyzer
+from services.llm_cache import LLMResponseCache
+from services.llm_usage import llm_task
 
 logger = logging.getLogger(__name__)
 
@@ -274,6 +276,7 @@ This project is open source and available under the MIT License.
             return {
                 'status': 'success',
                 'files_deployed': len(cli_project.get('files', {})),
+                'files_failed': sum(1 for result in deployment_results if result.startswith('Failed')),
                 'results': deployment_results
             }
             
@@ -293,18 +296,36 @@ This project is open source and available under the MIT License.
             
             results = {
                 'issues_handled': 0,
+                'issues_skipped': 0,
                 'prs_handled': 0,
                 'actions': []
             }
+            cache_before = LLMResponseCache.stats()
             
-            # Handle open issues
+            # Handle open issues; ones analyzed before and not edited since are skipped
+            analyzed_issues = GitHubOperationLogger.get_analyzed_issues()
             open_issues = self.repo.get_issues(state='open')
             for issue in open_issues:
+                analyzed = analyzed_issues.get(issue.number)
+                if analyzed and (analyzed.get('title'), analyzed.get('body')) == (issue.title, issue.body or ""):
+                    results['issues_skipped'] += 1
+                    continue
                 try:
                     # Use AI to analyze and respond to issue
-                    analysis = await self.ai_analyzer.analyze_github_issue(
-                        issue.title,
-                        issue.body or ""
+                    with llm_task("github_manager"):
+                        analysis = await self.ai_analyzer.analyze_github_issue(
+                            issue.title,
+                            issue.body or "",
+                            number=issue.number
+                        )
+                    GitHubOperationLogger.log(
+                        "issue_analysis",
+                        "completed",
+                        message=f"Analyzed issue #{issue.number}",
+                        details={
+                            'issue': {'number': issue.number, 'title': issue.title, 'body': issue.body or ""},
+                            'analysis': analysis
+                        }
                     )
                     
                     if analysis.get('response'):
@@ -326,11 +347,12 @@ This project is open source and available under the MIT License.
             for pr in open_prs:
                 try:
                     # Use AI to review PR
-                    analysis = await self.ai_analyzer.analyze_pull_request(
-                        pr.title,
-                        pr.body or "",
-                        [{"filename": file.filename, "changes": file.changes} for file in pr.get_files()]
-                    )
+                    with llm_task("github_manager"):
+                        analysis = await self.ai_analyzer.analyze_pull_request(
+                            pr.title,
+                            pr.body or "",
+                            [{"filename": file.filename, "changes": file.changes} for file in pr.get_files()]
+                        )
                     
                     if analysis.get('review_comment'):
                         pr.create_review(body=analysis['review_comment'])
@@ -346,6 +368,8 @@ This project is open source and available under the MIT License.
                     logger.error(f"Failed to handle PR #{pr.number}: {e}")
                     results['actions'].append(f"Failed to handle PR #{pr.number}: {str(e)}")
             
+            results['llm_cache'] = LLMResponseCache.usage_since(cache_before)
+            
             GitHubOperationLogger.log(
                 "maintenance",
                 "completed",
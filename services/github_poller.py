@@ -9,6 +9,8 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
 
 from database import ConfigurationManager, TaskLogger, GitHubOperationLogger
+from services.issue_index import DuplicateMatch, issue_index
+from services.llm_usage import llm_task
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +21,7 @@ class GitHubPoller:
         self.github = None
         self.repo = None
         self.last_check = {}
+        self.ai_analyzer = None
         self._initialize_github()
     
     def _initialize_github(self):
@@ -105,9 +108,10 @@ class GitHubPoller:
                         'assignees': [assignee.login for assignee in issue.assignees]
                     }
                     new_issues.append(issue_data)
-                    
-                    # Process new issue
-                    await self._handle_new_issue(issue_data)
+            
+            # Process new issues together so a burst is triaged in batched requests
+            if new_issues:
+                await self._handle_new_issues(new_issues)
             
             self._update_last_check('issues')
             return new_issues
@@ -237,54 +241,113 @@ class GitHubPoller:
     
     async def _handle_new_issue(self, issue_data: Dict[str, Any]):
         """Handle a new issue"""
+        await self._handle_new_issues([issue_data])
+    
+    async def _handle_new_issues(self, issues: List[Dict[str, Any]]):
+        """Handle new issues, classifying and replying to each with one combined triage"""
         try:
             # Check if auto-response is enabled
             auto_respond = ConfigurationManager.get('enable_issue_auto_response', True)
             if not auto_respond:
                 return
             
-            # Log the new issue
+            for issue_data in issues:
+                # Log the new issue
+                GitHubOperationLogger.log(
+                    "issue_detected",
+                    "new",
+                    message=f"New issue #{issue_data['number']}: {issue_data['title']}",
+                    details=issue_data
+                )
+                
+                logger.info(f"New issue detected: #{issue_data['number']} - {issue_data['title']}")
+            
+            # Near-duplicates of earlier issues get a short pointer instead of a triage
+            remaining = []
+            for issue_data in issues:
+                duplicate = await issue_index.check_and_add(
+                    issue_data['number'], issue_data.get('title', ''), issue_data.get('body') or ''
+                )
+                if duplicate:
+                    await self._respond_to_duplicate(issue_data, duplicate)
+                else:
+                    remaining.append(issue_data)
+            issues = remaining
+            if not issues:
+                return
+            
+            # Generate AI responses to the issues
+            try:
+                if self.ai_analyzer is None:
+                    from services.ai_analyzer import AIAnalyzer
+                    self.ai_analyzer = AIAnalyzer()
+                
+                with llm_task("github_poller"):
+                    if len(issues) == 1:
+                        triaged = {issues[0]['number']: await self.ai_analyzer.triage_issue(
+                            issues[0].get('title', ''),
+                            issues[0].get('body', '') or 'No description provided'
+                        )}
+                    else:
+                        triaged = await self.ai_analyzer.triage_issues(issues)
+            except Exception as ai_error:
+                logger.error(f"AI triage failed for {len(issues)} issues: {ai_error}")
+                triaged = {}
+            
+            for issue_data in issues:
+                await self._respond_to_issue(issue_data, triaged.get(issue_data['number']))
+            
+        except Exception as e:
+            logger.error(f"Error handling new issues: {e}")
+    
+    async def _respond_to_duplicate(self, issue_data: Dict[str, Any], duplicate: DuplicateMatch):
+        """Point a likely duplicate issue at the earlier one"""
+        comment = f"""Thank you for opening this issue! 🤖
+
+This looks like a possible duplicate of #{duplicate.number}. If it's the same problem, please follow that issue for updates. If it's different, let us know what sets it apart and a maintainer will take a look."""
+        try:
+            await self._post_issue_comment(issue_data['number'], comment)
             GitHubOperationLogger.log(
-                "issue_detected",
-                "new",
-                message=f"New issue #{issue_data['number']}: {issue_data['title']}",
-                details=issue_data
+                "issue_duplicate",
+                "posted",
+                message=f"Issue #{issue_data['number']} is a possible duplicate of #{duplicate.number}",
+                details={'issue_number': issue_data['number'], 'duplicate_of': duplicate.number,
+                         'similarity': duplicate.similarity, 'vector_kind': duplicate.kind}
             )
+            logger.info(f"Issue #{issue_data['number']} flagged as possible duplicate of #{duplicate.number}")
+        except Exception as e:
+            logger.error(f"Failed to post duplicate notice to issue #{issue_data['number']}: {e}")
+    
+    async def _respond_to_issue(self, issue_data: Dict[str, Any], triage: Optional[Dict[str, Any]]):
+        """Post the triaged reply to an issue, or a generic acknowledgement if triage failed"""
+        try:
+            if triage is None:
+                raise Exception("no triage result")
             
-            logger.info(f"New issue detected: #{issue_data['number']} - {issue_data['title']}")
+            analysis, response_data = triage['analysis'], triage['response']
             
-            # Generate AI response to the issue
-            try:
-                from services.ai_analyzer import AIAnalyzer
-                ai_analyzer = AIAnalyzer()
+            # Post the comment to GitHub
+            if response_data.get('comment'):
+                await self._post_issue_comment(issue_data['number'], response_data['comment'])
                 
-                # Analyze the issue
-                analysis = await ai_analyzer.analyze_github_issue(
-                    issue_data.get('title', ''),
-                    issue_data.get('body', '') or 'No description provided'
+                GitHubOperationLogger.log(
+                    "issue_response",
+                    "posted",
+                    message=f"AI response posted to issue #{issue_data['number']}",
+                    details={
+                        'issue': {k: issue_data.get(k) for k in ('number', 'title', 'body')},
+                        'analysis': analysis,
+                        'response': response_data
+                    }
                 )
                 
-                # Generate response
-                response_data = await ai_analyzer.generate_issue_response(analysis)
-                
-                # Post the comment to GitHub
-                if response_data.get('comment'):
-                    await self._post_issue_comment(issue_data['number'], response_data['comment'])
-                    
-                    GitHubOperationLogger.log(
-                        "issue_response",
-                        "posted",
-                        message=f"AI response posted to issue #{issue_data['number']}",
-                        details={'analysis': analysis, 'response': response_data}
-                    )
-                    
-                    logger.info(f"AI response posted to issue #{issue_data['number']}")
-                
-            except Exception as ai_error:
-                logger.error(f"AI response generation failed for issue #{issue_data['number']}: {ai_error}")
-                
-                # Post a simple fallback response
-                fallback_comment = """Thank you for opening this issue! 🤖
+                logger.info(f"AI response posted to issue #{issue_data['number']}")
+            
+        except Exception as ai_error:
+            logger.error(f"AI response generation failed for issue #{issue_data['number']}: {ai_error}")
+            
+            # Post a simple fallback response
+            fallback_comment = """Thank you for opening this issue! 🤖
 
 I'm the Site24x7 CLI AI agent, and I've detected your issue. While I'm currently having trouble generating a detailed response, I want to acknowledge that I've received your issue and it will be reviewed.
 
@@ -294,15 +357,12 @@ For immediate assistance with installation issues, please check:
 3. Any error messages during installation
 
 A human maintainer will review this issue soon."""
-                
-                try:
-                    await self._post_issue_comment(issue_data['number'], fallback_comment)
-                    logger.info(f"Fallback response posted to issue #{issue_data['number']}")
-                except Exception as fallback_error:
-                    logger.error(f"Failed to post fallback response: {fallback_error}")
             
-        except Exception as e:
-            logger.error(f"Error handling new issue: {e}")
+            try:
+                await self._post_issue_comment(issue_data['number'], fallback_comment)
+                logger.info(f"Fallback response posted to issue #{issue_data['number']}")
+            except Exception as fallback_error:
+                logger.error(f"Failed to post fallback response: {fallback_error}")
     
     async def _handle_new_pr(self, pr_data: Dict[str, Any]):
         """Handle a new pull request"""
@@ -0,0 +1,333 @@
+"""
+Local Issue Classifier
+CPU-only first tier of issue analysis: a compiled keyword automaton plus a hashed
+bag-of-words linear model trained on past LLM analyses from github_operations
+"""
+
+import json
+import logging
+import math
+import re
+import threading
+import time
+import zlib
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from config import settings
+from database import GitHubOperationLogger, IssueClassificationManager
+
+logger = logging.getLogger(__name__)
+
+# Keywords per label of each analysis field; matched at word starts, so "crash" also matches "crashes"
+ISSUE_KEYWORDS = {
+    'type': {
+        'bug': ['bug', 'error', 'fail', 'crash', 'broken', 'exception', 'traceback', 'not working',
+                'does not work', "doesn't work", 'regression', 'wrong', 'unexpected'],
+        'feature': ['feature', 'enhancement', 'add support', 'please add', 'would be nice', 'would like',
+                    'feature request', 'support for', 'improve', 'allow'],
+        'question': ['how do', 'how to', 'how can', 'question', 'is it possible', 'is there a way',
+                     'what is', 'can i', 'help'],
+        'documentation': ['documentation', 'docs', 'readme', 'typo', 'docstring', 'usage example']
+    },
+    'category': {
+        'installation': ['install', 'pip', 'setup.py', 'requirements', 'dependency', 'dependencies',
+                         'python version', 'virtualenv', 'venv', 'modulenotfounderror', 'importerror'],
+        'cli': ['command', 'cli', 'flag', 'argument', 'option', 'subcommand', 'output', 'usage:'],
+        'api': ['api', 'endpoint', 'oauth', 'token', 'status code', 'http', 'rate limit', 'unauthorized'],
+        'documentation': ['documentation', 'docs', 'readme', 'typo', 'docstring']
+    }
+}
+
+# Replies to issues triaged locally, by issue type
+ISSUE_REPLY_TEMPLATES = {
+    'bug': (
+        "Thank you for reporting this bug! 🤖\n\n"
+        "It has been triaged as a {category} issue. If you haven't already, please add the CLI version, "
+        "the exact command you ran and the full error output so we can reproduce it. "
+        "A maintainer will follow up."
+    ),
+    'feature': (
+        "Thank you for the feature request! 🤖\n\n"
+        "It has been triaged as a {category} enhancement. Maintainers will consider it for an upcoming "
+        "release; a short description of your use case helps us prioritise it."
+    ),
+    'question': (
+        "Thanks for your question! 🤖\n\n"
+        "It has been triaged as a {category} question. `site24x7 --help` and the README cover the "
+        "available commands and their options. A maintainer will follow up if you need more help."
+    ),
+    'documentation': (
+        "Thanks for pointing out this documentation issue! 🤖\n\n"
+        "We'll review the {category} documentation and update it. A maintainer will follow up."
+    )
+}
+
+# Label used when nothing points anywhere
+DEFAULT_LABELS = {'type': 'question', 'category': 'general'}
+
+# github_operations entries that carry an issue analysis
+ANALYSIS_OPERATIONS = ['issue_analysis', 'issue_response']
+
+FEATURE_DIMENSIONS = 2 ** 18
+MAX_TRAINING_EXAMPLES = 1000
+TRAINING_EPOCHS = 6
+LEARNING_RATE = 0.5
+BODY_CHARS = 4000
+# Minimum time between checks for new LLM analyses to train on
+RETRAIN_INTERVAL_SECONDS = 300
+
+class KeywordAutomaton:
+    """Finds the keywords of every label in one pass of a single compiled pattern"""
+
+    def __init__(self, keywords: Dict[str, List[str]]):
+        self._labels = {keyword.lower(): label for label, words in keywords.items() for keyword in words}
+        # Longest first, so "feature request" wins over "feature"
+        alternatives = sorted(self._labels, key=len, reverse=True)
+        self._pattern = re.compile(r'\b(' + '|'.join(re.escape(k) for k in alternatives) + r')', re.IGNORECASE)
+
+    def match(self, text: str) -> Counter:
+        """Keyword hits per label"""
+        return Counter(self._labels[m.group(1).lower()] for m in self._pattern.finditer(text))
+
+class HashedLinearModel:
+    """Multinomial logistic regression over hashed sparse features"""
+
+    def __init__(self, labels: List[str]):
+        self.labels = labels
+        self.weights: Dict[str, Dict[int, float]] = {label: {} for label in labels}
+
+    def predict(self, features: Dict[int, float]) -> Dict[str, float]:
+        """Probability of each label"""
+        scores = {
+            label: sum(weights.get(f, 0.0) * v for f, v in features.items())
+            for label, weights in self.weights.items()
+        }
+        top = max(scores.values())
+        exp = {label: math.exp(score - top) for label, score in scores.items()}
+        total = sum(exp.values())
+        return {label: value / total for label, value in exp.items()}
+
+    def fit(self, examples: List[Tuple[Dict[int, float], str]]) -> None:
+        """Train with plain SGD on the cross-entropy loss"""
+        for epoch in range(TRAINING_EPOCHS):
+            rate = LEARNING_RATE / (1 + epoch)
+            for features, target in examples:
+                probabilities = self.predict(features)
+                for label, probability in probabilities.items():
+                    gradient = probability - (1.0 if label == target else 0.0)
+                    if abs(gradient) < 1e-6:
+                        continue
+                    weights = self.weights[label]
+                    for f, v in features.items():
+                        weights[f] = weights.get(f, 0.0) - rate * gradient * v
+
+@dataclass
+class IssueClassification:
+    """Local classification of an issue"""
+    type: str
+    category: str
+    confidence: float
+
+    @property
+    def label(self) -> str:
+        return f"{self.type}/{self.category}"
+
+    def to_analysis(self) -> Dict[str, Any]:
+        """Issue analysis shaped like AIAnalyzer.analyze_github_issue's"""
+        priority = "high" if self.type == "bug" else "medium"
+        return {
+            "type": self.type,
+            "priority": priority,
+            "category": self.category,
+            "is_duplicate": False,
+            "requires_code_changes": self.type in ["bug", "feature"],
+            "estimated_complexity": "moderate",
+            "suggested_labels": [self.type, f"priority-{priority}"],
+            "can_be_automated": False,
+            "summary": f"Classified locally as a {self.type} issue about {self.category}",
+            "classified_by": "local",
+            "confidence": round(self.confidence, 3)
+        }
+    
+    def to_response(self) -> Dict[str, Any]:
+        """Templated reply shaped like AIAnalyzer.generate_issue_response's"""
+        template = ISSUE_REPLY_TEMPLATES.get(self.type, ISSUE_REPLY_TEMPLATES['question'])
+        return {
+            "comment": template.format(category=self.category),
+            "labels": self.to_analysis()["suggested_labels"],
+            "should_close": False,
+            "follow_up_needed": True
+        }
+
+class IssueClassifier:
+    """Labels issues with their type and category and how sure it is.
+
+    Keyword hits alone give a conservative confidence. Once enough past LLM
+    analyses are logged, a linear model trained on them (with the keyword hits
+    as extra features) decides instead. The model is retrained in a background
+    thread when new LLM analyses appear, at most every RETRAIN_INTERVAL_SECONDS.
+    """
+
+    def __init__(self):
+        self._automata = {field: KeywordAutomaton(keywords) for field, keywords in ISSUE_KEYWORDS.items()}
+        self._models: Dict[str, HashedLinearModel] = {}
+        # Newest logged analysis already looked at for training
+        self._checked_through: Optional[int] = None
+        self._checked_at = 0.0
+        self._training = threading.Lock()
+        self.examples = 0
+
+    def classify(self, title: str, body: str) -> IssueClassification:
+        """Classify an issue; confidence is that of the less certain field"""
+        text = f"{title}\n{(body or '')[:BODY_CHARS]}"
+        hits = {field: automaton.match(text) for field, automaton in self._automata.items()}
+        features = self._features(title, body, hits)
+
+        labels, confidences = {}, []
+        for field in ISSUE_KEYWORDS:
+            model = self._models.get(field)
+            if model is not None:
+                probabilities = model.predict(features)
+                labels[field] = max(probabilities, key=probabilities.get)
+                confidences.append(probabilities[labels[field]])
+            elif hits[field]:
+                label, count = hits[field].most_common(1)[0]
+                labels[field] = label
+                # Needs several agreeing hits and no competing ones to be sure
+                confidences.append(count / (sum(hits[field].values()) + 1))
+            else:
+                labels[field] = DEFAULT_LABELS[field]
+                confidences.append(0.0)
+
+        return IssueClassification(labels['type'], labels['category'], min(confidences))
+
+    def record(self, classification: IssueClassification, escalated: bool) -> None:
+        """Log a decision for the escalation rate"""
+        try:
+            IssueClassificationManager.record(classification.label, classification.confidence, escalated,
+                                              settings.llm_usage_retention_days)
+        except Exception as e:
+            logger.warning(f"Failed to record issue classification: {e}")
+
+    def refresh_in_background(self) -> None:
+        """Start refresh in a thread unless one is running or the last check was recent"""
+        if self._training.locked() or time.monotonic() - self._checked_at < RETRAIN_INTERVAL_SECONDS:
+            return
+        threading.Thread(target=self.refresh, name="issue-classifier-training", daemon=True).start()
+    
+    def refresh(self) -> None:
+        """Retrain on the logged LLM analyses if new ones were logged; skipped if already training"""
+        if not self._training.acquire(blocking=False):
+            return
+        try:
+            self._checked_at = time.monotonic()
+            latest = GitHubOperationLogger.get_latest_id(ANALYSIS_OPERATIONS)
+            if latest == self._checked_through:
+                return
+            if self._checked_through is not None and not self._has_llm_analyses(self._checked_through, latest):
+                # Only local or fallback analyses were logged; they don't change the training set
+                self._checked_through = latest
+                return
+            examples = self._training_examples()
+            self.examples = len(examples)
+            models: Dict[str, HashedLinearModel] = {}
+            if len(examples) >= settings.issue_classifier_min_examples:
+                for field in ISSUE_KEYWORDS:
+                    field_examples = [(features, analysis[field]) for features, analysis in examples
+                                      if analysis.get(field) in ISSUE_KEYWORDS[field]]
+                    labels = sorted({label for _, label in field_examples})
+                    # A field whose past analyses all agree says nothing; keep using keywords for it
+                    if len(labels) < 2:
+                        continue
+                    model = HashedLinearModel(labels)
+                    model.fit(field_examples)
+                    models[field] = model
+            self._models = models
+            self._checked_through = latest
+            logger.info(f"Issue classifier trained on {len(examples)} analyses ({', '.join(models) or 'keywords only'})")
+        except Exception as e:
+            logger.warning(f"Failed to train issue classifier: {e}")
+        finally:
+            self._training.release()
+
+    def stats(self, days: int = 7) -> Dict[str, Any]:
+        """Escalation rate over the last days and what the classifier is trained on"""
+        stats = IssueClassificationManager.get_stats(days)
+        stats.update({
+            'days': days,
+            'training_examples': self.examples,
+            'trained_fields': sorted(self._models),
+            'confidence_threshold': settings.issue_classifier_confidence_threshold
+        })
+        return stats
+
+    def _training_examples(self) -> List[Tuple[Dict[int, float], Dict[str, Any]]]:
+        """Features and analysis of each distinct issue the LLM analyzed, newest analysis first"""
+        rows = GitHubOperationLogger.get_operations_by_type(ANALYSIS_OPERATIONS + ['issue_detected'],
+                                                            MAX_TRAINING_EXAMPLES * 3)
+        detected: Dict[int, Dict[str, Any]] = {}
+        for row in rows:
+            if row['operation_type'] == 'issue_detected' and row['details']:
+                issue = json.loads(row['details'])
+                detected.setdefault(issue.get('number'), issue)
+
+        examples, seen = [], set()
+        for row in rows:
+            if row['operation_type'] == 'issue_detected' or not row['details']:
+                continue
+            details = json.loads(row['details'])
+            analysis = details.get('analysis')
+            if not isinstance(analysis, dict) or not self._is_llm_analysis(analysis):
+                continue
+            issue = details.get('issue')
+            if issue is None:
+                # Replies logged before the issue was recorded alongside them
+                number = re.search(r'#(\d+)', row['message'] or '')
+                issue = detected.get(int(number.group(1))) if number else None
+            if not issue:
+                continue
+            key = (issue.get('title') or '', issue.get('body') or '')
+            if key in seen:
+                continue
+            seen.add(key)
+            hits = {field: automaton.match(f"{key[0]}\n{key[1][:BODY_CHARS]}")
+                    for field, automaton in self._automata.items()}
+            examples.append((self._features(key[0], key[1], hits), analysis))
+            if len(examples) >= MAX_TRAINING_EXAMPLES:
+                break
+        return examples
+
+    def _has_llm_analyses(self, after_id: int, through_id: int) -> bool:
+        """Whether any analysis logged in the id range came from the LLM"""
+        for row in GitHubOperationLogger.get_operations_since(ANALYSIS_OPERATIONS, after_id, through_id):
+            analysis = json.loads(row['details']).get('analysis') if row['details'] else None
+            if isinstance(analysis, dict) and self._is_llm_analysis(analysis):
+                return True
+        return False
+    
+    @staticmethod
+    def _is_llm_analysis(analysis: Dict[str, Any]) -> bool:
+        """Whether an analysis came from the LLM rather than a fallback or this classifier"""
+        if analysis.get('classified_by'):
+            return analysis['classified_by'] == 'llm'
+        # Analyses logged before they were tagged
+        return not str(analysis.get('summary', '')).startswith(('Automated analysis', 'Issue analysis failed'))
+
+    @staticmethod
+    def _features(title: str, body: str, hits: Dict[str, Counter]) -> Dict[int, float]:
+        """Hashed title and body words and bigrams, keyword hits and a bias, scaled to unit length"""
+        tokens = ['bias']
+        for prefix, text in (('t', title or ''), ('b', (body or '')[:BODY_CHARS])):
+            words = re.findall(r"[a-z0-9_']+", text.lower())
+            tokens.extend(f"{prefix}:{w}" for w in words)
+            tokens.extend(f"{prefix}:{a} {b}" for a, b in zip(words, words[1:]))
+        for field, counts in hits.items():
+            tokens.extend(f"kw:{field}:{label}" for label in counts.elements())
+
+        counts = Counter(zlib.crc32(token.encode('utf-8')) % FEATURE_DIMENSIONS for token in tokens)
+        norm = math.sqrt(sum(c * c for c in counts.values()))
+        return {f: c / norm for f, c in counts.items()}
+
+issue_classifier = IssueClassifier()
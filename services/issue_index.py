@@ -0,0 +1,221 @@
+"""
+Issue Vector Index
+In-process nearest-neighbour search over past issues for duplicate detection
+"""
+
+import logging
+import math
+import re
+import time
+import zlib
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+import openai
+
+from config import settings
+from database import IssueVectorManager
+from services.llm_client import current_provider_config, llm_clients
+from services.llm_usage import LLMUsageTracker, current_lane
+from services.rate_limiter import llm_rate_limiters
+from utils.helpers import generate_canonical_hash
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+TFIDF_KIND = 'tfidf'
+TFIDF_DIMENSIONS = 2 ** 11
+EMBEDDING_INPUT_CHARS = 8000
+# How long to stop asking an endpoint for embeddings after it failed
+EMBEDDING_RETRY_SECONDS = 3600
+
+@dataclass
+class DuplicateMatch:
+    """Nearest earlier issue above the duplicate threshold"""
+    number: int
+    similarity: float
+    kind: str
+
+class IssueVectorSet:
+    """Vectors of one kind in a matrix, with one row per issue"""
+
+    def __init__(self, kind: str):
+        self.kind = kind
+        self.numbers: List[int] = []
+        self.hashes: Dict[int, str] = {}
+        self._rows: Dict[int, int] = {}
+        self._matrix = None
+        # Issues containing each term, for the TF-IDF weights
+        self._document_frequency = None
+
+    def __len__(self) -> int:
+        return len(self.numbers)
+
+    def get(self, number: int) -> Optional['np.ndarray']:
+        """Stored vector of an issue"""
+        row = self._rows.get(number)
+        return None if row is None else self._matrix[row]
+
+    def load(self, rows: List[Dict[str, Any]]) -> None:
+        """Fill an empty set from stored rows in one go"""
+        if not rows:
+            return
+        self.numbers = [row['number'] for row in rows]
+        self.hashes = {row['number']: row['content_hash'] for row in rows}
+        self._rows = {number: i for i, number in enumerate(self.numbers)}
+        self._matrix = np.vstack([np.frombuffer(row['vector'], dtype=np.float32) for row in rows])
+        if self.kind == TFIDF_KIND:
+            self._document_frequency = (self._matrix > 0).sum(axis=0).astype(np.float32)
+
+    def upsert(self, number: int, content_hash: str, vector: 'np.ndarray') -> None:
+        """Add an issue's vector, or replace it if the issue is already indexed"""
+        row = self._rows.get(number)
+        if row is None:
+            self._rows[number] = len(self.numbers)
+            self.numbers.append(number)
+            self._matrix = vector[np.newaxis, :] if self._matrix is None else np.vstack([self._matrix, vector])
+        else:
+            if self._document_frequency is not None:
+                self._document_frequency -= self._matrix[row] > 0
+            self._matrix[row] = vector
+        self.hashes[number] = content_hash
+        if self.kind == TFIDF_KIND:
+            if self._document_frequency is None:
+                self._document_frequency = np.zeros(vector.shape[0], dtype=np.float32)
+            self._document_frequency += vector > 0
+
+    def nearest(self, vector: 'np.ndarray', before: int) -> Optional[Tuple[int, float]]:
+        """Most similar issue numbered below before and its cosine similarity"""
+        if self._matrix is None:
+            return None
+        matrix, query = self._matrix, vector
+        if self.kind == TFIDF_KIND:
+            idf = np.log((1 + len(self.numbers)) / (1 + self._document_frequency)) + 1
+            matrix, query = matrix * idf, query * idf
+            matrix = matrix / np.maximum(np.linalg.norm(matrix, axis=1, keepdims=True), 1e-12)
+            query = query / max(float(np.linalg.norm(query)), 1e-12)
+        similarities = matrix @ query
+        # Only an earlier issue can be the original; this also leaves out the issue itself
+        similarities[np.asarray(self.numbers) >= before] = -1.0
+        best = int(np.argmax(similarities))
+        if similarities[best] < 0:
+            return None
+        return self.numbers[best], float(similarities[best])
+
+class IssueVectorIndex:
+    """Finds earlier issues that a new issue likely duplicates.
+
+    Every issue gets a hashed TF-IDF vector, and also an embedding from the
+    configured OpenAI-compatible endpoint when it offers one. Vectors are
+    persisted as they are added and loaded on first use, so the index is
+    updated incrementally and survives restarts. Without NumPy the index is
+    disabled.
+    """
+
+    def __init__(self):
+        self._sets: Dict[str, IssueVectorSet] = {}
+        self._embedding_retry_at: Dict[str, float] = {}
+
+    async def check_and_add(self, number: int, title: str, body: str) -> Optional[DuplicateMatch]:
+        """Find the earlier issue this one duplicates, if any, then index it"""
+        if not NUMPY_AVAILABLE or not settings.issue_duplicate_detection:
+            return None
+        try:
+            text = f"{title}\n{body or ''}"
+            content_hash = generate_canonical_hash(text)
+            vectors = {TFIDF_KIND: self._tfidf_vector(text)}
+            embedding_kind = self._embedding_kind()
+            if embedding_kind:
+                vector_set = self._vector_set(embedding_kind)
+                if vector_set.hashes.get(number) == content_hash:
+                    # Unchanged issue: reuse its stored embedding
+                    vectors[embedding_kind] = vector_set.get(number)
+                else:
+                    embedding = await self._embed(embedding_kind, text)
+                    if embedding is not None:
+                        vectors[embedding_kind] = embedding
+
+            match = self._nearest(number, vectors)
+
+            for kind, vector in vectors.items():
+                vector_set = self._vector_set(kind)
+                if vector_set.hashes.get(number) != content_hash:
+                    vector_set.upsert(number, content_hash, vector)
+                    IssueVectorManager.save(number, kind, content_hash, vector.astype(np.float32).tobytes())
+            return match
+
+        except Exception as e:
+            logger.error(f"Duplicate check failed for issue #{number}: {e}")
+            return None
+
+    def _nearest(self, number: int, vectors: Dict[str, 'np.ndarray']) -> Optional[DuplicateMatch]:
+        """Best match over the vector kinds, embeddings first; TF-IDF also covers issues indexed before embeddings were available"""
+        thresholds = settings.issue_duplicate_thresholds or {}
+        for kind in sorted(vectors, key=lambda k: k == TFIDF_KIND):
+            nearest = self._vector_set(kind).nearest(vectors[kind], before=number)
+            threshold = thresholds.get(TFIDF_KIND if kind == TFIDF_KIND else 'embedding', 1.0)
+            if nearest and nearest[1] >= threshold:
+                return DuplicateMatch(nearest[0], round(nearest[1], 3), kind)
+        return None
+
+    def _vector_set(self, kind: str) -> IssueVectorSet:
+        """Vector set of a kind, loaded from the database on first use"""
+        vector_set = self._sets.get(kind)
+        if vector_set is None:
+            vector_set = self._sets[kind] = IssueVectorSet(kind)
+            vector_set.load(IssueVectorManager.get_all(kind))
+            if len(vector_set):
+                logger.info(f"Loaded {len(vector_set)} {kind} issue vectors")
+        return vector_set
+
+    def _embedding_kind(self) -> Optional[str]:
+        """Kind of the active provider's embeddings, or None if they are off or recently failed"""
+        if not settings.issue_embedding_model:
+            return None
+        kind = f"embedding:{current_provider_config().name}:{settings.issue_embedding_model}"
+        if time.monotonic() < self._embedding_retry_at.get(kind, 0):
+            return None
+        return kind
+
+    async def _embed(self, kind: str, text: str) -> Optional['np.ndarray']:
+        """Unit-length embedding of text, or None if the endpoint can't provide one"""
+        client = llm_clients.get_client()
+        if client is None:
+            return None
+        provider = current_provider_config()
+        text = text[:EMBEDDING_INPUT_CHARS]
+        limiter = llm_rate_limiters.get(provider)
+        queue_seconds = await limiter.acquire(len(text) // 4 + 1, current_lane())
+        start = time.perf_counter()
+        try:
+            response = await client.embeddings.create(model=settings.issue_embedding_model, input=text)
+            vector = np.asarray(response.data[0].embedding, dtype=np.float32)
+        except Exception as e:
+            if isinstance(e, openai.RateLimitError):
+                limiter.back_off(llm_rate_limiters.retry_after(e))
+            LLMUsageTracker.record("embed_issue", provider.name, settings.issue_embedding_model,
+                                   time.perf_counter() - start, success=False, queue_seconds=queue_seconds)
+            logger.warning(f"Issue embedding failed, using TF-IDF vectors for now: {e}")
+            self._embedding_retry_at[kind] = time.monotonic() + EMBEDDING_RETRY_SECONDS
+            return None
+        LLMUsageTracker.record("embed_issue", provider.name, settings.issue_embedding_model,
+                               time.perf_counter() - start, usage=response.usage, queue_seconds=queue_seconds)
+        return vector / max(float(np.linalg.norm(vector)), 1e-12)
+
+    @staticmethod
+    def _tfidf_vector(text: str) -> 'np.ndarray':
+        """Hashed sublinear term frequencies of words and bigrams; IDF is applied at search time"""
+        words = re.findall(r"[a-z0-9_']+", text.lower())
+        terms = words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+        vector = np.zeros(TFIDF_DIMENSIONS, dtype=np.float32)
+        for term, count in Counter(terms).items():
+            vector[zlib.crc32(term.encode('utf-8')) % TFIDF_DIMENSIONS] += 1 + math.log(count)
+        return vector
+
+issue_index = IssueVectorIndex()
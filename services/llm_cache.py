@@ -0,0 +1,101 @@
+"""
+LLM Response Cache
+Persistent content-addressed cache of LLM completions with per-method TTLs and
+size-bounded LRU eviction
+"""
+
+import hashlib
+import json
+import logging
+from typing import Any, Dict, List, Optional
+
+from config import settings
+from database import LLMCacheManager
+
+logger = logging.getLogger(__name__)
+
+class LLMResponseCache:
+    """Cache of completion text keyed by provider, model and the full request"""
+
+    @staticmethod
+    def make_key(provider: str, model: str, messages: List[Dict[str, Any]],
+                 response_format: Optional[Dict[str, Any]] = None, max_tokens: Optional[int] = None) -> str:
+        """Hash the request; identical requests to the same model share a key"""
+        request = {
+            'provider': provider,
+            'model': model,
+            'messages': messages,
+            'response_format': response_format,
+            'max_tokens': max_tokens
+        }
+        encoded = json.dumps(request, sort_keys=True, separators=(',', ':')).encode('utf-8')
+        return hashlib.blake2b(encoded, digest_size=20).hexdigest()
+
+    @staticmethod
+    def ttl_seconds(method: str) -> int:
+        """Lifetime of cached responses for a method, 0 if the method is not cached"""
+        if not settings.llm_cache_enabled:
+            return 0
+        ttl_hours = (settings.llm_cache_ttl_hours or {}).get(method) or 0
+        return int(float(ttl_hours) * 3600)
+
+    @staticmethod
+    def get(method: str, cache_key: str) -> Optional[str]:
+        """Get a cached response, counting the lookup as a hit or miss"""
+        try:
+            entry = LLMCacheManager.get(cache_key)
+            if entry is None:
+                LLMCacheManager.record_lookup(method, hit=False)
+                return None
+            tokens_saved = (entry['prompt_tokens'] or 0) + (entry['completion_tokens'] or 0)
+            LLMCacheManager.record_lookup(method, hit=True, tokens_saved=tokens_saved)
+            logger.debug(f"LLM cache hit for {method} ({tokens_saved} tokens saved)")
+            return entry['response']
+        except Exception as e:
+            logger.warning(f"LLM cache lookup failed: {e}")
+            return None
+
+    @staticmethod
+    def put(method: str, cache_key: str, provider: str, model: str, response: str,
+            usage: Any, ttl_seconds: int) -> None:
+        """Store a response and evict old entries if the cache grew past its size limit"""
+        try:
+            LLMCacheManager.save(
+                cache_key, method, provider, model, response,
+                getattr(usage, 'prompt_tokens', 0) or 0,
+                getattr(usage, 'completion_tokens', 0) or 0,
+                ttl_seconds
+            )
+            removed = LLMCacheManager.evict(int(settings.llm_cache_max_mb * 1024 * 1024))
+            if removed:
+                logger.debug(f"Evicted {removed} LLM cache entries")
+        except Exception as e:
+            logger.warning(f"LLM cache store failed: {e}")
+
+    @staticmethod
+    def stats() -> Dict[str, Any]:
+        """Hit rate and tokens saved, overall and per method"""
+        stats = LLMCacheManager.get_stats()
+        for method in stats['methods']:
+            lookups = method['hits'] + method['misses']
+            method['hit_rate'] = round(method['hits'] / lookups, 4) if lookups else 0.0
+        hits = sum(m['hits'] for m in stats['methods'])
+        lookups = hits + sum(m['misses'] for m in stats['methods'])
+        stats['hits'] = hits
+        stats['misses'] = lookups - hits
+        stats['hit_rate'] = round(hits / lookups, 4) if lookups else 0.0
+        stats['tokens_saved'] = sum(m['tokens_saved'] for m in stats['methods'])
+        return stats
+
+    @staticmethod
+    def usage_since(before: Dict[str, Any]) -> Dict[str, Any]:
+        """Hits, misses and tokens saved since an earlier stats() snapshot"""
+        after = LLMResponseCache.stats()
+        hits = after['hits'] - before['hits']
+        misses = after['misses'] - before['misses']
+        return {
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': round(hits / (hits + misses), 4) if hits + misses else 0.0,
+            'tokens_saved': after['tokens_saved'] - before['tokens_saved']
+        }
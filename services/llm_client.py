@@ -0,0 +1,131 @@
+"""
+LLM Client Registry
+Process-wide async OpenAI-compatible clients with pooled keep-alive connections
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+# Connection pool shared by every request made through one client
+LLM_POOL_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=60.0)
+
+@dataclass(frozen=True)
+class LLMProviderConfig:
+    """Settings that identify one LLM provider client"""
+    use_local_llm: bool
+    api_key: Optional[str]
+    base_url: Optional[str]
+    model: str
+
+    @property
+    def name(self) -> str:
+        """Stable provider identifier"""
+        return f"local:{self.base_url}" if self.use_local_llm else "openai"
+
+    @property
+    def label(self) -> str:
+        return f"local LLM at {self.base_url}" if self.use_local_llm else "OpenAI"
+
+def current_provider_config() -> LLMProviderConfig:
+    """Read the active provider settings"""
+    return _local_config() if settings.use_local_llm else _openai_config()
+
+def provider_configs() -> List[LLMProviderConfig]:
+    """The active provider, then the other one if failover is enabled and it is configured"""
+    configs = [current_provider_config()]
+    if settings.llm_failover_enabled:
+        if settings.use_local_llm:
+            if settings.openai_api_key:
+                configs.append(_openai_config())
+        elif settings.openai_base_url:
+            configs.append(_local_config())
+    return configs
+
+def _openai_config() -> LLMProviderConfig:
+    return LLMProviderConfig(False, settings.openai_api_key, None, settings.openai_model)
+
+def _local_config() -> LLMProviderConfig:
+    # Some local LLMs don't need real keys
+    return LLMProviderConfig(True, settings.local_api_key or "dummy-key",
+                             settings.openai_base_url, settings.local_model)
+
+class LLMClientRegistry:
+    """Builds one AsyncOpenAI client per provider and reuses it.
+
+    A provider's client is rebuilt only when its settings change or when it is
+    requested from a different event loop, since pooled connections are bound to
+    the loop that opened them. Replaced clients are closed on shutdown.
+    """
+
+    def __init__(self):
+        # Provider name -> (settings, loop, client)
+        self._clients: Dict[str, Tuple[LLMProviderConfig, Optional[asyncio.AbstractEventLoop], Optional[AsyncOpenAI]]] = {}
+        self._retired: List[AsyncOpenAI] = []
+
+    def get_client(self, config: Optional[LLMProviderConfig] = None) -> Optional[AsyncOpenAI]:
+        """Get the client for the given (or active) provider configuration, or None if it is not configured"""
+        config = config or current_provider_config()
+        loop = self._running_loop()
+        entry = self._clients.get(config.name)
+        if entry is not None:
+            cached_config, cached_loop, client = entry
+            if cached_config == config and (client is None or cached_loop is loop):
+                return client
+            if client is not None:
+                self._retired.append(client)
+
+        client = self._build_client(config)
+        self._clients[config.name] = (config, loop, client)
+        return client
+
+    async def aclose(self) -> None:
+        """Close every client built by the registry"""
+        clients = self._retired + [client for _, _, client in self._clients.values() if client is not None]
+        self._clients, self._retired = {}, []
+        for client in clients:
+            try:
+                await client.close()
+            except Exception as e:
+                logger.debug(f"Error closing LLM client: {e}")
+
+    @staticmethod
+    def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+        try:
+            return asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+
+    @staticmethod
+    def _build_client(config: LLMProviderConfig) -> Optional[AsyncOpenAI]:
+        if config.use_local_llm and not config.base_url:
+            logger.warning("Local LLM selected but no base URL provided - AI features will be disabled")
+            return None
+        if not config.api_key:
+            logger.warning("AI API key not provided - AI features will be disabled")
+            return None
+
+        try:
+            logger.info(f"Initializing {config.label} client")
+            client = AsyncOpenAI(
+                api_key=config.api_key,
+                base_url=config.base_url,
+                http_client=DefaultAsyncHttpxClient(limits=LLM_POOL_LIMITS),
+                # Retries belong to the rate limiter's back-off and the provider pool's failover
+                max_retries=0
+            )
+            logger.info(f"{config.label} client initialized successfully with model: {config.model}")
+            return client
+        except Exception as e:
+            logger.error(f"Failed to initialize {config.label} client: {e}")
+            return None
+
+llm_clients = LLMClientRegistry()
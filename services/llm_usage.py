@@ -0,0 +1,84 @@
+"""
+LLM Usage Accounting
+Records tokens, latency and cache outcome of every LLM call, attributed to the
+task that made it, and enforces per-task daily token budgets
+"""
+
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator
+
+from config import settings
+from database import LLMUsageManager
+
+logger = logging.getLogger(__name__)
+
+# Task type LLM calls are attributed to; set with llm_task() around the work
+current_task_type: ContextVar[str] = ContextVar('llm_task_type', default='general')
+
+# Rate limiter lanes, highest priority first
+LLM_LANES = ('interactive', 'maintenance', 'batch')
+
+@contextmanager
+def llm_task(task_type: str) -> Iterator[None]:
+    """Attribute LLM calls made inside the block, including in tasks it spawns, to task_type"""
+    token = current_task_type.set(task_type)
+    try:
+        yield
+    finally:
+        current_task_type.reset(token)
+
+def current_lane() -> str:
+    """Rate limiter lane of the current task type, from llm_task_lanes"""
+    lane = (settings.llm_task_lanes or {}).get(current_task_type.get())
+    return lane if lane in LLM_LANES else 'maintenance'
+
+class LLMUsageTracker:
+    """Rolling per-call accounting of LLM usage"""
+
+    @staticmethod
+    def record(method: str, provider: str, model: str, latency_seconds: float, usage: Any = None,
+               cache_hit: bool = False, success: bool = True, coalesced: bool = False,
+               queue_seconds: float = 0.0) -> None:
+        """Record one call; usage is the response's usage object, if any.
+        
+        Coalesced calls were served by an identical request already in flight.
+        queue_seconds is the time the call waited for the rate limiter.
+        """
+        try:
+            LLMUsageManager.record(
+                method, current_task_type.get(), current_lane(), provider, model,
+                getattr(usage, 'prompt_tokens', 0) or 0,
+                getattr(usage, 'completion_tokens', 0) or 0,
+                int(latency_seconds * 1000), int(queue_seconds * 1000), cache_hit, success, coalesced,
+                settings.llm_usage_retention_days
+            )
+        except Exception as e:
+            logger.warning(f"Failed to record LLM usage: {e}")
+
+    @staticmethod
+    def budget_exceeded(task_type: str = None) -> bool:
+        """Whether the task has used up its daily token budget"""
+        task_type = task_type or current_task_type.get()
+        budget = (settings.llm_task_token_budgets or {}).get(task_type)
+        if not budget:
+            return False
+        try:
+            return LLMUsageManager.tokens_used_today(task_type) >= int(budget)
+        except Exception as e:
+            logger.warning(f"Failed to check LLM token budget: {e}")
+            return False
+
+    @staticmethod
+    def summary(days: int = 7) -> Dict[str, Any]:
+        """Usage per method and per day, today's usage per task and the configured budgets"""
+        summary = LLMUsageManager.get_summary(days)
+        budgets = settings.llm_task_token_budgets or {}
+        used = {row['task_type']: row['tokens'] for row in summary['today_by_task']}
+        summary['budgets'] = {
+            task_type: {'daily_tokens': budget, 'used_today': used.get(task_type, 0)}
+            for task_type, budget in budgets.items()
+        }
+        summary['days'] = days
+        return summary
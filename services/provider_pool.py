@@ -0,0 +1,160 @@
+"""
+LLM Provider Pool
+Latency and error tracking per provider, with hedged requests and failover
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+
+from openai import AsyncOpenAI
+
+from config import settings
+from services.llm_client import LLMProviderConfig, llm_clients, provider_configs
+
+logger = logging.getLogger(__name__)
+
+# Recent requests per provider that the statistics are computed over
+STATS_WINDOW = 200
+# Latencies needed before a provider's p95 is trusted for hedging
+MIN_LATENCY_SAMPLES = 20
+# A provider failing at least this often is tried last
+FAILOVER_ERROR_RATE = 0.5
+MIN_ERROR_SAMPLES = 5
+# How long after its last failure an unhealthy provider stays demoted
+DEMOTION_SECONDS = 60.0
+
+class ProviderStats:
+    """Rolling latency and outcome window of one provider"""
+
+    def __init__(self):
+        self.latencies: Deque[float] = deque(maxlen=STATS_WINDOW)
+        self.outcomes: Deque[bool] = deque(maxlen=STATS_WINDOW)
+        self.last_failure = 0.0
+
+    def observe(self, latency: Optional[float]) -> None:
+        """Record a successful request's latency, or a failure if latency is None"""
+        self.outcomes.append(latency is not None)
+        if latency is None:
+            self.last_failure = time.monotonic()
+        else:
+            self.latencies.append(latency)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Latency percentile in seconds, None until there are enough samples"""
+        if len(self.latencies) < MIN_LATENCY_SAMPLES:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    @property
+    def error_rate(self) -> float:
+        return (self.outcomes.count(False) / len(self.outcomes)) if self.outcomes else 0.0
+
+    def unhealthy(self) -> bool:
+        """Failing often and recently; demotion lapses so a recovered provider is tried again"""
+        return (len(self.outcomes) >= MIN_ERROR_SAMPLES and self.error_rate >= FAILOVER_ERROR_RATE
+                and time.monotonic() - self.last_failure < DEMOTION_SECONDS)
+
+    def snapshot(self) -> Dict[str, Any]:
+        p50, p95 = self.percentile(0.5), self.percentile(0.95)
+        return {
+            'requests': len(self.outcomes),
+            'p50_ms': int(p50 * 1000) if p50 is not None else None,
+            'p95_ms': int(p95 * 1000) if p95 is not None else None,
+            'error_rate': round(self.error_rate, 3)
+        }
+
+class LLMProviderPool:
+    """Runs LLM requests against the configured providers.
+
+    The active provider is tried first unless it has been failing, in which case
+    the other one (OpenAI or the local endpoint) goes first. When a request takes
+    longer than the first provider's p95 latency, a hedged copy is sent to the
+    next provider (or the same one if it is the only one) and whichever answers
+    first wins; the other is cancelled. A failed request fails over to the next
+    provider.
+    """
+
+    def __init__(self):
+        self._stats: Dict[str, ProviderStats] = {}
+        self.hedged = 0
+        self.hedge_wins = 0
+        self.failovers = 0
+
+    def available(self) -> List[Tuple[LLMProviderConfig, AsyncOpenAI]]:
+        """Configured providers with their clients, healthy ones first"""
+        providers = [(config, llm_clients.get_client(config)) for config in provider_configs()]
+        providers = [(config, client) for config, client in providers if client is not None]
+        return sorted(providers, key=lambda provider: self.stats(provider[0]).unhealthy())
+
+    def stats(self, provider: LLMProviderConfig) -> ProviderStats:
+        return self._stats.setdefault(provider.name, ProviderStats())
+
+    def observe(self, provider: LLMProviderConfig, latency: Optional[float]) -> None:
+        """Record a request's latency, or None for a failure"""
+        self.stats(provider).observe(latency)
+
+    async def run(self, attempt: Callable[[LLMProviderConfig, AsyncOpenAI], Awaitable[Any]], hedge: bool = True) -> Any:
+        """Run attempt(provider, client) with hedging and failover; returns the first successful result"""
+        providers = self.available()
+        if not providers:
+            raise RuntimeError("No LLM provider is configured")
+        untried = list(providers)
+        pending: Dict[asyncio.Task, Tuple[LLMProviderConfig, bool, float]] = {}
+
+        def launch(provider: LLMProviderConfig, client: AsyncOpenAI, is_hedge: bool) -> None:
+            task = asyncio.ensure_future(attempt(provider, client))
+            # Retrieve the outcome of a loser that finishes after the winner
+            task.add_done_callback(lambda done: done.cancelled() or done.exception())
+            pending[task] = (provider, is_hedge, time.monotonic())
+
+        launch(*untried.pop(0), False)
+        hedge_delay = self.stats(providers[0][0]).percentile(0.95) if hedge and settings.llm_hedging_enabled else None
+        last_error: Optional[BaseException] = None
+        try:
+            while pending:
+                done, _ = await asyncio.wait(pending, timeout=hedge_delay, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    # Slower than p95: send the same request again
+                    hedge_delay = None
+                    self.hedged += 1
+                    provider, client = untried.pop(0) if untried else providers[0]
+                    logger.info(f"Hedging slow LLM request on {provider.label}")
+                    launch(provider, client, True)
+                    continue
+
+                for task in done:
+                    provider, is_hedge, _ = pending.pop(task)
+                    if task.exception() is None:
+                        self.hedge_wins += is_hedge
+                        # Losers are cancelled; count the time they had taken so p95 does not drift down
+                        for loser, _, started in pending.values():
+                            self.observe(loser, time.monotonic() - started)
+                        return task.result()
+                    last_error = task.exception()
+                    logger.warning(f"LLM request to {provider.label} failed: {last_error}")
+
+                if not pending and untried:
+                    hedge_delay = None
+                    self.failovers += 1
+                    provider, client = untried.pop(0)
+                    logger.info(f"Failing over LLM request to {provider.label}")
+                    launch(provider, client, False)
+            raise last_error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Per-provider latency percentiles and error rates, with hedging and failover counts"""
+        return {
+            'providers': {name: stats.snapshot() for name, stats in self._stats.items()},
+            'hedged': self.hedged,
+            'hedge_wins': self.hedge_wins,
+            'failovers': self.failovers
+        }
+
+llm_providers = LLMProviderPool()
@@ -0,0 +1,213 @@
+"""
+LLM Rate Limiter
+Shared request and token buckets per provider, served to callers in priority lanes
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
+
+from config import settings
+from services.llm_client import LLMProviderConfig
+from services.llm_usage import LLM_LANES
+
+logger = logging.getLogger(__name__)
+
+# Completion tokens assumed for a request that sets no max_tokens
+DEFAULT_COMPLETION_TOKENS = 1000
+# Pause after a 429 without a Retry-After header
+DEFAULT_RETRY_AFTER_SECONDS = 5.0
+
+class TokenBucket:
+    """Bucket holding up to a minute's allowance, refilled continuously; a zero limit never runs dry"""
+
+    def __init__(self, per_minute: int):
+        self.capacity = float(max(0, per_minute))
+        self.rate = self.capacity / 60.0
+        self.level = self.capacity
+        self._updated = time.monotonic()
+
+    def delay(self, amount: float) -> float:
+        """Seconds until amount can be taken"""
+        if not self.capacity:
+            return 0.0
+        self._refill()
+        return max(0.0, (min(amount, self.capacity) - self.level) / self.rate)
+
+    def take(self, amount: float) -> None:
+        if self.capacity:
+            self._refill()
+            self.level -= min(amount, self.capacity)
+
+    def give_back(self, amount: float) -> None:
+        """Return over-estimated units, or take more if amount is negative"""
+        if self.capacity:
+            self._refill()
+            self.level = min(self.capacity, self.level + amount)
+
+    def drain(self) -> None:
+        if self.capacity:
+            self._refill()
+            self.level = min(self.level, 0.0)
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.level = min(self.capacity, self.level + (now - self._updated) * self.rate)
+        self._updated = now
+
+class LLMRateLimiter:
+    """Admits LLM requests within a provider's requests- and tokens-per-minute limits.
+
+    A request that fits and has nobody queued ahead of it goes straight through.
+    Otherwise it waits in its lane, and a dispatcher task admits the head of the
+    highest-priority non-empty lane as soon as both buckets allow. A waiting
+    request shared by several callers moves up when a higher-priority caller
+    joins it. Token estimates are settled against actual usage afterwards. A 429
+    pauses the whole limiter instead of letting every caller retry.
+    """
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._requests = TokenBucket(requests_per_minute)
+        self._tokens = TokenBucket(tokens_per_minute)
+        self._paused_until = 0.0
+        # Waiters per lane: their future, estimated tokens and the shared call they belong to
+        self._queues: Dict[str, Deque[Tuple[asyncio.Future, int, Optional[str]]]] = {lane: deque() for lane in LLM_LANES}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._dispatcher: Optional[asyncio.Task] = None
+
+    async def acquire(self, tokens: int, lane: str, flight: Optional[str] = None) -> float:
+        """Wait until the request may be sent; returns the seconds spent queued.
+        
+        flight identifies the shared call the request belongs to, for promote().
+        """
+        self._bind_loop()
+        if not self.queued() and self._delay(tokens) == 0:
+            self._take(tokens)
+            return 0.0
+
+        start = time.monotonic()
+        future = self._loop.create_future()
+        self._queues.get(lane, self._queues[LLM_LANES[-1]]).append((future, tokens, flight))
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = self._loop.create_task(self._dispatch())
+        self._wakeup.set()
+        # A cancelled waiter is skipped by the dispatcher
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Admitted just as it was cancelled: return what the dispatcher took
+                self._requests.give_back(1)
+                self._tokens.give_back(tokens)
+            raise
+        return time.monotonic() - start
+
+    def settle(self, estimated_tokens: int, actual_tokens: int) -> None:
+        """Correct the token bucket once the real usage of a request is known"""
+        self._tokens.give_back(estimated_tokens - actual_tokens)
+
+    def back_off(self, seconds: float) -> None:
+        """Hold all requests after the provider reported a rate limit"""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        self._requests.drain()
+        logger.warning(f"LLM provider rate limit hit - pausing requests for {seconds:.1f}s")
+
+    def promote(self, flight: str, lane: str) -> None:
+        """Move the waiting requests of a shared call up to lane if it outranks theirs"""
+        if lane not in LLM_LANES:
+            return
+        moved = False
+        for lower in LLM_LANES[LLM_LANES.index(lane) + 1:]:
+            queue = self._queues[lower]
+            for entry in [entry for entry in queue if entry[2] == flight]:
+                queue.remove(entry)
+                self._queues[lane].append(entry)
+                moved = True
+        if moved and self._wakeup is not None:
+            self._wakeup.set()
+    
+    def queued(self) -> int:
+        """Requests waiting in all lanes"""
+        return sum(1 for queue in self._queues.values() for future, *_ in queue if not future.done())
+
+    async def _dispatch(self) -> None:
+        while True:
+            head = self._head()
+            if head is None:
+                return
+            queue, (future, tokens, _) = head
+            delay = self._delay(tokens)
+            if delay > 0:
+                # Re-check on new arrivals, which may outrank the current head
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            queue.popleft()
+            self._take(tokens)
+            future.set_result(None)
+
+    def _head(self) -> Optional[Tuple[Deque[Tuple[asyncio.Future, int, Optional[str]]], Tuple[asyncio.Future, int, Optional[str]]]]:
+        """Oldest live waiter of the highest-priority lane"""
+        for lane in LLM_LANES:
+            queue = self._queues[lane]
+            while queue and queue[0][0].done():
+                queue.popleft()
+            if queue:
+                return queue, queue[0]
+        return None
+
+    def _delay(self, tokens: int) -> float:
+        return max(self._paused_until - time.monotonic(), self._requests.delay(1), self._tokens.delay(tokens))
+
+    def _take(self, tokens: int) -> None:
+        self._requests.take(1)
+        self._tokens.take(tokens)
+
+    def _bind_loop(self) -> None:
+        """Waiters belong to one event loop; start over when called from another"""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._wakeup = asyncio.Event()
+            self._dispatcher = None
+            self._queues = {lane: deque() for lane in LLM_LANES}
+
+class LLMRateLimiterRegistry:
+    """One limiter per provider, rebuilt when its configured limits change"""
+
+    def __init__(self):
+        self._limiters: Dict[str, LLMRateLimiter] = {}
+
+    def get(self, provider: LLMProviderConfig) -> LLMRateLimiter:
+        """Limiter of a provider with its limits from llm_rate_limits"""
+        limits = (settings.llm_rate_limits or {}).get('local' if provider.use_local_llm else 'openai') or {}
+        requests_per_minute = int(limits.get('requests_per_minute') or 0)
+        tokens_per_minute = int(limits.get('tokens_per_minute') or 0)
+        limiter = self._limiters.get(provider.name)
+        if limiter is None or (limiter.requests_per_minute, limiter.tokens_per_minute) != (requests_per_minute, tokens_per_minute):
+            limiter = self._limiters[provider.name] = LLMRateLimiter(requests_per_minute, tokens_per_minute)
+        return limiter
+
+    def promote(self, flight: str, lane: str) -> None:
+        """Promote a shared call's waiting requests in every provider's limiter"""
+        for limiter in self._limiters.values():
+            limiter.promote(flight, lane)
+
+    @staticmethod
+    def retry_after(error: Exception) -> float:
+        """Seconds a rate-limit error asks callers to wait"""
+        response = getattr(error, 'response', None)
+        try:
+            return float(response.headers.get('retry-after'))
+        except (AttributeError, TypeError, ValueError):
+            return DEFAULT_RETRY_AFTER_SECONDS
+
+llm_rate_limiters = LLMRateLimiterRegistry()
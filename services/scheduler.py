@@ -14,9 +14,10 @@ from apscheduler.triggers.cron import CronTrigger
 
 from config import settings
 from database import TaskLogger
-from services.api_scraper import Site24x7APIScraper
+from services.api_scraper import Site24x7APIScraper, shutdown_parse_pool
 from services.cli_generator import CLIGenerator
 from services.github_manager import GitHubManager
+from services.llm_client import llm_clients
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +47,10 @@ class SchedulerService:
         self.last_generation = None
         self.last_maintenance = None
         
+        # Track how often unchanged documentation short-circuits the pipeline
+        self.update_runs = 0
+        self.update_short_circuits = 0
+        
     async def start(self):
         """Start the scheduler with all tasks"""
         try:
@@ -114,6 +119,8 @@ class SchedulerService:
         try:
             logger.info("Shutting down scheduler service...")
             self.scheduler.shutdown(wait=True)
+            shutdown_parse_pool()
+            await llm_clients.aclose()
             logger.info("Scheduler service shut down successfully")
         except Exception as e:
             logger.error(f"Error shutting down scheduler: {e}")
@@ -140,8 +147,8 @@ class SchedulerService:
             except Exception as log_error:
                 logger.error(f"Failed to log initial task error: {log_error}")
     
-    async def _scrape_and_update_cli(self):
-        """Scrape API documentation and update CLI if changes detected"""
+    async def _scrape_and_update_cli(self, force: bool = False):
+        """Scrape API documentation and update CLI if changes detected, or always if forced"""
         try:
             from database import TaskLogger
             TaskLogger.log("scheduler", "started", "Starting scheduled API scrape and CLI update")
@@ -150,14 +157,17 @@ class SchedulerService:
             logger.info("Scraping Site24x7 API documentation...")
             documentation = await self.scraper.scrape_full_documentation()
             
-            # Check if CLI needs regeneration
-            from database import APISnapshotManager
-            latest_snapshot = APISnapshotManager.get_latest_snapshot()
+            self.update_runs += 1
+            self.last_scrape = datetime.utcnow()
             
-            if latest_snapshot and latest_snapshot['content_hash']:
+            # Only regenerate when the CLI was not yet generated and deployed from this content
+            if force or self.scraper.needs_generation:
                 # Generate new CLI
                 logger.info("Generating updated CLI from documentation...")
-                cli_project = await self.cli_generator.generate_cli_from_documentation(documentation)
+                cli_project = await self.cli_generator.generate_cli_from_documentation(
+                    documentation,
+                    self.scraper.last_change_set
+                )
                 
                 # Deploy to GitHub if available
                 if self.github_manager and self.github_manager.initialized:
@@ -167,10 +177,16 @@ class SchedulerService:
                     logger.info("Skipping GitHub deployment - GitHub not configured")
                     deployment_result = {"status": "skipped", "reason": "GitHub not configured"}
                 
-                self.last_scrape = datetime.utcnow()
                 self.last_generation = datetime.utcnow()
                 
-                from database import TaskLogger
+                from database import APISnapshotManager, TaskLogger
+                if deployment_result.get('files_failed'):
+                    logger.warning(f"{deployment_result['files_failed']} CLI files failed to deploy - retrying next run")
+                else:
+                    APISnapshotManager.mark_generated(
+                        self.scraper.last_content_hash,
+                        enrichment_pending=cli_project.get('enrichment_pending', False)
+                    )
                 TaskLogger.log(
                     "scheduler",
                     "completed",
@@ -178,6 +194,7 @@ class SchedulerService:
                     {
                         "endpoints_covered": cli_project['endpoints_covered'],
                         "version": cli_project['version'],
+                        "changes": self.scraper.last_change_set,
                         "deployment": deployment_result
                     }
                 )
@@ -185,9 +202,15 @@ class SchedulerService:
                 logger.info(f"CLI update completed successfully - version {cli_project['version']}")
                 
             else:
-                logger.info("No changes detected in API documentation")
+                self.update_short_circuits += 1
+                logger.info("No changes detected in API documentation - skipping generation and deployment")
                 from database import TaskLogger
-                TaskLogger.log("scheduler", "no_changes", "No API documentation changes detected")
+                TaskLogger.log(
+                    "scheduler",
+                    "no_changes",
+                    "No API documentation changes detected",
+                    self._get_short_circuit_stats()
+                )
             
         except Exception as e:
             logger.error(f"Scheduled scrape and update failed: {e}")
@@ -366,6 +389,14 @@ class SchedulerService:
             logger.error(f"Deep analysis failed: {e}")
             TaskLogger.log("deep_analysis", "failed", f"Deep analysis failed: {e}")
     
+    def _get_short_circuit_stats(self) -> Dict[str, Any]:
+        """Get counts of update runs skipped because documentation was unchanged"""
+        return {
+            "update_runs": self.update_runs,
+            "short_circuits": self.update_short_circuits,
+            "short_circuit_rate": round(self.update_short_circuits / self.update_runs, 3) if self.update_runs else 0.0
+        }
+    
     def get_status(self) -> Dict[str, Any]:
         """Get current scheduler status"""
         jobs = []
@@ -382,14 +413,15 @@ class SchedulerService:
             "jobs": jobs,
             "last_scrape": self.last_scrape.isoformat() if self.last_scrape else None,
             "last_generation": self.last_generation.isoformat() if self.last_generation else None,
-            "last_maintenance": self.last_maintenance.isoformat() if self.last_maintenance else None
+            "last_maintenance": self.last_maintenance.isoformat() if self.last_maintenance else None,
+            "update_short_circuits": self._get_short_circuit_stats()
         }
     
-    async def trigger_manual_update(self) -> Dict[str, Any]:
-        """Manually trigger CLI update"""
+    async def trigger_manual_update(self, force: bool = False) -> Dict[str, Any]:
+        """Manually trigger CLI update; force regenerates even if the documentation is unchanged"""
         try:
-            logger.info("Manual CLI update triggered")
-            await self._scrape_and_update_cli()
+            logger.info(f"Manual CLI update triggered{' (forced)' if force else ''}")
+            await self._scrape_and_update_cli(force)
             return {"status": "success", "message": "Manual update completed"}
         except Exception as e:
             logger.error(f"Manual update failed: {e}")
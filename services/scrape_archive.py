@@ -0,0 +1,142 @@
+"""
+Scrape Archive for Site24x7 Documentation Scraper
+Records fetched documentation responses to a compressed archive and replays them
+offline through an httpx transport
+"""
+
+import base64
+import gzip
+import json
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple, Union
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_FORMAT_VERSION = 1
+
+# Archived bodies are stored decoded, so these headers no longer describe them
+_STRIPPED_RESPONSE_HEADERS = frozenset({'content-encoding', 'content-length', 'transfer-encoding'})
+
+class ScrapeArchive:
+    """Gzip-compressed JSON lines archive of HTTP responses keyed by URL"""
+
+    def __init__(self, path: Union[str, Path], base_url: Optional[str] = None):
+        self.path = Path(path)
+        self.base_url = base_url
+        # Documentation roots recorded in the archive, keyed by data centre
+        self.data_centers: Dict[str, str] = {}
+        self.recorded_at: Optional[str] = None
+        self.responses: Dict[str, Dict[str, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self.responses)
+
+    def add(self, url: str, status_code: int, headers: List[Tuple[str, str]], body: bytes) -> None:
+        """Add a response, replacing any earlier response for the same URL"""
+        self.responses[url] = {
+            'url': url,
+            'status_code': status_code,
+            'headers': [
+                [name, value] for name, value in headers
+                if name.lower() not in _STRIPPED_RESPONSE_HEADERS
+            ],
+            'body': body
+        }
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """Get the archived response for a URL"""
+        return self.responses.get(url)
+
+    def save(self) -> None:
+        """Write the archive to disk"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        header = {
+            'format': ARCHIVE_FORMAT_VERSION,
+            'base_url': self.base_url,
+            'data_centers': self.data_centers,
+            'recorded_at': datetime.utcnow().isoformat(),
+            'responses': len(self.responses)
+        }
+        with gzip.open(self.path, 'wt', encoding='utf-8') as f:
+            f.write(json.dumps(header) + '\n')
+            for entry in self.responses.values():
+                record = dict(entry, body=base64.b64encode(entry['body']).decode('ascii'))
+                f.write(json.dumps(record) + '\n')
+        logger.info(f"Saved {len(self.responses)} responses to scrape archive {self.path}")
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> 'ScrapeArchive':
+        """Read an archive from disk"""
+        archive = cls(path)
+        with gzip.open(archive.path, 'rt', encoding='utf-8') as f:
+            header = json.loads(f.readline())
+            if header.get('format') != ARCHIVE_FORMAT_VERSION:
+                raise ValueError(f"Unsupported scrape archive format: {header.get('format')}")
+            archive.base_url = header.get('base_url')
+            archive.data_centers = header.get('data_centers') or {}
+            archive.recorded_at = header.get('recorded_at')
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                record['body'] = base64.b64decode(record['body'])
+                archive.responses[record['url']] = record
+        return archive
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """Transport that passes requests through to the network and archives every response"""
+
+    def __init__(self, archive: ScrapeArchive, transport: Optional[httpx.AsyncBaseTransport] = None):
+        self.archive = archive
+        self.transport = transport or httpx.AsyncHTTPTransport()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        response = await self.transport.handle_async_request(request)
+        try:
+            # Reading through a Response decodes any content encoding
+            body = await response.aread()
+        finally:
+            await response.aclose()
+
+        self.archive.add(str(request.url), response.status_code, response.headers.multi_items(), body)
+        entry = self.archive.get(str(request.url))
+        return httpx.Response(
+            response.status_code,
+            headers=entry['headers'],
+            content=body,
+            request=request,
+            extensions={'http_version': response.extensions.get('http_version', b'HTTP/1.1')}
+        )
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """Transport that serves responses from an archive without touching the network.
+
+    URLs missing from the archive get a 404 response.
+    """
+
+    def __init__(self, archive: ScrapeArchive):
+        self.archive = archive
+        self.hits = 0
+        self.misses = 0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        entry = self.archive.get(str(request.url))
+        if entry is None:
+            self.misses += 1
+            logger.debug(f"No archived response for {request.url}")
+            return httpx.Response(404, request=request)
+
+        self.hits += 1
+        return httpx.Response(
+            entry['status_code'],
+            headers=entry['headers'],
+            content=entry['body'],
+            request=request
+        )
@@ -0,0 +1,37 @@
+"""
+Singleflight
+Coalesces concurrent identical async calls into one in-flight task
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict
+
+class SingleFlight:
+    """Runs at most one call per key at a time; concurrent callers with the same key share its result.
+
+    The call runs in its own task, so a caller that is cancelled or times out does
+    not cancel the work other callers are waiting on.
+    """
+
+    def __init__(self):
+        self._calls: Dict[str, asyncio.Task] = {}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Await fn(), or the in-flight call already running for key"""
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        return await asyncio.shield(task)
+
+    def is_running(self, key: str) -> bool:
+        """Whether a call for key is in flight, so do() would join it"""
+        return key in self._calls
+
+    def _forget(self, key: str, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # Mark the exception retrieved in case every caller was cancelled
+        if not task.cancelled():
+            task.exception()
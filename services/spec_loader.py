@@ -0,0 +1,375 @@
+"""
+Structured API Specification Loader
+Loads an OpenAPI/Swagger document or a Postman collection straight into the
+documentation structure used for CLI generation, without scraping or AI analysis
+"""
+
+import json
+import logging
+import re
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple
+from urllib.parse import urlparse
+
+import httpx
+
+try:
+    import yaml
+    YAML_AVAILABLE = True
+except ImportError:
+    yaml = None
+    YAML_AVAILABLE = False
+
+from config import PRIMARY_DATA_CENTER
+from services.structure_builder import APIStructureBuilder
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_API_BASE_URL = 'https://www.site24x7.com/api/'
+HTTP_METHODS = ('get', 'post', 'put', 'patch', 'delete', 'head', 'options')
+
+class StructuredSpecLoader:
+    """Build the documentation dict from an OpenAPI/Swagger spec or Postman collection"""
+
+    def __init__(self, transport: Optional[httpx.AsyncBaseTransport] = None):
+        self.transport = transport
+
+    async def load(self, source: str) -> Dict[str, Any]:
+        """Load a spec from a local path or URL.
+
+        The result has the same shape as a scraped documentation snapshot plus a
+        ready-made ``cli_structure``, so CLI generation needs no AI analysis.
+        """
+        text = await self._read_source(source)
+        document = self._parse_document(text, source)
+
+        if 'openapi' in document or 'swagger' in document:
+            source_type = 'openapi'
+            base_url, endpoints, tag_descriptions = self._from_openapi(document)
+            info = document.get('info', {})
+        elif 'item' in document and 'info' in document:
+            source_type = 'postman'
+            base_url, endpoints, tag_descriptions = self._from_postman(document)
+            info = document.get('info', {})
+        else:
+            raise ValueError(f"{source} is neither an OpenAPI/Swagger spec nor a Postman collection")
+
+        endpoints.sort(key=lambda e: e['path'])
+        logger.info(f"Loaded {len(endpoints)} endpoints from {source_type} spec {source}")
+
+        return {
+            'base_url': base_url,
+            'version': str(info.get('version', '2.0')),
+            'authentication': {
+                'type': 'OAuth 2.0',
+                'header': 'Authorization: Zoho-oauthtoken [TOKEN]',
+                'content_type': 'application/json;charset=UTF-8',
+                'accept': 'application/json; version=2.0'
+            },
+            'categories': self._build_categories(endpoints, tag_descriptions),
+            'endpoints': endpoints,
+            'http_methods': sorted({method for e in endpoints for method in e['methods']}),
+            'source': {'type': source_type, 'location': source, 'title': info.get('title') or info.get('name')},
+            'cli_structure': APIStructureBuilder().build(endpoints, tag_descriptions),
+            'total_endpoints': len(endpoints)
+        }
+
+    async def _read_source(self, source: str) -> str:
+        """Read the spec text from a URL or a local file"""
+        if urlparse(source).scheme in ('http', 'https'):
+            async with httpx.AsyncClient(timeout=30, follow_redirects=True, transport=self.transport) as client:
+                response = await client.get(source)
+                response.raise_for_status()
+                return response.text
+        return Path(source).expanduser().read_text(encoding='utf-8')
+
+    def _parse_document(self, text: str, source: str) -> Dict[str, Any]:
+        """Parse JSON, or YAML when PyYAML is installed"""
+        try:
+            return json.loads(text)
+        except json.JSONDecodeError:
+            if not YAML_AVAILABLE:
+                raise ValueError(f"{source} is not JSON and PyYAML is not installed to read it as YAML")
+        document = yaml.safe_load(text)
+        if not isinstance(document, dict):
+            raise ValueError(f"{source} does not contain a spec object")
+        return document
+
+    # OpenAPI / Swagger
+
+    def _from_openapi(self, spec: Dict[str, Any]) -> Tuple[str, List[Dict[str, Any]], Dict[str, str]]:
+        """Convert OpenAPI 3 or Swagger 2 paths into endpoints"""
+        if spec.get('servers'):
+            base_url = spec['servers'][0].get('url', DEFAULT_API_BASE_URL)
+        elif spec.get('host'):
+            scheme = (spec.get('schemes') or ['https'])[0]
+            base_url = f"{scheme}://{spec['host']}{spec.get('basePath', '')}"
+        else:
+            base_url = spec.get('basePath') or DEFAULT_API_BASE_URL
+        # Keep paths rooted like scraped ones, e.g. /api/monitors
+        path_prefix = urlparse(base_url).path.rstrip('/')
+
+        tag_descriptions = {tag['name']: tag.get('description', '') for tag in spec.get('tags', []) if 'name' in tag}
+        endpoints = []
+
+        for path, path_item in (spec.get('paths') or {}).items():
+            path_item = self._resolve(spec, path_item)
+            shared_parameters = path_item.get('parameters', [])
+            methods = []
+            summaries = []
+            tags = []
+            parameters: Dict[Tuple[str, str], Dict[str, Any]] = OrderedDict()
+
+            for method in HTTP_METHODS:
+                operation = path_item.get(method)
+                if not operation:
+                    continue
+                methods.append(method.upper())
+                tags.extend(operation.get('tags', []))
+                if operation.get('summary') or operation.get('description'):
+                    summaries.append(operation.get('summary') or operation.get('description'))
+
+                for parameter in shared_parameters + operation.get('parameters', []):
+                    for record in self._openapi_parameter(spec, parameter):
+                        parameters.setdefault((record['location'], record['name']), record)
+
+                request_body = self._resolve(spec, operation.get('requestBody', {}))
+                media = request_body.get('content', {})
+                schema = (media.get('application/json') or next(iter(media.values()), {})).get('schema')
+                for record in self._schema_properties(spec, schema):
+                    parameters.setdefault(('body', record['name']), record)
+
+            if methods:
+                full_path = f"{path_prefix}{path}"
+                endpoints.append(self._endpoint(
+                    full_path, methods, tags[0] if tags else None,
+                    summaries[0] if summaries else None, list(parameters.values())
+                ))
+
+        return base_url, endpoints, tag_descriptions
+
+    def _openapi_parameter(self, spec: Dict[str, Any], parameter: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Convert an OpenAPI/Swagger parameter into parameter records"""
+        parameter = self._resolve(spec, parameter)
+        location = parameter.get('in')
+        if location == 'body':
+            # Swagger 2 request bodies are parameters with a schema
+            return self._schema_properties(spec, parameter.get('schema'))
+        if location not in ('query', 'path', 'formData'):
+            return []
+
+        schema = self._resolve(spec, parameter.get('schema', parameter))
+        return [{
+            'name': parameter.get('name', ''),
+            'type': schema.get('type'),
+            'required': bool(parameter.get('required', location == 'path')),
+            'enum': [str(value) for value in schema.get('enum', [])],
+            'description': parameter.get('description', ''),
+            'location': 'body' if location == 'formData' else location
+        }]
+
+    def _schema_properties(self, spec: Dict[str, Any], schema: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """List the top-level properties of a request body schema as body parameters"""
+        schema = self._resolve(spec, schema or {})
+        for combined in ('allOf', 'oneOf', 'anyOf'):
+            if combined in schema and 'properties' not in schema:
+                merged: Dict[str, Any] = {'properties': {}, 'required': []}
+                for part in schema[combined]:
+                    part = self._resolve(spec, part)
+                    merged['properties'].update(part.get('properties', {}))
+                    merged['required'].extend(part.get('required', []))
+                schema = merged
+
+        required = set(schema.get('required', []))
+        records = []
+        for name, prop in schema.get('properties', {}).items():
+            prop = self._resolve(spec, prop)
+            records.append({
+                'name': name,
+                'type': prop.get('type'),
+                'required': name in required,
+                'enum': [str(value) for value in prop.get('enum', [])],
+                'description': prop.get('description', ''),
+                'location': 'body'
+            })
+        return records
+
+    def _resolve(self, spec: Dict[str, Any], node: Any, depth: int = 0) -> Dict[str, Any]:
+        """Resolve a local JSON reference such as #/components/schemas/Monitor"""
+        while isinstance(node, dict) and '$ref' in node and depth < 20:
+            ref = node['$ref']
+            if not ref.startswith('#/'):
+                logger.debug(f"Skipping external reference {ref}")
+                return {}
+            target: Any = spec
+            for part in ref[2:].split('/'):
+                part = part.replace('~1', '/').replace('~0', '~')
+                target = target.get(part, {}) if isinstance(target, dict) else {}
+            node = target
+            depth += 1
+        return node if isinstance(node, dict) else {}
+
+    # Postman
+
+    def _from_postman(self, collection: Dict[str, Any]) -> Tuple[str, List[Dict[str, Any]], Dict[str, str]]:
+        """Convert Postman collection requests into endpoints, using top-level folders as categories"""
+        variables = {v.get('key'): v.get('value') for v in collection.get('variable', []) if v.get('key')}
+        base_url = variables.get('baseUrl') or variables.get('base_url') or DEFAULT_API_BASE_URL
+        folder_descriptions: Dict[str, str] = {}
+        merged: Dict[str, Dict[str, Any]] = OrderedDict()
+
+        def walk(items: List[Dict[str, Any]], folder: Optional[str]) -> None:
+            for item in items:
+                if 'item' in item:
+                    name = folder or item.get('name')
+                    if folder is None and item.get('name'):
+                        folder_descriptions[item['name']] = self._postman_text(item.get('description'))
+                    walk(item['item'], name)
+                elif isinstance(item.get('request'), dict):
+                    add_request(item, folder)
+
+        def add_request(item: Dict[str, Any], folder: Optional[str]) -> None:
+            request = item['request']
+            path, query = self._postman_url(request.get('url'), variables)
+            if not path:
+                return
+
+            endpoint = merged.get(path)
+            if endpoint is None:
+                endpoint = merged[path] = {'methods': [], 'folder': folder, 'summary': item.get('name'), 'parameters': OrderedDict()}
+            method = request.get('method', 'GET').upper()
+            if method not in endpoint['methods']:
+                endpoint['methods'].append(method)
+
+            for name in re.findall(r'\{([^}]+)\}', path):
+                endpoint['parameters'].setdefault(('path', name), self._parameter(name, 'path', required=True))
+            for entry in query:
+                if entry.get('key') and not entry.get('disabled'):
+                    endpoint['parameters'].setdefault(
+                        ('query', entry['key']),
+                        self._parameter(entry['key'], 'query', description=self._postman_text(entry.get('description')))
+                    )
+            for record in self._postman_body(request.get('body') or {}):
+                endpoint['parameters'].setdefault(('body', record['name']), record)
+
+        walk(collection.get('item', []), None)
+
+        endpoints = [
+            self._endpoint(path, data['methods'], data['folder'], data['summary'], list(data['parameters'].values()))
+            for path, data in merged.items()
+        ]
+        return base_url, endpoints, folder_descriptions
+
+    def _postman_url(self, url: Any, variables: Dict[str, Any]) -> Tuple[str, List[Dict[str, Any]]]:
+        """Get the API path (with {param} placeholders) and query entries of a Postman request URL"""
+        if isinstance(url, dict):
+            segments = url.get('path') or []
+            if isinstance(segments, str):
+                segments = segments.strip('/').split('/')
+            query = url.get('query') or []
+            raw_path = '/' + '/'.join(str(s) for s in segments)
+        elif isinstance(url, str):
+            without_query = url.split('?', 1)[0]
+            # Drop the scheme/host part, which is usually a {{baseUrl}} variable
+            without_host = re.sub(r'^(?:\{\{[^}]+\}\}|[a-z]+://[^/]+)', '', without_query)
+            raw_path = '/' + without_host.lstrip('/')
+            query = []
+        else:
+            return '', []
+
+        base_path = urlparse(str(variables.get('baseUrl') or variables.get('base_url') or DEFAULT_API_BASE_URL)).path.rstrip('/')
+        path = re.sub(r'/:([A-Za-z_][A-Za-z0-9_]*)', r'/{\1}', raw_path)
+        path = re.sub(r'\{\{([^}]+)\}\}', r'{\1}', path)
+        if base_path and not path.startswith(base_path + '/'):
+            path = base_path + path
+        return path.rstrip('/') or '/', query
+
+    def _postman_body(self, body: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """List request body fields of a Postman request"""
+        mode = body.get('mode')
+        if mode in ('urlencoded', 'formdata'):
+            return [
+                self._parameter(entry['key'], 'body', description=self._postman_text(entry.get('description')))
+                for entry in body.get(mode) or [] if entry.get('key') and not entry.get('disabled')
+            ]
+        if mode == 'raw':
+            try:
+                payload = json.loads(body.get('raw') or '')
+            except json.JSONDecodeError:
+                return []
+            if isinstance(payload, dict):
+                return [
+                    self._parameter(name, 'body', value_type=self._json_type(value))
+                    for name, value in payload.items()
+                ]
+        return []
+
+    def _postman_text(self, value: Any) -> str:
+        """Postman descriptions are either strings or {content, type} objects"""
+        if isinstance(value, dict):
+            return value.get('content', '')
+        return value or ''
+
+    def _json_type(self, value: Any) -> str:
+        """JSON schema type name of an example value"""
+        if isinstance(value, bool):
+            return 'boolean'
+        if isinstance(value, int):
+            return 'integer'
+        if isinstance(value, float):
+            return 'number'
+        if isinstance(value, list):
+            return 'array'
+        if isinstance(value, dict):
+            return 'object'
+        return 'string'
+
+    # Shared helpers
+
+    def _parameter(self, name: str, location: str, required: bool = False,
+                   value_type: Optional[str] = None, description: str = '') -> Dict[str, Any]:
+        """Build a parameter record"""
+        return {
+            'name': name,
+            'type': value_type,
+            'required': required,
+            'enum': [],
+            'description': description,
+            'location': location
+        }
+
+    def _endpoint(self, path: str, methods: List[str], category: Optional[str],
+                  summary: Optional[str], parameter_details: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Build an endpoint record shaped like the scraper's detailed endpoints"""
+        parameters = {'query': [], 'path': [], 'body': []}
+        for parameter in parameter_details:
+            if parameter['location'] in parameters:
+                parameters[parameter['location']].append(parameter['name'])
+
+        name = APIStructureBuilder.resource_segment(path).replace('_', ' ').title() or path
+        return {
+            'path': path,
+            'methods': sorted(set(methods)),
+            'category': category or 'General API',
+            'name': name,
+            'description': summary or f"Perform {name} operations",
+            'parameters': parameters,
+            'parameter_details': parameter_details,
+            'doc_urls': [],
+            'regions': [PRIMARY_DATA_CENTER],
+            'auth_required': True,
+            'rate_limited': True
+        }
+
+    def _build_categories(self, endpoints: List[Dict[str, Any]], descriptions: Dict[str, str]) -> List[Dict[str, Any]]:
+        """Table of contents grouped by category"""
+        categories: Dict[str, Dict[str, Any]] = OrderedDict()
+        for endpoint in endpoints:
+            category = categories.setdefault(endpoint['category'], {
+                'name': endpoint['category'],
+                'description': descriptions.get(endpoint['category'], ''),
+                'subcategories': []
+            })
+            category['subcategories'].append({'name': endpoint['name'], 'endpoint': endpoint['path']})
+        return list(categories.values())
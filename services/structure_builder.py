@@ -0,0 +1,105 @@
+"""
+API Structure Builder
+Derives the CLI command structure from documented endpoints with deterministic rules
+"""
+
+import re
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
+
+CRUD_OPERATIONS = {'POST': 'create', 'PUT': 'update', 'PATCH': 'update', 'DELETE': 'delete'}
+
+COMMAND_PATTERNS = {
+    'list': 'site24x7 <category> <resource> list',
+    'get': 'site24x7 <category> <resource> get <id>',
+    'create': 'site24x7 <category> <resource> create [options]',
+    'update': 'site24x7 <category> <resource> update <id> [options]',
+    'delete': 'site24x7 <category> <resource> delete <id>'
+}
+
+PAGINATION_PARAMETERS = {'page', 'limit', 'per_page', 'offset', 'start', 'count'}
+
+class APIStructureBuilder:
+    """Builds the categories/subcategories/operations structure CLIGenerator consumes.
+
+    Endpoints are grouped by category and then by resource collection (the path
+    without trailing {parameter} segments). Operations follow from each
+    endpoint's methods and whether it addresses the collection or one item.
+    Runs in a single pass over the endpoints.
+    """
+
+    def build(self, endpoints: List[Dict[str, Any]], descriptions: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """Build the analyzed structure for a list of endpoints"""
+        descriptions = descriptions or {}
+        categories: Dict[str, Dict[str, Any]] = OrderedDict()
+        resources: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        names: Dict[str, set] = {}
+        # Query parameters in first-seen order
+        parameters: Dict[str, None] = OrderedDict()
+
+        for endpoint in endpoints:
+            category_name = endpoint.get('category') or 'General API'
+            collection = self.collection_path(endpoint['path'])
+            key = (category_name, collection)
+            resource = resources.get(key)
+            if resource is None:
+                category = categories.get(category_name)
+                if category is None:
+                    category = categories[category_name] = {
+                        'name': category_name,
+                        'description': descriptions.get(category_name) or f"Manage {category_name}",
+                        'subcategories': []
+                    }
+                    names[category_name] = set()
+                name = self._resource_name(collection, names[category_name]) or endpoint.get('name') or collection
+                names[category_name].add(name.lower())
+                resource = resources[key] = {
+                    'name': name,
+                    'description': f"Manage {name}",
+                    'endpoint': collection,
+                    'operations': [],
+                    'cli_commands': [re.sub(r'[^a-z0-9]+', '-', name.lower()).strip('-') or 'root']
+                }
+                category['subcategories'].append(resource)
+
+            is_item = endpoint['path'] != collection
+            if is_item and 'item_endpoint' not in resource:
+                resource['item_endpoint'] = endpoint['path']
+            for method in endpoint.get('methods') or ['GET']:
+                operation = ('read' if is_item else 'list') if method == 'GET' else CRUD_OPERATIONS.get(method)
+                if operation and operation not in resource['operations']:
+                    resource['operations'].append(operation)
+            for parameter in (endpoint.get('parameters') or {}).get('query', []):
+                parameters.setdefault(parameter, None)
+
+        return {
+            'categories': list(categories.values()),
+            'common_parameters': {
+                'authentication': ['oauth_token'],
+                'pagination': [p for p in parameters if p in PAGINATION_PARAMETERS]
+            },
+            'command_patterns': dict(COMMAND_PATTERNS)
+        }
+
+    @staticmethod
+    def collection_path(path: str) -> str:
+        """Path of the resource collection an endpoint belongs to, e.g. /api/monitors/{id} -> /api/monitors"""
+        while re.search(r'/\{[^}]+\}$', path):
+            path = re.sub(r'/\{[^}]+\}$', '', path)
+        return path
+
+    @staticmethod
+    def resource_segment(path: str) -> str:
+        """Last path segment that is not a {parameter}"""
+        segments = [s for s in path.strip('/').split('/') if s and not s.startswith('{')]
+        return segments[-1] if segments else ''
+
+    def _resource_name(self, collection: str, taken: set) -> str:
+        """Title-cased name of a collection, qualified by its parent segments if the plain name is taken"""
+        segments = [s for s in collection.strip('/').split('/') if s and not s.startswith('{') and s != 'api']
+        name = ''
+        for depth in range(1, len(segments) + 1):
+            name = ' '.join(segments[-depth:]).replace('_', ' ').replace('-', ' ').title()
+            if name.lower() not in taken:
+                break
+        return name
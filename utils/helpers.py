@@ -8,7 +8,7 @@ import json
 import re
 import os
 import logging
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Union
 from datetime import datetime, timezone
 from pathlib import Path
 import difflib
@@ -24,6 +24,34 @@ def generate_content_hash(content: str) -> str:
     return hashlib.md5(content.encode('utf-8')).hexdigest()
 
 
+def canonical_json(obj: Any, exclude_keys: Optional[Iterable[str]] = None) -> str:
+    """Serialize object to compact JSON with sorted keys, dropping excluded keys at any depth"""
+    excluded = frozenset(exclude_keys or ())
+    
+    def strip(value: Any) -> Any:
+        if isinstance(value, dict):
+            return {k: strip(v) for k, v in value.items() if k not in excluded}
+        if isinstance(value, (list, tuple)):
+            return [strip(v) for v in value]
+        return value
+    
+    return json.dumps(
+        strip(obj) if excluded else obj,
+        sort_keys=True,
+        separators=(',', ':'),
+        ensure_ascii=False,
+        default=str
+    )
+
+
+def generate_canonical_hash(obj: Any, exclude_keys: Optional[Iterable[str]] = None) -> str:
+    """Generate BLAKE2b hash of the canonical JSON form of an object"""
+    return hashlib.blake2b(
+        canonical_json(obj, exclude_keys).encode('utf-8'),
+        digest_size=16
+    ).hexdigest()
+
+
 def sanitize_filename(filename: str) -> str:
     """Sanitize filename for safe file operations"""
     # Remove or replace invalid characters